@@ -14,8 +14,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-from typing import List, Optional
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
 
 from llama_index.core.llms import ChatMessage
 from llama_index.core.storage.chat_store.base import BaseChatStore
@@ -24,6 +28,13 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .engine import AlloyDBEngine
 
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_FLUSH_MAX_MESSAGES = 100
+# Number of times a failed background flush is retried, each after twice the delay
+FLUSH_MAX_RETRIES = 5
+
+logger = logging.getLogger(__name__)
+
 
 class AsyncAlloyDBChatStore(BaseChatStore):
     """Chat Store Table stored in an AlloyDB for PostgreSQL database."""
@@ -36,6 +47,10 @@ class AsyncAlloyDBChatStore(BaseChatStore):
         engine: AsyncEngine,
         table_name: str,
         schema_name: str = "public",
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_max_messages: int = DEFAULT_FLUSH_MAX_MESSAGES,
+        read_engine: Optional[AsyncEngine] = None,
     ):
         """AsyncAlloyDBChatStore constructor.
 
@@ -45,6 +60,10 @@ class AsyncAlloyDBChatStore(BaseChatStore):
             table_name (str): Table name that stores the chat store.
             schema_name (str): The schema name where the table is located.
                 Defaults to "public"
+            write_behind (bool): Whether added messages are buffered in memory and written in batches. Defaults to False.
+            flush_interval (float): Seconds after a buffered message is added before the buffer is flushed. Defaults to 1.0.
+            flush_max_messages (int): Number of buffered messages that triggers an immediate flush. Defaults to 100.
+            read_engine (Optional[AsyncEngine]): Database connection pool for reads. Defaults to `engine`, which is always used in write-behind mode.
 
         Raises:
             Exception: If constructor is directly called by the user.
@@ -55,8 +74,17 @@ class AsyncAlloyDBChatStore(BaseChatStore):
         # Delegate to Pydantic's __init__
         super().__init__()
         self._engine = engine
+        # Reads right after a flush must see it, so write-behind reads the writer
+        self._read_engine = engine if write_behind else (read_engine or engine)
         self._table_name = table_name
         self._schema_name = schema_name
+        self._write_behind = write_behind
+        self._flush_interval = flush_interval
+        self._flush_max_messages = flush_max_messages
+        self._buffer: dict[str, list[ChatMessage]] = {}
+        self._buffered = 0
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
 
     @classmethod
     async def create(
@@ -64,6 +92,9 @@ class AsyncAlloyDBChatStore(BaseChatStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_max_messages: int = DEFAULT_FLUSH_MAX_MESSAGES,
     ) -> AsyncAlloyDBChatStore:
         """Create a new AsyncAlloyDBChatStore instance.
 
@@ -72,13 +103,26 @@ class AsyncAlloyDBChatStore(BaseChatStore):
             table_name (str): Table name that stores the chat store.
             schema_name (str): The schema name where the table is located.
                 Defaults to "public"
+            write_behind (bool): Whether added messages are buffered in memory and written in batches. The buffer is flushed on `aclose` and when the engine is closed, and before messages are read. Reads then run on the engine's writer rather than its read replicas. Defaults to False.
+            flush_interval (float): Seconds after a buffered message is added before the buffer is flushed. Defaults to 1.0.
+            flush_max_messages (int): Number of buffered messages that triggers an immediate flush. Defaults to 100.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
+            ValueError: If `flush_interval` is not positive or `flush_max_messages` is less than 1.
+            ValueError: If `write_behind` is set and the engine runs several background loops.
 
         Returns:
             AsyncAlloyDBChatStore: A newly created instance of AsyncAlloyDBChatStore.
         """
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive.")
+        if flush_max_messages < 1:
+            raise ValueError("flush_max_messages must be at least 1.")
+        if write_behind and len(engine._loops) > 1:
+            raise ValueError(
+                "write_behind requires an engine running a single background loop."
+            )
         table_schema = await engine._aload_table_schema(table_name, schema_name)
         column_names = table_schema.columns.keys()
 
@@ -97,21 +141,136 @@ class AsyncAlloyDBChatStore(BaseChatStore):
                 ");"
             )
 
-        return cls(cls.__create_key, engine._pool, table_name, schema_name)
+        chat_store = cls(
+            cls.__create_key,
+            engine._pool,
+            table_name,
+            schema_name,
+            write_behind,
+            flush_interval,
+            flush_max_messages,
+            engine._read_pool,
+        )
+        if write_behind:
+            engine._register_shutdown_hook(chat_store.aclose)
+        return chat_store
 
     async def __aexecute_query(self, query, params=None):
         async with self._engine.connect() as conn:
             await conn.execute(text(query), params)
             await conn.commit()
 
-    async def __afetch_query(self, query):
+    async def __afetch_query(self, query, params=None):
         async with self._engine.connect() as conn:
-            result = await conn.execute(text(query))
+            result = await conn.execute(text(query), params)
             result_map = result.mappings()
             results = result_map.fetchall()
             await conn.commit()
         return results
 
+    async def __aread_query(self, query, params=None):
+        async with self._read_engine.connect() as conn:
+            result = await conn.execute(text(query), params)
+            result_map = result.mappings()
+            results = result_map.fetchall()
+        return results
+
+    @asynccontextmanager
+    async def __alocked(self) -> AsyncIterator[None]:
+        """Holds the flush lock in write-behind mode, so no flush lands meanwhile."""
+        if not self._write_behind:
+            yield
+            return
+        async with self._flush_lock:
+            yield
+
+    async def __aflush_buffer(self) -> None:
+        """Writes the buffered messages with one INSERT. The flush lock must be held."""
+        if not self._buffer:
+            return
+        pending, self._buffer = self._buffer, {}
+        self._buffered = 0
+        keys = []
+        messages = []
+        for key, buffered in pending.items():
+            for message in buffered:
+                keys.append(key)
+                messages.append(json.dumps(message.model_dump()))
+        insert_query = f"""INSERT INTO "{self._schema_name}"."{self._table_name}" (key, message)
+            SELECT key, CAST(message AS JSON)
+            FROM unnest(CAST(:keys AS VARCHAR[]), CAST(:messages AS TEXT[])) WITH ORDINALITY AS t(key, message, position)
+            ORDER BY position;"""
+        try:
+            await self.__aexecute_query(
+                insert_query, {"keys": keys, "messages": messages}
+            )
+        except BaseException:
+            # Keep the messages, ahead of any added meanwhile, for the next flush
+            for key, buffered in pending.items():
+                self._buffer[key] = buffered + self._buffer.get(key, [])
+            self._buffered += len(keys)
+            raise
+
+    async def __aflush_later(self) -> None:
+        """Flushes the buffer every `flush_interval` seconds until it is empty.
+
+        A failed flush is logged and retried after twice the previous delay,
+        up to `FLUSH_MAX_RETRIES` times, after which the timer stops until a
+        message is added. The messages stay buffered meanwhile, and the next
+        `aflush` or `aclose` raises if they still cannot be written.
+        """
+        delay = self._flush_interval
+        failures = 0
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                # Shielded so that cancelling the timer never interrupts a write
+                await asyncio.shield(self.aflush())
+            except Exception:
+                failures += 1
+                if failures > FLUSH_MAX_RETRIES:
+                    logger.exception(
+                        "Giving up flushing %d buffered chat messages after %d attempts.",
+                        self._buffered,
+                        failures,
+                    )
+                    return
+                logger.warning(
+                    "Flushing %d buffered chat messages failed, retrying in %.1f seconds.",
+                    self._buffered,
+                    delay * 2,
+                    exc_info=True,
+                )
+                delay *= 2
+                continue
+            if not self._buffer:
+                return
+            delay = self._flush_interval
+            failures = 0
+
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aflush(self) -> None:
+        """Asynchronously writes the messages buffered in write-behind mode.
+
+        Raises:
+            Exception: If the buffered messages cannot be written. They stay buffered.
+        """
+        async with self._flush_lock:
+            await self.__aflush_buffer()
+
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aclose(self) -> None:
+        """Asynchronously stops the write-behind timer and flushes the buffered messages.
+
+        Raises:
+            Exception: If the buffered messages cannot be written.
+        """
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.aflush()
+
     @classmethod
     def class_name(cls) -> str:
         """Get class name."""
@@ -120,6 +279,10 @@ class AsyncAlloyDBChatStore(BaseChatStore):
     async def aset_messages(self, key: str, messages: List[ChatMessage]) -> None:
         """Asynchronously sets the chat messages for a specific key.
 
+        When the stored history is a prefix of `messages`, only the new
+        messages are inserted. Otherwise the history is replaced in a single
+        transaction.
+
         Args:
             key (str): A unique identifier for the chat.
             messages (List[ChatMessage]): A list of `ChatMessage` objects to upsert.
@@ -128,39 +291,164 @@ class AsyncAlloyDBChatStore(BaseChatStore):
             None
 
         """
-        query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE key = '{key}'; """
-        await self.__aexecute_query(query)
-        insert_query = f"""
-                INSERT INTO "{self._schema_name}"."{self._table_name}" (key, message)
-                VALUES (:key, :message);"""
-
-        params = [
-            {
-                "key": key,
-                "message": json.dumps(message.model_dump()),
-            }
-            for message in messages
-        ]
-
-        await self.__aexecute_query(insert_query, params)
+        async with self.__alocked():
+            # The new history supersedes messages that are still buffered
+            self._buffered -= len(self._buffer.pop(key, []))
+            await self.__aset_messages(key, messages)
+
+    async def __aset_messages(self, key: str, messages: List[ChatMessage]) -> None:
+        """Writes the history of a key, appending to it when it is a stored prefix."""
+        serialized = [json.dumps(message.model_dump()) for message in messages]
+        table = f'"{self._schema_name}"."{self._table_name}"'
+        async with self._engine.connect() as conn:
+            # Serialize concurrent writers of the same key until commit
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key));"), {"key": key}
+            )
+            # The JSON column keeps the inserted text verbatim, so the stored
+            # history is an unchanged prefix if it hashes like ours does.
+            result = await conn.execute(
+                text(
+                    f"""SELECT count(*) AS count,
+                    md5(COALESCE(string_agg(message::text, E'\\n' ORDER BY id), '')) AS digest
+                    FROM {table} WHERE key = :key;"""
+                ),
+                {"key": key},
+            )
+            stored = result.mappings().fetchone()
+            count = stored["count"] if stored else 0
+            is_prefix = (
+                stored is not None
+                and count <= len(serialized)
+                and stored["digest"]
+                == hashlib.md5("\n".join(serialized[:count]).encode()).hexdigest()
+            )
+            if is_prefix:
+                new_messages = serialized[count:]
+            else:
+                await conn.execute(
+                    text(f"DELETE FROM {table} WHERE key = :key;"), {"key": key}
+                )
+                new_messages = serialized
+            if new_messages:
+                insert_query = f"""INSERT INTO {table} (key, message)
+                    SELECT CAST(:key AS VARCHAR), CAST(message AS JSON)
+                    FROM unnest(CAST(:messages AS TEXT[])) WITH ORDINALITY AS t(message, position)
+                    ORDER BY position;"""
+                await conn.execute(
+                    text(insert_query), {"key": key, "messages": new_messages}
+                )
+            await conn.commit()
 
-    async def aget_messages(self, key: str) -> List[ChatMessage]:
+    async def aget_messages(
+        self,
+        key: str,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[ChatMessage]:
         """Asynchronously retrieves the chat messages associated with a specific key.
 
         Args:
             key (str): A unique identifier for which the messages are to be retrieved.
+            limit (Optional[int]): Maximum number of messages to retrieve. Defaults to None, for all messages.
+            before_id (Optional[int]): Only retrieve messages with an id lower than this one. With `limit`, the messages right before it are retrieved. Defaults to None.
+            after_id (Optional[int]): Only retrieve messages with an id greater than this one. Defaults to None.
 
         Returns:
             List[ChatMessage]: A list of `ChatMessage` objects associated with the provided key.
             If no messages are found, an empty list is returned.
         """
-        query = f"""SELECT message from "{self._schema_name}"."{self._table_name}" WHERE key = '{key}' ORDER BY id;"""
-        results = await self.__afetch_query(query)
-        if results:
-            return [
-                ChatMessage.model_validate(result.get("message")) for result in results
-            ]
-        return []
+        rows = await self.aget_messages_with_ids(key, limit, before_id, after_id)
+        return [message for _, message in rows]
+
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aget_messages_with_ids(
+        self,
+        key: str,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[tuple[int, ChatMessage]]:
+        """Asynchronously retrieves the chat messages of a key along with their row ids.
+
+        The ids can be passed back as `before_id` or `after_id` to page through
+        long histories.
+
+        Args:
+            key (str): A unique identifier for which the messages are to be retrieved.
+            limit (Optional[int]): Maximum number of messages to retrieve. Defaults to None, for all messages.
+            before_id (Optional[int]): Only retrieve messages with an id lower than this one. With `limit`, the messages right before it are retrieved. Defaults to None.
+            after_id (Optional[int]): Only retrieve messages with an id greater than this one. Defaults to None.
+
+        Raises:
+            ValueError: If `limit` is negative.
+
+        Returns:
+            List[tuple[int, ChatMessage]]: The (id, message) pairs in chronological order.
+        """
+        # Paging backwards from before_id reads the newest rows first
+        from_end = before_id is not None and after_id is None
+        async with self.__alocked():
+            # Buffered messages get their ids once written
+            await self.__aflush_buffer()
+            return await self.__aget_message_rows(
+                key, limit, before_id, after_id, from_end
+            )
+
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aget_last_messages(self, key: str, n: int) -> List[ChatMessage]:
+        """Asynchronously retrieves the last `n` chat messages of a specific key.
+
+        Args:
+            key (str): A unique identifier for which the messages are to be retrieved.
+            n (int): Number of messages to retrieve.
+
+        Raises:
+            ValueError: If `n` is negative.
+
+        Returns:
+            List[ChatMessage]: The last `n` messages in chronological order.
+        """
+        async with self.__alocked():
+            await self.__aflush_buffer()
+            rows = await self.__aget_message_rows(key, n, None, None, from_end=True)
+        return [message for _, message in rows]
+
+    async def __aget_message_rows(
+        self,
+        key: str,
+        limit: Optional[int],
+        before_id: Optional[int],
+        after_id: Optional[int],
+        from_end: bool,
+    ) -> List[tuple[int, ChatMessage]]:
+        """Keyset query over a key's messages, optionally reading from the newest."""
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative.")
+        conditions = ["key = :key"]
+        params: dict[str, Any] = {"key": key}
+        if before_id is not None:
+            conditions.append("id < :before_id")
+            params["before_id"] = before_id
+        if after_id is not None:
+            conditions.append("id > :after_id")
+            params["after_id"] = after_id
+        limit_stmt = ""
+        if limit is not None:
+            limit_stmt = "LIMIT :limit"
+            params["limit"] = limit
+        order = "DESC" if from_end else "ASC"
+
+        query = f"""SELECT id, message from "{self._schema_name}"."{self._table_name}" WHERE {" AND ".join(conditions)} ORDER BY id {order} {limit_stmt};"""
+        results = await self.__aread_query(query, params)
+        rows = [
+            (result["id"], ChatMessage.model_validate(result["message"]))
+            for result in results
+        ]
+        if from_end:
+            rows.reverse()
+        return rows
 
     async def async_add_message(self, key: str, message: ChatMessage) -> None:
         """Asynchronously adds a new chat message to the specified key.
@@ -172,6 +460,17 @@ class AsyncAlloyDBChatStore(BaseChatStore):
         Returns:
             None
         """
+        if self._write_behind:
+            self._buffer.setdefault(key, []).append(message)
+            self._buffered += 1
+            if self._buffered >= self._flush_max_messages:
+                await self.aflush()
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.get_running_loop().create_task(
+                    self.__aflush_later()
+                )
+            return
+
         insert_query = f"""
                 INSERT INTO "{self._schema_name}"."{self._table_name}" (key, message)
                 VALUES (:key, :message);"""
@@ -189,12 +488,16 @@ class AsyncAlloyDBChatStore(BaseChatStore):
             Optional[List[ChatMessage]]: A list of `ChatMessage` objects that were deleted, or `None` if no messages
             were associated with the key or could be deleted.
         """
-        query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE key = '{key}' RETURNING *; """
-        results = await self.__afetch_query(query)
-        if results:
-            return [
-                ChatMessage.model_validate(result.get("message")) for result in results
-            ]
+        query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE key = :key RETURNING *; """
+        async with self.__alocked():
+            buffered = self._buffer.pop(key, [])
+            self._buffered -= len(buffered)
+            results = await self.__afetch_query(query, {"key": key})
+        messages = [
+            ChatMessage.model_validate(result.get("message")) for result in results
+        ] + buffered
+        if messages:
+            return messages
         return None
 
     async def adelete_message(self, key: str, idx: int) -> Optional[ChatMessage]:
@@ -208,19 +511,10 @@ class AsyncAlloyDBChatStore(BaseChatStore):
             Optional[ChatMessage]: The `ChatMessage` object that was deleted, or `None` if no message
             was associated with the key or could be deleted.
         """
-        query = f"""SELECT * from "{self._schema_name}"."{self._table_name}" WHERE key = '{key}' ORDER BY id;"""
-        results = await self.__afetch_query(query)
-        if results:
-            if idx >= len(results):
-                return None
-            id_to_be_deleted = results[idx].get("id")
-            delete_query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE id = '{id_to_be_deleted}' RETURNING *;"""
-            result = await self.__afetch_query(delete_query)
-            result = result[0]
-            if result:
-                return ChatMessage.model_validate(result.get("message"))
-            return None
-        return None
+        # Negative indexes count from the end, like list indexing
+        order = "ASC" if idx >= 0 else "DESC"
+        offset = idx if idx >= 0 else -idx - 1
+        return await self.__adelete_nth_message(key, order, offset)
 
     async def adelete_last_message(self, key: str) -> Optional[ChatMessage]:
         """Asynchronously deletes the last chat message associated with a given key.
@@ -232,16 +526,25 @@ class AsyncAlloyDBChatStore(BaseChatStore):
             Optional[ChatMessage]: The `ChatMessage` object that was deleted, or `None` if no message
             was associated with the key or could be deleted.
         """
-        query = f"""SELECT * from "{self._schema_name}"."{self._table_name}" WHERE key = '{key}' ORDER BY id DESC LIMIT 1;"""
-        results = await self.__afetch_query(query)
+        return await self.__adelete_nth_message(key, "DESC", 0)
+
+    async def __adelete_nth_message(
+        self, key: str, order: str, offset: int
+    ) -> Optional[ChatMessage]:
+        """Deletes the message at `offset` in id `order` in a single statement."""
+        query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}"
+            WHERE id = (
+                SELECT id FROM "{self._schema_name}"."{self._table_name}"
+                WHERE key = :key ORDER BY id {order} OFFSET :offset LIMIT 1
+            )
+            RETURNING message;"""
+        async with self.__alocked():
+            await self.__aflush_buffer()
+            results = await self.__afetch_query(
+                query, {"key": key, "offset": offset}
+            )
         if results:
-            id_to_be_deleted = results[0].get("id")
-            delete_query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE id = '{id_to_be_deleted}' RETURNING *;"""
-            result = await self.__afetch_query(delete_query)
-            result = result[0]
-            if result:
-                return ChatMessage.model_validate(result.get("message"))
-            return None
+            return ChatMessage.model_validate(results[0].get("message"))
         return None
 
     async def aget_keys(self) -> List[str]:
@@ -253,10 +556,13 @@ class AsyncAlloyDBChatStore(BaseChatStore):
         query = (
             f"""SELECT distinct key from "{self._schema_name}"."{self._table_name}";"""
         )
-        results = await self.__afetch_query(query)
-        keys = []
-        if results:
-            keys = [row.get("key") for row in results]
+        async with self.__alocked():
+            results = await self.__aread_query(query)
+            keys = []
+            if results:
+                keys = [row.get("key") for row in results]
+            stored = set(keys)
+            keys += [key for key in self._buffer if key not in stored]
         return keys
 
     def set_messages(self, key: str, messages: List[ChatMessage]) -> None:
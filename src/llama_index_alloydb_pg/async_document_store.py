@@ -14,9 +14,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import warnings
-from typing import Optional, Sequence
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterable, Optional, Sequence
 
 from llama_index.core.constants import DATA_KEY
 from llama_index.core.schema import BaseNode
@@ -29,6 +33,111 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .engine import AlloyDBEngine
 
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 1
+DEFAULT_PAGE_SIZE = 1000
+
+
+@dataclass
+class DocumentCacheStats:
+    """Counters of the document store's node cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class _NodeCache:
+    """Thread-safe LRU cache of deserialized nodes, bounded by entries and bytes.
+
+    Nodes are copied in and out of the cache, so callers may modify the nodes
+    they get without affecting later reads.
+
+    Every invalidation bumps a generation counter. A read that missed records
+    the generation before querying the table and only fills the cache if no
+    write invalidated it meanwhile, so stale rows are never cached.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[BaseNode, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, doc_id: str) -> Optional[BaseNode]:
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(doc_id)
+            self._hits += 1
+        return entry[0].model_copy(deep=True)
+
+    def put(self, doc_id: str, node: BaseNode, size: int, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._max_bytes is not None and size > self._max_bytes:
+                return
+            self.__pop(doc_id)
+            self._entries[doc_id] = (node.model_copy(deep=True), size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._bytes > self._max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, doc_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._generation += 1
+            for doc_id in doc_ids:
+                self.__pop(doc_id)
+
+    def invalidate_ref_doc(self, ref_doc_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for doc_id in [
+                doc_id
+                for doc_id, (node, _) in self._entries.items()
+                if node.ref_doc_id == ref_doc_id
+            ]:
+                self.__pop(doc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> DocumentCacheStats:
+        with self._lock:
+            return DocumentCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __pop(self, doc_id: str) -> None:
+        entry = self._entries.pop(doc_id, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
 
 class AsyncAlloyDBDocumentStore(BaseDocumentStore):
     """Document Store Table stored in an AlloyDB for PostgreSQL database."""
@@ -41,7 +150,12 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         engine: AsyncEngine,
         table_name: str,
         schema_name: str = "public",
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_max_entries: int = 0,
+        cache_max_bytes: Optional[int] = None,
+        read_engine: Optional[AsyncEngine] = None,
     ):
         """AsyncAlloyDBDocumentStore constructor.
 
@@ -50,7 +164,12 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
             engine (AlloyDBEngine): Database connection pool.
             table_name (str): Table name that stores the documents.
             schema_name (str): The schema name where the table is located. Defaults to "public"
-            batch_size (int): The default batch size for bulk inserts. Defaults to 1.
+            batch_size (Optional[int]): The default number of rows per bulk insert. Defaults to None, which sizes batches by `max_batch_bytes`.
+            max_batch_bytes (int): Approximate payload size of a bulk insert when `batch_size` is not set. Defaults to 4 MiB.
+            max_concurrency (int): Maximum number of batches written at the same time, each on its own connection. With 1, the batches of an add are written in one transaction, so it is all-or-nothing. With more, each batch is committed as soon as it is written, so a failed add can leave some of its documents written. Defaults to 1.
+            cache_max_entries (int): Maximum number of deserialized nodes kept in the in-process LRU cache. Defaults to 0, which disables the cache.
+            cache_max_bytes (Optional[int]): Maximum total size of the cached nodes' JSON data. Defaults to None, for no limit.
+            read_engine (Optional[AsyncEngine]): Database connection pool for reads. Defaults to `engine`.
 
         Raises:
             Exception: If constructor is directly called by the user.
@@ -58,9 +177,17 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         if key != AsyncAlloyDBDocumentStore.__create_key:
             raise Exception("Only create class through 'create' method!")
         self._engine = engine
+        self._read_engine = read_engine or engine
         self._table_name = table_name
         self._schema_name = schema_name
         self._batch_size = batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._max_concurrency = max_concurrency
+        self._cache = (
+            _NodeCache(cache_max_entries, cache_max_bytes)
+            if cache_max_entries > 0
+            else None
+        )
 
     @classmethod
     async def create(
@@ -68,7 +195,11 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_max_entries: int = 0,
+        cache_max_bytes: Optional[int] = None,
     ) -> AsyncAlloyDBDocumentStore:
         """Create a new AsyncAlloyDBDocumentStore instance.
 
@@ -76,14 +207,22 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the documents.
             schema_name (str): The schema name where the table is located. Defaults to "public"
-            batch_size (int): The default batch size for bulk inserts. Defaults to 1.
+            batch_size (Optional[int]): The default number of rows per bulk insert. Defaults to None, which sizes batches by `max_batch_bytes`.
+            max_batch_bytes (int): Approximate payload size of a bulk insert when `batch_size` is not set. Defaults to 4 MiB.
+            max_concurrency (int): Maximum number of batches written at the same time, each on its own connection. With 1, the batches of an add are written in one transaction, so it is all-or-nothing. With more, each batch is committed as soon as it is written, so a failed add can leave some of its documents written. Defaults to 1.
+            cache_max_entries (int): Maximum number of deserialized nodes kept in the in-process LRU cache used by `aget_document` and `aget_documents`. Defaults to 0, which disables the cache.
+            cache_max_bytes (Optional[int]): Maximum total size of the cached nodes' JSON data. Defaults to None, for no limit.
 
         Raises:
-            ValueError: If the table provided does not contain required schema.
+            ValueError: If the table provided does not contain required schema, or if `max_batch_bytes` or `max_concurrency` is less than 1.
 
         Returns:
             AsyncAlloyDBDocumentStore: A newly created instance of AsyncAlloyDBDocumentStore.
         """
+        if max_batch_bytes < 1:
+            raise ValueError("max_batch_bytes must be greater than 0.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0.")
         table_schema = await engine._aload_table_schema(table_name, schema_name)
         column_names = table_schema.columns.keys()
 
@@ -102,7 +241,28 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
                 ");"
             )
 
-        return cls(cls.__create_key, engine._pool, table_name, schema_name, batch_size)
+        return cls(
+            cls.__create_key,
+            engine._pool,
+            table_name,
+            schema_name,
+            batch_size,
+            max_batch_bytes,
+            max_concurrency,
+            cache_max_entries,
+            cache_max_bytes,
+            engine._read_pool,
+        )
+
+    @property
+    def cache_stats(self) -> Optional[DocumentCacheStats]:
+        """Hit, miss and eviction counters of the node cache, or None if it is disabled."""
+        return self._cache.stats() if self._cache else None
+
+    def clear_cache(self) -> None:
+        """Remove every node from the node cache."""
+        if self._cache:
+            self._cache.clear()
 
     async def __aexecute_query(self, query, params):
         async with self._engine.connect() as conn:
@@ -110,44 +270,59 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
             await conn.commit()
         return None
 
-    async def __afetch_query(self, query):
+    async def __afetch_query(self, query, params=None):
         async with self._engine.connect() as conn:
-            result = await conn.execute(text(query))
+            result = await conn.execute(text(query), params)
             result_map = result.mappings()
             results = result_map.fetchall()
             await conn.commit()
         return results
 
+    async def __aread_query(self, query, params=None):
+        async with self._read_engine.connect() as conn:
+            result = await conn.execute(text(query), params)
+            result_map = result.mappings()
+            results = result_map.fetchall()
+        return results
+
     async def _put_all_doc_hashes_to_table(
-        self, rows: list[tuple[str, str]], batch_size: int = int(DEFAULT_BATCH_SIZE)
+        self, rows: list[tuple[str, str]], batch_size: Optional[int] = None
     ) -> None:
         """Puts a multiple rows of node ids with their doc_hash into the document table.
         Incase a row with the id already exists, it updates the row with the new doc_hash.
 
         Args:
             rows (list[tuple[str, str]]): List of tuples of id and doc_hash
-            batch_size (int): batch_size to insert the rows. Defaults to 1.
+            batch_size (Optional[int]): batch_size to insert the rows. Defaults to None, which upserts all rows with one statement.
 
         Returns:
             None
         """
-        if batch_size < 1:
+        if batch_size is not None and batch_size < 1:
             batch_size = 1
             warnings.warn("Provided batch size less than 1. Defaulting to 1.")
 
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i : i + batch_size]
-            params = [{"id": id, "doc_hash": doc_hash} for id, doc_hash in batch]
-
-            # Insert statement
-            stmt = f"""
-              INSERT INTO "{self._schema_name}"."{self._table_name}" (id, doc_hash)
-              VALUES (:id, :doc_hash)
-              ON CONFLICT (id)
-              DO UPDATE SET
-              doc_hash = EXCLUDED.doc_hash;
-              """
-
+        # A single upsert can not update the same row twice, so keep the last
+        # hash given for each id.
+        doc_hashes = dict(rows)
+        ids = list(doc_hashes)
+        batch_size = batch_size or len(ids)
+
+        # Insert statement
+        stmt = f"""
+          INSERT INTO "{self._schema_name}"."{self._table_name}" (id, doc_hash)
+          SELECT * FROM unnest(CAST(:ids AS VARCHAR[]), CAST(:doc_hashes AS VARCHAR[]))
+          ON CONFLICT (id)
+          DO UPDATE SET
+          doc_hash = EXCLUDED.doc_hash;
+          """
+
+        for i in range(0, len(ids), batch_size):
+            batch = ids[i : i + batch_size]
+            params = {
+                "ids": batch,
+                "doc_hashes": [doc_hashes[id] for id in batch],
+            }
             await self.__aexecute_query(stmt, params)
 
     async def _delete_from_table(self, id: str) -> Sequence[RowMapping]:
@@ -161,42 +336,57 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         """
         query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE id = '{id}' RETURNING *; """
         result = await self.__afetch_query(query)
+        if self._cache:
+            self._cache.invalidate([id])
         return result
 
     async def async_add_documents(
         self,
         docs: Sequence[BaseNode],
         allow_update: bool = True,
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
         store_text: bool = True,
     ) -> None:
         """Adds a document to the store.
 
+        Rows are upserted with one `unnest` statement per batch. With the
+        store's default `max_concurrency` of 1, the batches are committed
+        together. Otherwise up to `max_concurrency` batches are written at the
+        same time and each is committed on its own, so a failure can leave the
+        batches written before it in the table.
+
         Args:
             docs (list[BaseDocument]): documents
             allow_update (bool): allow update of docstore from document
-            batch_size (int): batch_size to insert the rows. Defaults to 1.
+            batch_size (Optional[int]): number of rows per insert. Defaults to the store's batch_size, or to batches of about `max_batch_bytes` if neither is set.
             store_text (bool): allow the text content of the node to stored.
 
         Returns:
             None
         """
-        batch_size = batch_size or self._batch_size
+        batch_size = batch_size if batch_size is not None else self._batch_size
 
-        if batch_size < 1:
+        if batch_size is not None and batch_size < 1:
             batch_size = 1
             warnings.warn("Provided batch size less than 1. Defaulting to 1.")
 
-        node_rows = []
-
-        for node in docs:
-            # NOTE: doc could already exist in the store, but we overwrite it
-            if not allow_update and await self.adocument_exists(node.node_id):
+        if not allow_update and docs:
+            query = f"""SELECT id from "{self._schema_name}"."{self._table_name}" WHERE id = ANY(:ids) LIMIT 1;"""
+            existing = await self.__afetch_query(
+                query, {"ids": [node.node_id for node in docs]}
+            )
+            if existing:
                 raise ValueError(
-                    f"node_id {node.node_id} already exists. "
+                    f"node_id {existing[0]['id']} already exists. "
                     "Set allow_update to True to overwrite."
                 )
 
+        # Keyed by id so that a node given twice is written once, with its last
+        # value, as a single upsert can not update the same row twice.
+        node_rows: dict[str, dict[str, Any]] = {}
+
+        for node in docs:
+            # NOTE: doc could already exist in the store, but we overwrite it
             id = node.node_id
             data = doc_to_json(node)
 
@@ -212,17 +402,77 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
                 "node_data": json.dumps(node_data),
             }
 
-            node_rows.append(node_row)
+            node_rows[id] = node_row
 
-        for i in range(0, len(node_rows), batch_size):
-            batch = node_rows[i : i + batch_size]
+        batches = deque(self.__batch_rows(list(node_rows.values()), batch_size))
+        if not batches:
+            return
 
-            insert_query = f'INSERT INTO "{self._schema_name}"."{self._table_name}"(id, doc_hash, ref_doc_id, node_data) '
-            values_statement = f"VALUES (:id, :doc_hash, :ref_doc_id, :node_data)"
-            upsert_statement = " ON CONFLICT (id) DO UPDATE SET node_data = EXCLUDED.node_data, ref_doc_id = EXCLUDED.ref_doc_id, doc_hash = EXCLUDED.doc_hash;"
+        query = f"""
+            INSERT INTO "{self._schema_name}"."{self._table_name}" (id, doc_hash, ref_doc_id, node_data)
+            SELECT * FROM unnest(
+                CAST(:ids AS VARCHAR[]),
+                CAST(:doc_hashes AS VARCHAR[]),
+                CAST(:ref_doc_ids AS VARCHAR[]),
+                CAST(CAST(:node_data AS TEXT[]) AS JSONB[])
+            )
+            ON CONFLICT (id) DO UPDATE SET node_data = EXCLUDED.node_data, ref_doc_id = EXCLUDED.ref_doc_id, doc_hash = EXCLUDED.doc_hash;
+        """
 
-            query = insert_query + values_statement + upsert_statement
-            await self.__aexecute_query(query, batch)
+        # Commits on separate connections cannot be made all-or-nothing
+        atomic = self._max_concurrency == 1
+
+        async def write_batches() -> None:
+            async with self._engine.connect() as conn:
+                while batches:
+                    batch = batches.popleft()
+                    params = {
+                        "ids": [row["id"] for row in batch],
+                        "doc_hashes": [row["doc_hash"] for row in batch],
+                        "ref_doc_ids": [row["ref_doc_id"] for row in batch],
+                        "node_data": [row["node_data"] for row in batch],
+                    }
+                    await conn.execute(text(query), params)
+                    if not atomic:
+                        await conn.commit()
+                if atomic:
+                    await conn.commit()
+
+        tasks = [
+            asyncio.create_task(write_batches())
+            for _ in range(min(self._max_concurrency, len(batches)))
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._cache:
+                self._cache.invalidate(node_rows)
+
+    def __batch_rows(
+        self, rows: list[dict[str, Any]], batch_size: Optional[int]
+    ) -> list[list[dict[str, Any]]]:
+        """Split rows into batches of `batch_size` rows, or of about `max_batch_bytes`."""
+        if batch_size is not None:
+            return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+
+        batches: list[list[dict[str, Any]]] = []
+        batch: list[dict[str, Any]] = []
+        batch_bytes = 0
+        for row in rows:
+            row_bytes = len(row["node_data"]) + len(row["id"])
+            if batch and batch_bytes + row_bytes > self._max_batch_bytes:
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(row)
+            batch_bytes += row_bytes
+        if batch:
+            batches.append(batch)
+        return batches
 
     @property
     async def adocs(self) -> dict[str, BaseNode]:
@@ -232,13 +482,49 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
             Dict[str, BaseDocument]: documents
         """
         query = f"""SELECT * from "{self._schema_name}"."{self._table_name}";"""
-        list_docs = await self.__afetch_query(query)
+        list_docs = await self.__aread_query(query)
 
         if list_docs is None:
             return {}
 
         return {doc["id"]: json_to_doc(doc["node_data"]) for doc in list_docs}
 
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aiter_docs(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[str, BaseNode]]:
+        """Iterate over all documents without loading the whole table.
+
+        Documents are read in pages of `page_size` rows ordered by id, and each
+        page resumes after the last id of the previous one.
+
+        Args:
+            page_size (int): Number of documents fetched per query. Defaults to 1000.
+
+        Returns:
+            AsyncIterator[tuple[str, BaseNode]]: Document ids with their documents.
+        """
+        query = f"""SELECT id, node_data from "{self._schema_name}"."{self._table_name}" WHERE node_data <> '{{}}'::jsonb AND id > :after_id ORDER BY id LIMIT :page_size;"""
+        async for row in self.__aiter_pages(query, page_size):
+            yield row["id"], json_to_doc(row["node_data"])
+
+    async def __aiter_pages(
+        self, query: str, page_size: int
+    ) -> AsyncIterator[RowMapping]:
+        """Run a keyset-paginated query page by page and yield its rows."""
+        if page_size < 1:
+            raise ValueError("page_size must be greater than 0.")
+        after_id = ""
+        while True:
+            rows = await self.__aread_query(
+                query, {"after_id": after_id, "page_size": page_size}
+            )
+            for row in rows:
+                yield row
+            if len(rows) < page_size:
+                break
+            after_id = rows[-1]["id"]
+
     async def aget_document(
         self, doc_id: str, raise_error: bool = True
     ) -> Optional[BaseNode]:
@@ -254,19 +540,78 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         Returns:
             Optional[BaseNode]: Returns a `BaseNode` object if the document is found
         """
-        query = f"""SELECT node_data from "{self._schema_name}"."{self._table_name}" WHERE id = '{doc_id}';"""
-        result = await self.__afetch_query(query)
-
-        if result:
-            result = result[0]
-            json = result.get("node_data")
-            if json is not None:
-                return json_to_doc(json)
+        if self._cache:
+            nodes = await self.__aget_cached_documents(self._cache, [doc_id])
+            if doc_id in nodes:
+                return nodes[doc_id]
+        else:
+            query = f"""SELECT node_data from "{self._schema_name}"."{self._table_name}" WHERE id = '{doc_id}';"""
+            result = await self.__aread_query(query)
+
+            if result:
+                result = result[0]
+                json = result.get("node_data")
+                if json:
+                    return json_to_doc(json)
         if raise_error:
             raise ValueError(f"doc_id {doc_id} not found.")
         else:
             return None
 
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aget_documents(
+        self, doc_ids: Sequence[str], raise_error: bool = True
+    ) -> list[Optional[BaseNode]]:
+        """Asynchronously retrieves several documents from the table with one query.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents / nodes to be retrieved.
+            raise_error (bool): to raise error if any document is not found.
+
+        Raises:
+            ValueError: If a node doesn't exist and `raise_error` is set to True.
+
+        Returns:
+            list[Optional[BaseNode]]: The documents in the order of `doc_ids`, with None for documents that are not found.
+        """
+        if self._cache:
+            nodes = await self.__aget_cached_documents(self._cache, doc_ids)
+        else:
+            # Rows written only through aset_document_hash(es) hold the '{}' default
+            query = f"""SELECT id, node_data from "{self._schema_name}"."{self._table_name}" WHERE id = ANY(:ids) AND node_data <> '{{}}'::jsonb;"""
+            rows = await self.__aread_query(query, {"ids": list(doc_ids)})
+            nodes = {row["id"]: json_to_doc(row["node_data"]) for row in rows}
+
+        missing = [doc_id for doc_id in doc_ids if doc_id not in nodes]
+        if missing and raise_error:
+            raise ValueError(f"doc_ids {missing} not found.")
+        return [nodes.get(doc_id) for doc_id in doc_ids]
+
+    async def __aget_cached_documents(
+        self, cache: _NodeCache, doc_ids: Sequence[str]
+    ) -> dict[str, BaseNode]:
+        """Get documents from the node cache, reading the misses from the table."""
+        nodes: dict[str, BaseNode] = {}
+        misses = []
+        for doc_id in doc_ids:
+            node = cache.get(doc_id)
+            if node is None:
+                misses.append(doc_id)
+            else:
+                nodes[doc_id] = node
+        if not misses:
+            return nodes
+
+        # Misses are read from the writer, as a lagging replica could fill the cache with stale nodes
+        generation = cache.generation
+        query = f"""SELECT id, node_data, octet_length(node_data::text) AS size from "{self._schema_name}"."{self._table_name}" WHERE id = ANY(:ids) AND node_data <> '{{}}'::jsonb;"""
+        rows = await self.__afetch_query(query, {"ids": misses})
+        for row in rows:
+            node = json_to_doc(row["node_data"])
+            cache.put(row["id"], node, row["size"], generation)
+            nodes[row["id"]] = node
+        return nodes
+
     async def aget_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
         """Get the RefDocInfo for a given ref_doc_id.
 
@@ -278,7 +623,7 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         """
         query = f"""select id, node_data from "{self._schema_name}"."{self._table_name}" where ref_doc_id = '{ref_doc_id}'"""
 
-        rows = await self.__afetch_query(query)
+        rows = await self.__aread_query(query)
         node_ids = []
         merged_metadata = {}
 
@@ -311,23 +656,46 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
               ]
             ]
         """
+        return {
+            ref_doc_id: ref_doc_info
+            async for ref_doc_id, ref_doc_info in self.aiter_ref_doc_info()
+        }
 
-        ref_doc_infos = {}
-        query = f"""SELECT distinct on (ref_doc_id) ref_doc_id from "{self._schema_name}"."{self._table_name}";"""
-        ref_doc_ids = await self.__afetch_query(query)
-
-        if ref_doc_ids is None:
-            return None
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aiter_ref_doc_info(self) -> AsyncIterator[tuple[str, RefDocInfo]]:
+        """Iterate over (ref_doc_id, RefDocInfo) pairs for all ingested documents.
 
-        for id in ref_doc_ids:
-            ref_doc_info = await self.aget_ref_doc_info(id["ref_doc_id"])
-            if ref_doc_info is not None:
-                ref_doc_infos[id["ref_doc_id"]] = ref_doc_info
+        The node ids and merged metadata of every ref doc are computed by a
+        single grouped query, and the results are streamed from a server-side
+        cursor.
 
-        all_ref_doc_infos = {}
-        for doc_id, ref_doc_info in ref_doc_infos.items():
-            all_ref_doc_infos[doc_id] = ref_doc_info
-        return all_ref_doc_infos
+        Returns:
+            AsyncIterator[tuple[str, RefDocInfo]]: Ref_doc_id with its RefDocInfo.
+        """
+        # Node metadata is merged in node order, so later nodes overwrite keys.
+        query = f"""
+            SELECT nodes.ref_doc_id, nodes.node_ids, merged.metadata
+            FROM (
+                SELECT ref_doc_id, array_agg(id) AS node_ids,
+                    array_agg(node_data -> '{DATA_KEY}' -> 'metadata') AS metadata
+                FROM "{self._schema_name}"."{self._table_name}"
+                WHERE ref_doc_id IS NOT NULL
+                GROUP BY ref_doc_id
+            ) AS nodes
+            LEFT JOIN LATERAL (
+                SELECT jsonb_object_agg(entry.key, entry.value ORDER BY node.position) AS metadata
+                FROM unnest(nodes.metadata) WITH ORDINALITY AS node(metadata, position),
+                    jsonb_each(
+                        CASE WHEN jsonb_typeof(node.metadata) = 'object' THEN node.metadata END
+                    ) AS entry
+            ) AS merged ON true;
+        """
+        async with self._read_engine.connect() as conn:
+            result = await conn.stream(text(query))
+            async for row in result.mappings():
+                yield row["ref_doc_id"], RefDocInfo(
+                    node_ids=list(row["node_ids"]), metadata=row["metadata"] or {}
+                )
 
     # This method is not part of the base class, but it has been introduced for the user's convenience.
     async def aref_doc_exists(self, ref_doc_id: str) -> bool:
@@ -351,9 +719,24 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
             bool : True if document exists in the table.
         """
         query = f"""SELECT id from "{self._schema_name}"."{self._table_name}" WHERE id = '{doc_id}' LIMIT 1;"""
-        result = await self.__afetch_query(query)
+        result = await self.__aread_query(query)
         return bool(result)
 
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def adocuments_exist(self, doc_ids: Sequence[str]) -> dict[str, bool]:
+        """Check which of several documents exist, with one query.
+
+        Args:
+            doc_ids (Sequence[str]): The document / node ids which need to be found.
+
+        Returns:
+            dict[str, bool]: Whether each document id exists in the table.
+        """
+        query = f"""SELECT id from "{self._schema_name}"."{self._table_name}" WHERE id = ANY(:ids);"""
+        rows = await self.__aread_query(query, {"ids": list(doc_ids)})
+        existing = {row["id"] for row in rows}
+        return {doc_id: doc_id in existing for doc_id in doc_ids}
+
     async def _get_ref_doc_child_node_ids(
         self, ref_doc_id: str
     ) -> Optional[dict[str, list[str]]]:
@@ -424,6 +807,8 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
 
         query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE ref_doc_id = :ref_doc_id;"""
         await self.__aexecute_query(query, {"ref_doc_id": ref_doc_id})
+        if self._cache:
+            self._cache.invalidate_ref_doc(ref_doc_id)
 
         await self._delete_from_table(ref_doc_id)
 
@@ -451,11 +836,7 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         Returns:
             None
         """
-        doc_hash_pairs = []
-        for doc_id, doc_hash in doc_hashes.items():
-            doc_hash_pairs.append((doc_id, doc_hash))
-
-        await self._put_all_doc_hashes_to_table(doc_hash_pairs)
+        await self._put_all_doc_hashes_to_table(list(doc_hashes.items()))
 
     async def aget_document_hash(self, doc_id: str) -> Optional[str]:
         """Get the stored hash for a document, if it exists.
@@ -466,13 +847,41 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
             ]
         """
         query = f"""SELECT id, doc_hash from "{self._schema_name}"."{self._table_name}" WHERE id = '{doc_id}' LIMIT 1;"""
-        row = await self.__afetch_query(query)
+        row = await self.__aread_query(query)
 
         if row:
             return row[0].get("doc_hash", None)
         else:
             return None
 
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aget_document_hashes(
+        self, doc_ids: Sequence[str], raise_error: bool = False
+    ) -> dict[str, str]:
+        """Get the stored hashes of several documents with one query.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents whose hashes are retrieved.
+            raise_error (bool): to raise error if any document has no stored hash.
+
+        Raises:
+            ValueError: If a hash is not found and `raise_error` is set to True.
+
+        Returns:
+            dict[
+              str,   # doc_id
+              str    # doc_hash
+            ]: Hashes of the documents that were found.
+        """
+        query = f"""SELECT id, doc_hash from "{self._schema_name}"."{self._table_name}" WHERE id = ANY(:ids);"""
+        rows = await self.__aread_query(query, {"ids": list(doc_ids)})
+        hashes = {row["id"]: row["doc_hash"] for row in rows if row["doc_hash"]}
+
+        missing = [doc_id for doc_id in doc_ids if doc_id not in hashes]
+        if missing and raise_error:
+            raise ValueError(f"doc_ids {missing} not found.")
+        return hashes
+
     async def aget_all_document_hashes(self) -> dict[str, str]:
         """Get the stored hash for all documents.
 
@@ -487,7 +896,7 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
         query = (
             f"""SELECT id, doc_hash from "{self._schema_name}"."{self._table_name}";"""
         )
-        rows = await self.__afetch_query(query)
+        rows = await self.__aread_query(query)
 
         if rows:
             for row in rows:
@@ -497,6 +906,22 @@ class AsyncAlloyDBDocumentStore(BaseDocumentStore):
                     hashes[doc_hash] = doc_id
         return hashes
 
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    async def aiter_document_hashes(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Iterate over the stored hashes of all documents without loading the whole table.
+
+        Args:
+            page_size (int): Number of hashes fetched per query. Defaults to 1000.
+
+        Returns:
+            AsyncIterator[tuple[str, str]]: (doc_hash, doc_id) pairs, in the orientation of `aget_all_document_hashes`.
+        """
+        query = f"""SELECT id, doc_hash from "{self._schema_name}"."{self._table_name}" WHERE doc_hash IS NOT NULL AND id > :after_id ORDER BY id LIMIT :page_size;"""
+        async for row in self.__aiter_pages(query, page_size):
+            yield row["doc_hash"], row["id"]
+
     @property
     def docs(self) -> dict[str, BaseNode]:
         """Get all documents.
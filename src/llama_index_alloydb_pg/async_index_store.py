@@ -14,18 +14,20 @@
 
 from __future__ import annotations
 
+import copy
+import dataclasses
 import json
 import warnings
-from typing import Optional
+from typing import Any, Optional, Sequence
 
-from llama_index.core.data_structs.data_structs import IndexStruct
+from llama_index.core.data_structs.data_structs import IndexDict, IndexStruct
 from llama_index.core.storage.index_store.types import BaseIndexStore
 from llama_index.core.storage.index_store.utils import (
     index_struct_to_json,
     json_to_index_struct,
 )
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy import RowMapping, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 from .engine import AlloyDBEngine
 
@@ -41,6 +43,10 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
         engine: AsyncEngine,
         table_name: str,
         schema_name: str = "public",
+        versioned: bool = False,
+        cache_index_structs: bool = False,
+        nodes_table_name: Optional[str] = None,
+        read_engine: Optional[AsyncEngine] = None,
     ):
         """AsyncAlloyDBIndexStore constructor.
 
@@ -49,6 +55,10 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
             engine (AlloyDBEngine): Database connection pool.
             table_name (str): Table name that stores the index metadata.
             schema_name (str): The schema name where the table is located. Defaults to "public"
+            versioned (bool): Whether the table has a `version` column. Defaults to False.
+            cache_index_structs (bool): Whether to keep index structs in memory and revalidate them by version. Defaults to False.
+            nodes_table_name (Optional[str]): Table that stores the node mappings of IndexDict structs in incremental mode. Defaults to None.
+            read_engine (Optional[AsyncEngine]): Database connection pool for reads. Defaults to `engine`.
 
         Raises:
             Exception: If constructor is directly called by the user.
@@ -56,8 +66,16 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
         if key != AsyncAlloyDBIndexStore.__create_key:
             raise Exception("Only create class through 'create' method!")
         self._engine = engine
+        self._read_engine = read_engine or engine
         self._table_name = table_name
         self._schema_name = schema_name
+        self._versioned = versioned
+        self._cache: Optional[dict[str, tuple[int, IndexStruct]]] = (
+            {} if cache_index_structs else None
+        )
+        self._nodes_table_name = nodes_table_name
+        # index_id -> (version, serialized struct without nodes, nodes) as last read or written
+        self._snapshots: dict[str, tuple[int, str, dict[str, str]]] = {}
 
     @classmethod
     async def create(
@@ -65,6 +83,8 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
+        cache_index_structs: bool = False,
+        incremental: bool = False,
     ) -> AsyncAlloyDBIndexStore:
         """Create a new AsyncAlloyDBIndexStore instance.
 
@@ -72,9 +92,13 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the index metadata.
             schema_name (str): The schema name where the table is located. Defaults to "public"
+            cache_index_structs (bool): Whether to keep the index structs in memory. Cached structs are revalidated against the table's `version` column on the writer on every read, so unchanged structs are neither transferred nor deserialized again. The cached objects are shared between reads. Defaults to False.
+            incremental (bool): Whether to store the node mappings of IndexDict structs in the "{table_name}_nodes" table, so adding or deleting nodes writes only the changed mappings instead of the whole struct. Defaults to False.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
+            ValueError: If `cache_index_structs` or `incremental` is set and the table has no `version` column.
+            ValueError: If `incremental` is set and the nodes table does not exist.
 
         Returns:
             AsyncAlloyDBIndexStore: A newly created instance of AsyncAlloyDBIndexStore.
@@ -97,16 +121,46 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
                 ");"
             )
 
-        return cls(cls.__create_key, engine._pool, table_name, schema_name)
+        versioned = "version" in column_names
+        if (cache_index_structs or incremental) and not versioned:
+            raise ValueError(
+                f"Table '{schema_name}'.'{table_name}' needs a version column to cache index structs or update them incrementally:\n"
+                f'ALTER TABLE "{schema_name}"."{table_name}" ADD COLUMN version BIGINT NOT NULL DEFAULT 1;'
+            )
+        nodes_table_name = None
+        if incremental:
+            nodes_table_name = f"{table_name}_nodes"
+            nodes_schema = await engine._aload_table_schema(
+                nodes_table_name, schema_name
+            )
+            nodes_columns = nodes_schema.columns.keys()
+            required_nodes_columns = ["index_id", "vector_id", "node_id"]
+            if not (all(x in nodes_columns for x in required_nodes_columns)):
+                raise ValueError(
+                    f"Table '{schema_name}'.'{nodes_table_name}' has an incorrect schema.\n"
+                    f"Expected column names: {required_nodes_columns}\n"
+                    f"Provided column names: {nodes_columns}\n"
+                    "Please create the table with `init_index_store_table(..., incremental=True)`."
+                )
+        return cls(
+            cls.__create_key,
+            engine._pool,
+            table_name,
+            schema_name,
+            versioned,
+            cache_index_structs,
+            nodes_table_name,
+            engine._read_pool,
+        )
 
     async def __aexecute_query(self, query, params=None):
         async with self._engine.connect() as conn:
             await conn.execute(text(query), params)
             await conn.commit()
 
-    async def __afetch_query(self, query):
+    async def __afetch_query(self, query, params=None):
         async with self._engine.connect() as conn:
-            result = await conn.execute(text(query))
+            result = await conn.execute(text(query), params)
             result_map = result.mappings()
             results = result_map.fetchall()
             await conn.commit()
@@ -119,12 +173,96 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
             list[IndexStruct]: index structs
 
         """
-        query = f"""SELECT * from "{self._schema_name}"."{self._table_name}";"""
-        index_list = await self.__afetch_query(query)
+        if self._cache is None:
+            query = f"""SELECT * from "{self._schema_name}"."{self._table_name}";"""
+            _, loaded = await self.__aread_structs(query)
+            return [index_struct for _, index_struct in loaded.values()]
+
+        # Only the structs missing from the cache or changed since are transferred
+        query = f"""SELECT t.index_id, t.version,
+            CASE WHEN t.version = c.version THEN NULL ELSE t.index_data END AS index_data
+            FROM "{self._schema_name}"."{self._table_name}" AS t
+            LEFT JOIN unnest(CAST(:index_ids AS VARCHAR[]), CAST(:versions AS BIGINT[])) AS c(index_id, version)
+            ON t.index_id = c.index_id;"""
+        cached = list(self._cache.items())
+        params = {
+            "index_ids": [index_id for index_id, _ in cached],
+            "versions": [version for _, (version, _) in cached],
+        }
+        # Revalidated on the writer, as a lagging replica would replace cached
+        # structs with older versions
+        results, loaded = await self.__aread_structs(query, params, self._engine)
+        # Structs deleted by other writers are dropped from the cache
+        self._cache = {
+            row["index_id"]: loaded.get(row["index_id"]) or self._cache[row["index_id"]]
+            for row in results
+        }
+        # Copies, so that callers changing a struct do not change the cache
+        return [
+            copy.deepcopy(index_struct) for _, index_struct in self._cache.values()
+        ]
 
-        if index_list:
-            return [json_to_index_struct(index["index_data"]) for index in index_list]
-        return []
+    async def __aread_structs(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        engine: Optional[AsyncEngine] = None,
+    ) -> tuple[Sequence[RowMapping], dict[str, tuple[int, IndexStruct]]]:
+        """Reads index rows and deserializes the rows whose data was transferred, by index id.
+
+        The node mappings are read on the same connection, so that a struct and
+        its nodes come from the same server when reading from replicas.
+        """
+        async with (engine or self._read_engine).connect() as conn:
+            result = await conn.execute(text(query), params)
+            rows = result.mappings().fetchall()
+            loaded = {
+                row["index_id"]: (
+                    row.get("version"),
+                    json_to_index_struct(row["index_data"]),
+                )
+                for row in rows
+                if row["index_data"] is not None
+            }
+            if self._nodes_table_name is not None:
+                await self.__aload_nodes(conn, loaded)
+        return rows, loaded
+
+    async def __aload_nodes(
+        self, conn: AsyncConnection, loaded: dict[str, tuple[int, IndexStruct]]
+    ) -> None:
+        """Assembles IndexDict structs from the nodes table and snapshots them."""
+        index_dicts = {
+            index_id: (version, index_struct)
+            for index_id, (version, index_struct) in loaded.items()
+            if isinstance(index_struct, IndexDict)
+        }
+        if not index_dicts:
+            return
+        query = f"""SELECT index_id, vector_id, node_id FROM "{self._schema_name}"."{self._nodes_table_name}"
+            WHERE index_id = ANY(CAST(:index_ids AS VARCHAR[]));"""
+        result = await conn.execute(text(query), {"index_ids": list(index_dicts)})
+        results = result.mappings().fetchall()
+        nodes: dict[str, dict[str, str]] = {index_id: {} for index_id in index_dicts}
+        for row in results:
+            nodes[row["index_id"]][row["vector_id"]] = row["node_id"]
+        for index_id, (version, index_struct) in index_dicts.items():
+            # Structs written before the incremental mode still hold their nodes inline,
+            # their first write moves them to the nodes table.
+            inline = bool(index_struct.nodes_dict)  # type: ignore
+            serialized = self.__serialize_without_nodes(index_struct)  # type: ignore
+            index_struct.nodes_dict.update(nodes[index_id])  # type: ignore
+            if inline:
+                self._snapshots.pop(index_id, None)
+            else:
+                self._snapshots[index_id] = (version, serialized, nodes[index_id])
+
+    @staticmethod
+    def __serialize_without_nodes(index_struct: IndexDict) -> str:
+        """Serializes the parts of an IndexDict stored in the index table in incremental mode."""
+        return json.dumps(
+            index_struct_to_json(dataclasses.replace(index_struct, nodes_dict={}))
+        )
 
     async def aadd_index_struct(self, index_struct: IndexStruct) -> None:
         """Add an index struct.
@@ -134,6 +272,12 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
 
         """
         key = index_struct.index_id
+        if self._nodes_table_name is not None and isinstance(index_struct, IndexDict):
+            version = await self.__aadd_index_dict(index_struct)
+            if self._cache is not None:
+                self._cache[key] = (version, copy.deepcopy(index_struct))
+            return
+
         data = index_struct_to_json(index_struct)
         type = index_struct.get_type()
 
@@ -147,8 +291,106 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
         values_statement = f"VALUES (:index_id, :type, :index_data)"
         upsert_statement = " ON CONFLICT (index_id) DO UPDATE SET type = EXCLUDED.type, index_data = EXCLUDED.index_data;"
 
-        query = insert_query + values_statement + upsert_statement
-        await self.__aexecute_query(query, index_row)
+        if not self._versioned:
+            query = insert_query + values_statement + upsert_statement
+            await self.__aexecute_query(query, index_row)
+            return
+
+        query = insert_query + values_statement + self.__versioned_upsert_statement()
+        results = await self.__afetch_query(query, index_row)
+        if self._cache is not None:
+            self._cache[key] = (results[0]["version"], copy.deepcopy(index_struct))
+
+    def __versioned_upsert_statement(self) -> str:
+        return f""" ON CONFLICT (index_id) DO UPDATE SET type = EXCLUDED.type, index_data = EXCLUDED.index_data,
+            version = "{self._table_name}".version + 1 RETURNING version;"""
+
+    async def __aadd_index_dict(self, index_struct: IndexDict) -> int:
+        """Writes an IndexDict incrementally and returns its new version.
+
+        Only the node mappings changed since the struct was last read or written
+        by this store are written. The struct is rewritten in full when it was
+        not read before or was changed by another writer since.
+        """
+        key = index_struct.index_id
+        nodes = dict(index_struct.nodes_dict)
+        serialized = self.__serialize_without_nodes(index_struct)
+        index_row = {
+            "index_id": key,
+            "type": index_struct.get_type(),
+            "index_data": serialized,
+        }
+        table = f'"{self._schema_name}"."{self._table_name}"'
+        nodes_table = f'"{self._schema_name}"."{self._nodes_table_name}"'
+        snapshot = self._snapshots.get(key)
+        version = None
+        async with self._engine.connect() as conn:
+            if snapshot is not None:
+                snapshot_version, snapshot_serialized, snapshot_nodes = snapshot
+                set_data = ""
+                params = {"index_id": key, "version": snapshot_version}
+                if serialized != snapshot_serialized:
+                    set_data = "type = :type, index_data = :index_data, "
+                    params = {**index_row, "version": snapshot_version}
+                # Bumps the version only if nobody else wrote the struct meanwhile
+                result = await conn.execute(
+                    text(
+                        f"""UPDATE {table} SET {set_data}version = version + 1
+                        WHERE index_id = :index_id AND version = :version RETURNING version;"""
+                    ),
+                    params,
+                )
+                row = result.fetchone()
+                version = row[0] if row else None
+            if version is None:
+                result = await conn.execute(
+                    text(
+                        f"INSERT INTO {table}(index_id, type, index_data) VALUES (:index_id, :type, :index_data)"
+                        + self.__versioned_upsert_statement()
+                    ),
+                    index_row,
+                )
+                version = result.fetchone()[0]  # type: ignore
+                await conn.execute(
+                    text(f"DELETE FROM {nodes_table} WHERE index_id = :index_id;"),
+                    {"index_id": key},
+                )
+                added = nodes
+                removed = []
+            else:
+                added = {
+                    vector_id: node_id
+                    for vector_id, node_id in nodes.items()
+                    if snapshot_nodes.get(vector_id) != node_id
+                }
+                removed = [
+                    vector_id for vector_id in snapshot_nodes if vector_id not in nodes
+                ]
+            if removed:
+                await conn.execute(
+                    text(
+                        f"""DELETE FROM {nodes_table}
+                        WHERE index_id = :index_id AND vector_id = ANY(CAST(:vector_ids AS VARCHAR[]));"""
+                    ),
+                    {"index_id": key, "vector_ids": removed},
+                )
+            if added:
+                await conn.execute(
+                    text(
+                        f"""INSERT INTO {nodes_table} (index_id, vector_id, node_id)
+                        SELECT CAST(:index_id AS VARCHAR), vector_id, node_id
+                        FROM unnest(CAST(:vector_ids AS VARCHAR[]), CAST(:node_ids AS VARCHAR[])) AS t(vector_id, node_id)
+                        ON CONFLICT (index_id, vector_id) DO UPDATE SET node_id = EXCLUDED.node_id;"""
+                    ),
+                    {
+                        "index_id": key,
+                        "vector_ids": list(added),
+                        "node_ids": list(added.values()),
+                    },
+                )
+            await conn.commit()
+        self._snapshots[key] = (version, serialized, nodes)
+        return version
 
     async def adelete_index_struct(self, key: str) -> None:
         """Delete an index struct.
@@ -157,8 +399,11 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
             key (str): index struct key
 
         """
-        query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE index_id = '{key}'; """
-        await self.__aexecute_query(query)
+        query = f"""DELETE FROM "{self._schema_name}"."{self._table_name}" WHERE index_id = :index_id; """
+        await self.__aexecute_query(query, {"index_id": key})
+        if self._cache is not None:
+            self._cache.pop(key, None)
+        self._snapshots.pop(key, None)
 
     async def async_index_structs(self) -> list[IndexStruct]:
         """Get all index structs.
@@ -193,18 +438,37 @@ class AsyncAlloyDBIndexStore(BaseIndexStore):
                 return structs[0]
             warnings.warn("No struct_id specified and more than one struct exists.")
             return None
+        elif self._cache is not None:
+            return await self.__aget_cached_index_struct(struct_id)
         else:
-            query = f"""SELECT * from "{self._schema_name}"."{self._table_name}" WHERE index_id = '{struct_id}';"""
-            result = await self.__afetch_query(query)
-            if result:
-                json = result[0]
-                if json is None:
-                    return None
-                index_data = json.get("index_data")
-
-            if index_data:
-                return json_to_index_struct(index_data)
+            query = f"""SELECT * from "{self._schema_name}"."{self._table_name}" WHERE index_id = :index_id;"""
+            _, loaded = await self.__aread_structs(query, {"index_id": struct_id})
+            if struct_id in loaded:
+                return loaded[struct_id][1]
+            return None
+
+    async def __aget_cached_index_struct(self, struct_id: str) -> Optional[IndexStruct]:
+        """Gets an index struct, transferring its data only if the cached version is stale."""
+        cache: dict[str, tuple[int, IndexStruct]] = self._cache  # type: ignore
+        version = cache[struct_id][0] if struct_id in cache else None
+        query = f"""SELECT index_id, version,
+            CASE WHEN version = CAST(:version AS BIGINT) THEN NULL ELSE index_data END AS index_data
+            FROM "{self._schema_name}"."{self._table_name}" WHERE index_id = :index_id;"""
+        results, loaded = await self.__aread_structs(
+            query, {"index_id": struct_id, "version": version}, self._engine
+        )
+        if not results:
+            cache.pop(struct_id, None)
             return None
+        if struct_id in loaded:
+            cache[struct_id] = loaded[struct_id]
+        return copy.deepcopy(cache[struct_id][1])
+
+    # This method is not part of the base class, but it has been introduced for the user's convenience.
+    def clear_cache(self) -> None:
+        """Drops the cached index structs."""
+        if self._cache is not None:
+            self._cache.clear()
 
     def index_structs(self) -> list[IndexStruct]:
         raise NotImplementedError(
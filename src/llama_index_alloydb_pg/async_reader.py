@@ -14,66 +14,195 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, AsyncIterable, Callable, Iterable, Iterator, List, Optional
+import math
+import warnings
+from decimal import Decimal
+from functools import partial
+from itertools import chain
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
 
 from llama_index.core.bridge.pydantic import ConfigDict
 from llama_index.core.readers.base import BasePydanticReader
 from llama_index.core.schema import Document
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 from .engine import AlloyDBEngine
 
 DEFAULT_METADATA_COL = "li_metadata"
+DEFAULT_FETCH_SIZE = 1000
+
+# Marks the end of a partition's batches in the read queues.
+_PARTITION_DONE = object()
+
+
+def _content_values(
+    columns: dict[str, Sequence[Any]], content_columns: list[str]
+) -> tuple[list[str], list[Sequence[Any]]]:
+    """Get the content columns present in a batch and their values."""
+    names = [column for column in content_columns if column in columns]
+    return names, [columns[column] for column in names]
+
+
+def _batch_size(columns: dict[str, Sequence[Any]]) -> int:
+    return len(next(iter(columns.values()))) if columns else 0
+
+
+def text_batch_formatter(
+    columns: dict[str, Sequence[Any]], content_columns: list[str]
+) -> list[str]:
+    """txt document formatter for a batch of rows in columnar form."""
+    _, values = _content_values(columns, content_columns)
+    if not values:
+        return [""] * _batch_size(columns)
+    return [" ".join(row) for row in zip(*(map(str, v) for v in values))]
+
+
+def csv_batch_formatter(
+    columns: dict[str, Sequence[Any]], content_columns: list[str]
+) -> list[str]:
+    """CSV document formatter for a batch of rows in columnar form."""
+    _, values = _content_values(columns, content_columns)
+    if not values:
+        return [""] * _batch_size(columns)
+    return [", ".join(row) for row in zip(*(map(str, v) for v in values))]
+
+
+def yaml_batch_formatter(
+    columns: dict[str, Sequence[Any]], content_columns: list[str]
+) -> list[str]:
+    """YAML document formatter for a batch of rows in columnar form."""
+    names, values = _content_values(columns, content_columns)
+    if not values:
+        return [""] * _batch_size(columns)
+    lines = [[f"{name}: {value}" for value in v] for name, v in zip(names, values)]
+    return ["\n".join(row) for row in zip(*lines)]
+
+
+def json_batch_formatter(
+    columns: dict[str, Sequence[Any]],
+    content_columns: list[str],
+    encoder: Callable[[Any], str] = json.dumps,
+) -> list[str]:
+    """JSON document formatter for a batch of rows in columnar form."""
+    names, values = _content_values(columns, content_columns)
+    if not values:
+        return [encoder({})] * _batch_size(columns)
+    return [encoder(dict(zip(names, row))) for row in zip(*values)]
+
+
+def _row_as_columns(row: dict) -> dict[str, list[Any]]:
+    return {column: [value] for column, value in row.items()}
 
 
 def text_formatter(row: dict, content_columns: list[str]) -> str:
     """txt document formatter."""
-    return " ".join(str(row[column]) for column in content_columns if column in row)
+    warnings.warn(
+        "text_formatter is deprecated, use text_batch_formatter instead.",
+        DeprecationWarning,
+    )
+    return text_batch_formatter(_row_as_columns(row), content_columns)[0]
 
 
 def csv_formatter(row: dict, content_columns: list[str]) -> str:
     """CSV document formatter."""
-    return ", ".join(str(row[column]) for column in content_columns if column in row)
+    warnings.warn(
+        "csv_formatter is deprecated, use csv_batch_formatter instead.",
+        DeprecationWarning,
+    )
+    return csv_batch_formatter(_row_as_columns(row), content_columns)[0]
 
 
 def yaml_formatter(row: dict, content_columns: list[str]) -> str:
     """YAML document formatter."""
-    return "\n".join(
-        f"{column}: {str(row[column])}" for column in content_columns if column in row
+    warnings.warn(
+        "yaml_formatter is deprecated, use yaml_batch_formatter instead.",
+        DeprecationWarning,
     )
+    return yaml_batch_formatter(_row_as_columns(row), content_columns)[0]
 
 
 def json_formatter(row: dict, content_columns: list[str]) -> str:
     """JSON document formatter."""
-    dictionary = {}
-    for column in content_columns:
-        if column in row:
-            dictionary[column] = row[column]
-    return json.dumps(dictionary)
+    warnings.warn(
+        "json_formatter is deprecated, use json_batch_formatter instead.",
+        DeprecationWarning,
+    )
+    return json_batch_formatter(_row_as_columns(row), content_columns)[0]
 
 
-def _parse_doc_from_row(
-    content_columns: Iterable[str],
+def _batch_formatter_from_row_formatter(formatter: Callable) -> Callable:
+    """Apply a per-row formatter to a batch of rows in columnar form."""
+
+    def batch_formatter(
+        columns: dict[str, Sequence[Any]], content_columns: list[str]
+    ) -> list[str]:
+        names = list(columns)
+        return [
+            formatter(dict(zip(names, row)), content_columns)
+            for row in zip(*columns.values())
+        ]
+
+    return batch_formatter
+
+
+def _parse_docs_from_columns(
+    content_columns: list[str],
     metadata_columns: Iterable[str],
-    row: dict,
-    formatter: Callable = text_formatter,
+    columns: dict[str, Sequence[Any]],
+    batch_formatter: Callable = text_batch_formatter,
     metadata_json_column: Optional[str] = DEFAULT_METADATA_COL,
-) -> Document:
-    """Parse row into document."""
-    text = formatter(row, content_columns)
-    metadata: dict[str, Any] = {}
-    # unnest metadata from li_metadata column
-    if metadata_json_column and row.get(metadata_json_column):
-        for k, v in row[metadata_json_column].items():
-            metadata[k] = v
-    # load metadata from other columns
-    for column in metadata_columns:
-        if column in row and column != metadata_json_column:
-            metadata[column] = row[column]
-
-    return Document(text=text, extra_info=metadata)
+) -> list[Document]:
+    """Parse a batch of rows in columnar form into documents."""
+    texts = batch_formatter(columns, content_columns)
+    metadata_names = [
+        column
+        for column in metadata_columns
+        if column in columns and column != metadata_json_column
+    ]
+    metadata_rows: Iterable[tuple] = (
+        zip(*(columns[column] for column in metadata_names))
+        if metadata_names
+        else [()] * len(texts)
+    )
+    if metadata_json_column and metadata_json_column in columns:
+        # unnest metadata from li_metadata column, the other columns take precedence
+        metadata = [
+            (
+                dict(chain(json_value.items(), zip(metadata_names, row)))
+                if json_value
+                else dict(zip(metadata_names, row))
+            )
+            for json_value, row in zip(columns[metadata_json_column], metadata_rows)
+        ]
+    else:
+        metadata = [dict(zip(metadata_names, row)) for row in metadata_rows]
+    return [
+        Document(text=text, extra_info=extra_info)
+        for text, extra_info in zip(texts, metadata)
+    ]
+
+
+async def _adescribe_columns(connection: AsyncConnection, query: str) -> list[str]:
+    """Get the column names of a query's result without executing it.
+
+    The query is only prepared, so the server plans it and describes its
+    result columns but never scans the table.
+    """
+    raw_connection = await connection.get_raw_connection()
+    statement = await raw_connection.driver_connection.prepare(query)  # type: ignore
+    return [attribute.name for attribute in statement.get_attributes()]
 
 
 class AsyncAlloyDBReader(BasePydanticReader):
@@ -95,9 +224,14 @@ class AsyncAlloyDBReader(BasePydanticReader):
         query: str,
         content_columns: list[str],
         metadata_columns: list[str],
-        formatter: Callable,
+        batch_formatter: Callable,
         metadata_json_column: Optional[str] = None,
         is_remote: bool = True,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        table: Optional[str] = None,
+        partitions: int = 1,
+        partition_column: Optional[str] = None,
+        ordered: bool = True,
     ) -> None:
         """AsyncAlloyDBReader constructor.
 
@@ -107,9 +241,14 @@ class AsyncAlloyDBReader(BasePydanticReader):
             query (Optional[str], optional): SQL query. Defaults to None.
             content_columns (Optional[list[str]], optional): Column that represent a Document's page_content. Defaults to the first column.
             metadata_columns (Optional[list[str]], optional): Column(s) that represent a Document's metadata. Defaults to None.
-            formatter (Optional[Callable], optional): A function to format page content (OneOf: format, formatter). Defaults to None.
+            batch_formatter (Callable): A function to format the page content of a batch of rows in columnar form.
             metadata_json_column (Optional[str], optional): Column to store metadata as JSON. Defaults to "li_metadata".
             is_remote (bool): Whether the data is loaded from a remote API or a local file.
+            fetch_size (int): Number of rows fetched from the server-side cursor at a time. Defaults to 1000.
+            table (Optional[str]): Quoted name of the table read, when the reader was created from a table. Defaults to None.
+            partitions (int): Number of slices read concurrently. Defaults to 1.
+            partition_column (Optional[str]): Numeric column the slices are split on. Defaults to None, which splits the table by ctid blocks.
+            ordered (bool): Whether partitioned reads yield the slices one after another in order. Defaults to True.
 
         Raises:
             Exception: If called directly by user.
@@ -123,8 +262,13 @@ class AsyncAlloyDBReader(BasePydanticReader):
         self._query = query
         self._content_columns = content_columns
         self._metadata_columns = metadata_columns
-        self._formatter = formatter
+        self._batch_formatter = batch_formatter
         self._metadata_json_column = metadata_json_column
+        self._fetch_size = fetch_size
+        self._table = table
+        self._partitions = partitions
+        self._partition_column = partition_column
+        self._ordered = ordered
 
     @classmethod
     async def create(
@@ -139,6 +283,12 @@ class AsyncAlloyDBReader(BasePydanticReader):
         format: Optional[str] = None,
         formatter: Optional[Callable] = None,
         is_remote: bool = True,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        batch_formatter: Optional[Callable] = None,
+        json_encoder: Optional[Callable[[Any], str]] = None,
+        partitions: int = 1,
+        partition_column: Optional[str] = None,
+        ordered: bool = True,
     ) -> AsyncAlloyDBReader:
         """Create an AsyncAlloyDBReader instance.
 
@@ -153,6 +303,12 @@ class AsyncAlloyDBReader(BasePydanticReader):
             format (Optional[str], optional): Format of page content (OneOf: text, csv, YAML, JSON). Defaults to 'text'.
             formatter (Optional[Callable], optional): A function to format page content (OneOf: format, formatter). Defaults to None.
             is_remote (bool): Whether the data is loaded from a remote API or a local file.
+            fetch_size (int): Number of rows fetched from the server-side cursor at a time. Defaults to 1000.
+            batch_formatter (Optional[Callable], optional): A function to format the page content of a whole batch at once (OneOf: format, formatter, batch_formatter). It receives a dict of column name to the batch's values and the content columns, and returns one string per row. Defaults to None.
+            json_encoder (Optional[Callable[[Any], str]], optional): Function used to encode page content with the JSON format, such as a faster third-party encoder. Defaults to `json.dumps`.
+            partitions (int): Number of slices to read concurrently, each on its own pooled connection. Defaults to 1.
+            partition_column (Optional[str]): Numeric column (such as the primary key) to split the rows on by value range. Required to partition a `query`. Defaults to None, which splits `table_name` by ctid blocks.
+            ordered (bool): Whether partitioned reads yield the slices one after another in order, instead of as soon as any batch arrives. Defaults to True.
 
 
         Returns:
@@ -164,28 +320,40 @@ class AsyncAlloyDBReader(BasePydanticReader):
             raise ValueError(
                 "At least one of the parameters 'table_name' or 'query' needs to be provided"
             )
-        if format and formatter:
-            raise ValueError("Only one of 'format' or 'formatter' should be specified.")
+        if sum(bool(f) for f in (format, formatter, batch_formatter)) > 1:
+            raise ValueError(
+                "Only one of 'format', 'formatter' or 'batch_formatter' should be specified."
+            )
 
         if format and format not in ["csv", "text", "JSON", "YAML"]:
             raise ValueError("format must be type: 'csv', 'text', 'JSON', 'YAML'")
-        if formatter:
-            formatter = formatter
+        if fetch_size < 1:
+            raise ValueError("fetch_size must be greater than 0.")
+        if partitions < 1:
+            raise ValueError("partitions must be greater than 0.")
+        if partitions > 1 and query and not partition_column:
+            raise ValueError("A 'partition_column' is required to partition a query.")
+        if batch_formatter:
+            batch_formatter = batch_formatter
+        elif formatter:
+            batch_formatter = _batch_formatter_from_row_formatter(formatter)
         elif format == "csv":
-            formatter = csv_formatter
+            batch_formatter = csv_batch_formatter
         elif format == "YAML":
-            formatter = yaml_formatter
+            batch_formatter = yaml_batch_formatter
         elif format == "JSON":
-            formatter = json_formatter
+            batch_formatter = partial(
+                json_batch_formatter, encoder=json_encoder or json.dumps
+            )
         else:
-            formatter = text_formatter
+            batch_formatter = text_batch_formatter
 
+        table = f'"{schema_name}"."{table_name}"' if table_name else None
         if not query:
-            query = f'SELECT * FROM "{schema_name}"."{table_name}"'
+            query = f"SELECT * FROM {table}"
 
-        async with engine._pool.connect() as connection:
-            result_proxy = await connection.execute(text(query))
-            column_names = list(result_proxy.keys())
+        async with engine._read_pool.connect() as connection:
+            column_names = await _adescribe_columns(connection, query)
             # Select content or default to first column
             content_columns = content_columns or [column_names[0]]
             # Select metadata columns
@@ -208,6 +376,8 @@ class AsyncAlloyDBReader(BasePydanticReader):
 
             # check validity of other column
             all_names = content_columns + metadata_columns
+            if partition_column:
+                all_names = all_names + [partition_column]
             for name in all_names:
                 if name not in column_names:
                     raise ValueError(
@@ -215,13 +385,18 @@ class AsyncAlloyDBReader(BasePydanticReader):
                     )
         return cls(
             key=cls.__create_key,
-            pool=engine._pool,
+            pool=engine._read_pool,
             query=query,
             content_columns=content_columns,
             metadata_columns=metadata_columns,
-            formatter=formatter,
+            batch_formatter=batch_formatter,
             metadata_json_column=metadata_json_column,
             is_remote=is_remote,
+            fetch_size=fetch_size,
+            table=table,
+            partitions=partitions,
+            partition_column=partition_column,
+            ordered=ordered,
         )
 
     @classmethod
@@ -234,31 +409,156 @@ class AsyncAlloyDBReader(BasePydanticReader):
 
     async def alazy_load_data(self) -> AsyncIterable[Document]:  # type: ignore
         """Asynchronously load AlloyDB data into Document objects lazily."""
-        async with self._pool.connect() as connection:
-            result_proxy = await connection.execute(text(self._query))
-            # load document one by one
-            while True:
-                row = result_proxy.fetchone()
-                if not row:
-                    break
-
-                row_data = {}
-                column_names = self._content_columns + self._metadata_columns
-                column_names += (
-                    [self._metadata_json_column] if self._metadata_json_column else []
-                )
-                for column in column_names:
-                    value = getattr(row, column)
-                    row_data[column] = value
+        async for docs in self.alazy_load_batches():
+            for doc in docs:
+                yield doc
+
+    async def alazy_load_batches(self) -> AsyncIterable[list[Document]]:
+        """Asynchronously load AlloyDB data in batches of up to `fetch_size` Documents.
 
-                yield _parse_doc_from_row(
+        Rows are streamed from a server-side cursor, so only one batch is held
+        in memory at a time and the next one is fetched when the consumer asks
+        for it. With `partitions` > 1 the slices are streamed concurrently.
+        """
+        if self._partitions == 1:
+            async for docs in self.__astream_batches(self._query, {}):
+                yield docs
+            return
+
+        slices = await self.__apartition_slices()
+        async for docs in self.__aread_partitions(slices):
+            yield docs
+
+    async def __astream_batches(
+        self, query: str, params: dict[str, Any]
+    ) -> AsyncIterable[list[Document]]:
+        """Stream a query's rows as batches of Documents."""
+        column_names = self._content_columns + self._metadata_columns
+        column_names += (
+            [self._metadata_json_column] if self._metadata_json_column else []
+        )
+        stmt = text(query).execution_options(yield_per=self._fetch_size)
+        async with self._pool.connect() as connection:
+            result = await connection.stream(stmt, params)
+            keys = list(result.keys())
+            async for rows in result.partitions(self._fetch_size):
+                # Transpose the rows into columns to format the batch at once
+                values = list(zip(*rows))
+                columns = {
+                    column: values[keys.index(column)] for column in column_names
+                }
+                yield _parse_docs_from_columns(
                     self._content_columns,
                     self._metadata_columns,
-                    row_data,
-                    self._formatter,
+                    columns,
+                    self._batch_formatter,
                     self._metadata_json_column,
                 )
 
+    async def __apartition_slices(self) -> list[tuple[str, dict[str, Any]]]:
+        """Split the read into `partitions` queries with their bind parameters.
+
+        The first slice has no lower bound and the last no upper bound, so
+        rows outside the bounds seen when splitting are still read.
+        """
+        if self._partition_column:
+            column = f'"{self._partition_column}"'
+            stmt = f"SELECT min({column}) AS lower, max({column}) AS upper FROM ({self._query}) AS partition_query"
+            async with self._pool.connect() as connection:
+                row = (await connection.execute(text(stmt))).mappings().one()
+            lower, upper = row["lower"], row["upper"]
+            if lower is None:
+                return [(self._query, {})]
+            if not all(isinstance(v, (int, float, Decimal)) for v in (lower, upper)):
+                raise ValueError(
+                    f"Partition column {self._partition_column} must be numeric."
+                )
+            if isinstance(lower, int) and isinstance(upper, int):
+                step = math.ceil((upper - lower + 1) / self._partitions)
+            else:
+                step = (upper - lower) / self._partitions
+            bounds = [lower + i * step for i in range(1, self._partitions)]
+            query = f"SELECT * FROM ({self._query}) AS partition_query"
+            lower_stmt, upper_stmt = f"{column} >= :lower", f"{column} < :upper"
+            null_stmt = f"{column} IS NULL"
+        else:
+            stmt = "SELECT pg_relation_size(CAST(:table AS regclass)) / current_setting('block_size')::bigint AS blocks"
+            async with self._pool.connect() as connection:
+                row = (
+                    (await connection.execute(text(stmt), {"table": self._table}))
+                    .mappings()
+                    .one()
+                )
+            step = math.ceil(max(row["blocks"], 1) / self._partitions)
+            bounds = [f"({i * step},0)" for i in range(1, self._partitions)]
+            query = self._query
+            lower_stmt = "ctid >= CAST(:lower AS tid)"
+            upper_stmt = "ctid < CAST(:upper AS tid)"
+            null_stmt = ""
+
+        slices = []
+        for i in range(self._partitions):
+            conditions = []
+            params: dict[str, Any] = {}
+            if i > 0:
+                params["lower"] = bounds[i - 1]
+                conditions.append(lower_stmt)
+            if i < self._partitions - 1:
+                params["upper"] = bounds[i]
+                conditions.append(upper_stmt)
+            where_stmt = " AND ".join(conditions)
+            if i == 0 and null_stmt:
+                where_stmt = f"({where_stmt} OR {null_stmt})"
+            slices.append((f"{query} WHERE {where_stmt}", params))
+        return slices
+
+    async def __aread_partitions(
+        self, slices: list[tuple[str, dict[str, Any]]]
+    ) -> AsyncIterable[list[Document]]:
+        """Read the slices concurrently and merge their batches.
+
+        Each slice is streamed by its own task into a bounded queue, so a slow
+        consumer holds back the readers instead of buffering whole slices.
+        """
+        if self._ordered:
+            queues = [asyncio.Queue(maxsize=2) for _ in slices]
+        else:
+            queues = [asyncio.Queue(maxsize=2 * len(slices))] * len(slices)
+
+        async def read_slice(
+            queue: asyncio.Queue, query: str, params: dict[str, Any]
+        ) -> None:
+            try:
+                async for docs in self.__astream_batches(query, params):
+                    await queue.put(docs)
+                await queue.put(_PARTITION_DONE)
+            except Exception as e:
+                await queue.put(e)
+
+        tasks = [
+            asyncio.create_task(read_slice(queue, query, params))
+            for queue, (query, params) in zip(queues, slices)
+        ]
+        try:
+            # In ordered mode each queue is drained in turn, otherwise the
+            # shared queue is drained until every slice is done.
+            pending = len(tasks)
+            queue_index = 0
+            while pending:
+                item = await queues[queue_index].get()
+                if isinstance(item, Exception):
+                    raise item
+                if item is _PARTITION_DONE:
+                    pending -= 1
+                    if self._ordered:
+                        queue_index += 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def lazy_load_data(self) -> Iterable[Document]:
         raise NotImplementedError(
             "Sync methods are not implemented for AsyncAlloyDBReader. Use AlloyDBReader interface instead."
@@ -15,10 +15,27 @@
 # TODO: Remove below import when minimum supported Python version is 3.10
 from __future__ import annotations
 
+import asyncio
 import json
+import math
+import time
+import uuid
 import warnings
-from typing import Any, Optional, Sequence
+from collections import deque
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Iterable,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
+import numpy as np
 from llama_index.core.schema import BaseNode, MetadataMode, NodeRelationship, TextNode
 from llama_index.core.vector_stores.types import (
     BasePydanticVectorStore,
@@ -34,9 +51,9 @@ from llama_index.core.vector_stores.utils import (
     node_to_metadata_dict,
 )
 from sqlalchemy import RowMapping, text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
-from .engine import AlloyDBEngine
+from .engine import VECTOR_CODEC_KEY, AlloyDBEngine
 from .indexes import (
     DEFAULT_DISTANCE_STRATEGY,
     DEFAULT_INDEX_NAME_SUFFIX,
@@ -47,6 +64,86 @@ from .indexes import (
     ScaNNIndex,
 )
 
+DEFAULT_BULK_CHUNK_SIZE: int = 10000
+
+# Column types that bind string filter values without an explicit cast.
+TEXT_TYPES = ("text", "varchar", "bpchar", "name")
+
+
+@dataclass
+class BulkAddResult:
+    """Summary of a bulk ingest into the vector store table."""
+
+    rows: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Average ingest throughput."""
+        if self.elapsed_seconds <= 0:
+            return float(self.rows)
+        return self.rows / self.elapsed_seconds
+
+
+@dataclass
+class AlloyDBVectorStoreQueryResult(VectorStoreQueryResult):
+    """Vector store query result that can carry the embeddings as a NumPy array."""
+
+    # One row per node, set when queried with `return_embedding="numpy"`
+    embeddings: Optional[np.ndarray] = None
+
+
+class LazyNodeList(Sequence[BaseNode]):
+    """Query result nodes that are only built when they are accessed.
+
+    Each row's metadata is kept as JSON text and parsed the first time its
+    node is read, so callers that only use ids or similarities skip the
+    decoding altogether.
+    """
+
+    def __init__(self, rows: Sequence[Any], build_node: Callable[[Any], BaseNode]):
+        self._rows = rows
+        self._build_node = build_node
+        self._nodes: list[Optional[BaseNode]] = [None] * len(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> BaseNode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[BaseNode]: ...
+
+    def __getitem__(self, index: int | slice) -> BaseNode | list[BaseNode]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        node = self._nodes[index]
+        if node is None:
+            node = self._build_node(self._rows[index])
+            self._nodes[index] = node
+        return node
+
+
+def _bind(params: dict[str, Any], value: Any) -> str:
+    """Add a value to the bind parameters and return its placeholder."""
+    name = f"param_{len(params)}"
+    params[name] = value
+    return f":{name}"
+
+
+def _embedding_param(conn: AsyncConnection, embedding: Optional[list[float]]) -> Any:
+    """Encode an embedding as a bind parameter for the given connection.
+
+    Connections with the pgvector codec registered send the vector in the
+    binary wire format, other connections send its text representation.
+    """
+    if embedding is None:
+        return None
+    if conn.info.get(VECTOR_CODEC_KEY):
+        return embedding
+    return str(embedding)
+
 
 class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
     """Google AlloyDB Vector Store class"""
@@ -73,6 +170,8 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         is_embedding_query: bool = True,
         distance_strategy: DistanceStrategy = DEFAULT_DISTANCE_STRATEGY,
         index_query_options: Optional[QueryOptions] = None,
+        column_types: Optional[dict[str, str]] = None,
+        read_engine: Optional[AsyncEngine] = None,
     ):
         """AsyncAlloyDBVectorStore constructor.
         Args:
@@ -91,6 +190,8 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
             is_embedding_query (bool): Whether the table query can have embeddings. Defaults to "True".
             distance_strategy (DistanceStrategy): Distance strategy to use for vector similarity search. Defaults to COSINE_DISTANCE.
             index_query_options (QueryOptions): Index query option.
+            column_types (Optional[dict[str, str]]): Postgres type names of the table columns, used to bind filter values.
+            read_engine (Optional[AsyncEngine]): Connection pool engine for the searches. Defaults to `engine`.
 
 
         Raises:
@@ -102,6 +203,7 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         # Delegate to Pydantic's __init__
         super().__init__(stores_text=stores_text, is_embedding_query=is_embedding_query)
         self._engine = engine
+        self._read_engine = read_engine or engine
         self._table_name = table_name
         self._schema_name = schema_name
         self._id_column = id_column
@@ -113,6 +215,7 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         self._node_column = node_column
         self._distance_strategy = distance_strategy
         self._index_query_options = index_query_options
+        self._column_types = column_types or {}
 
     @classmethod
     async def create(
@@ -156,14 +259,16 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         Returns:
             AsyncAlloyDBVectorStore
         """
-        stmt = f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{table_name}' AND table_schema = '{schema_name}'"
+        stmt = f"SELECT column_name, data_type, udt_name FROM information_schema.columns WHERE table_name = '{table_name}' AND table_schema = '{schema_name}'"
         async with engine._pool.connect() as conn:
             result = await conn.execute(text(stmt))
             result_map = result.mappings()
             results = result_map.fetchall()
         columns = {}
+        column_types = {}
         for field in results:
             columns[field["column_name"]] = field["data_type"]
+            column_types[field["column_name"]] = field["udt_name"]
 
         # Check columns
         if id_column not in columns:
@@ -218,6 +323,8 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
             is_embedding_query=is_embedding_query,
             distance_strategy=distance_strategy,
             index_query_options=index_query_options,
+            column_types=column_types,
+            read_engine=engine._read_pool,
         )
 
     @classmethod
@@ -229,9 +336,56 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         """Get client."""
         return self._engine
 
-    async def async_add(self, nodes: Sequence[BaseNode], **kwargs: Any) -> list[str]:
-        """Asynchronously add nodes to the table."""
-        ids = []
+    async def async_add(
+        self,
+        nodes: Sequence[BaseNode],
+        max_concurrency: int = 1,
+        batch_size: Optional[int] = None,
+        max_retries: int = 0,
+        atomic: bool = True,
+        progress_callback: Optional[Callable[[int, int], Any]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Asynchronously add nodes to the table.
+
+        Nodes are split into batches. With `atomic`, the batches are written
+        one after another in a single transaction. Otherwise they are written
+        concurrently on up to `max_concurrency` pooled connections, so set
+        `atomic` to False to use `max_concurrency`.
+
+        Args:
+            nodes (Sequence[BaseNode]): Nodes to add.
+            max_concurrency (int): Maximum number of connections written to at the same time. Must be 1 when `atomic` is True. Defaults to 1.
+            batch_size (Optional[int]): Number of nodes per batch. Defaults to splitting the nodes evenly across `max_concurrency` connections.
+            max_retries (int): Number of times a failed batch is retried. Defaults to 0.
+            atomic (bool): If True, all batches are written on one connection and committed together, so either
+                all nodes are added or none. Otherwise each batch is committed as soon as it is written. Defaults to True.
+            progress_callback (Optional[Callable[[int, int], Any]]): Called with the number of written nodes and the
+                total number of nodes after each batch.
+
+        Raises:
+            ValueError: If `max_concurrency` or `batch_size` is less than 1 or `max_retries` is negative.
+            ValueError: If `atomic` is True and `max_concurrency` is greater than 1.
+
+        Returns:
+            list[str]: Ids of the added nodes.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0.")
+        # Commits on separate connections cannot be made all-or-nothing, so
+        # atomic adds use a single transaction.
+        if atomic and max_concurrency > 1:
+            raise ValueError(
+                "max_concurrency must be 1 when atomic is True, set atomic=False to write concurrently."
+            )
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be greater than 0.")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+        ids = [node.node_id for node in nodes]
+        if not nodes:
+            return ids
+
         metadata_col_names = (
             ", " + ", ".join(self._metadata_columns)
             if len(self._metadata_columns) > 0
@@ -252,32 +406,157 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
             {metadata_col_names}
         ) VALUES (:node_id, :text, :embedding, :li_metadata, :ref_doc_id, :node_data {metadata_col_values})
         """
-        node_values_list = []
-        for node in nodes:
-            metadata = json.dumps(
-                node_to_metadata_dict(
-                    node, remove_text=self.stores_text, flat_metadata=False
-                )
+
+        batch_size = batch_size or math.ceil(len(nodes) / max_concurrency)
+        pending = deque(
+            nodes[i : i + batch_size] for i in range(0, len(nodes), batch_size)
+        )
+        num_workers = min(max_concurrency, len(pending))
+        total = len(nodes)
+        written = 0
+
+        async def write_batches(conn: AsyncConnection) -> None:
+            nonlocal written
+            while pending:
+                batch = pending.popleft()
+                node_values_list = []
+                for node in batch:
+                    node_values = self.__node_values(node)
+                    node_values["embedding"] = _embedding_param(
+                        conn, node_values["embedding"]
+                    )
+                    node_values_list.append(node_values)
+                for attempt in range(max_retries + 1):
+                    try:
+                        if atomic and max_retries:
+                            # A savepoint lets a failed batch be retried
+                            # without aborting the connection's transaction.
+                            async with conn.begin_nested():
+                                await conn.execute(text(insert_stmt), node_values_list)
+                        else:
+                            await conn.execute(text(insert_stmt), node_values_list)
+                            if not atomic:
+                                await conn.commit()
+                        break
+                    except Exception:
+                        if not atomic:
+                            await conn.rollback()
+                        if attempt == max_retries:
+                            raise
+                written += len(batch)
+                if progress_callback:
+                    progress_callback(written, total)
+
+        async with AsyncExitStack() as stack:
+            conns = [
+                await stack.enter_async_context(self._engine.connect())
+                for _ in range(num_workers)
+            ]
+            tasks = [asyncio.create_task(write_batches(conn)) for conn in conns]
+            done, not_done = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
             )
-            node_values = {
-                "node_id": node.node_id,
-                "text": node.get_content(metadata_mode=MetadataMode.NONE),
-                "embedding": str(node.get_embedding()),
-                "li_metadata": metadata,
-                "ref_doc_id": node.ref_doc_id,
-                "node_data": node.to_json(),
-            }
-            for metadata_column in self._metadata_columns:
-                if metadata_column in node.metadata:
-                    node_values[metadata_column] = node.metadata.get(metadata_column)
-                else:
-                    node_values[metadata_column] = None
-            node_values_list.append(node_values)
-            ids.append(node.node_id)
+            for task in not_done:
+                task.cancel()
+            # Uncommitted transactions are rolled back when the connections close
+            await asyncio.gather(*not_done, return_exceptions=True)
+            for task in done:
+                if task.exception():
+                    raise task.exception()  # type: ignore
+            if atomic:
+                await conns[0].commit()
+        return ids
+
+    async def async_add_bulk(
+        self,
+        nodes: Union[Iterable[BaseNode], AsyncIterable[BaseNode]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> BulkAddResult:
+        """Asynchronously upsert a large stream of nodes using COPY.
+
+        Nodes are consumed from the (async) iterable in chunks of `chunk_size`.
+        Each chunk is streamed into a temporary staging table with the binary
+        COPY protocol and then merged into the table with an upsert, so memory
+        use is bounded by the chunk size. All chunks are written in a single
+        transaction. When a chunk holds the same node id several times, the
+        last node wins.
+
+        Args:
+            nodes (Union[Iterable[BaseNode], AsyncIterable[BaseNode]]): Nodes to add.
+            chunk_size (int): Number of nodes copied per chunk. Defaults to 10000.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+
+        Returns:
+            BulkAddResult: Number of rows written and the ingest throughput.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than 0.")
+
+        columns = [
+            self._id_column,
+            self._text_column,
+            self._embedding_column,
+            self._metadata_json_column,
+            self._ref_doc_id_column,
+            self._node_column,
+        ] + self._metadata_columns
+        column_names = ", ".join(f'"{col}"' for col in columns)
+        update_stmt = ", ".join(
+            f'"{col}" = EXCLUDED."{col}"' for col in columns[1:]
+        )
+        staging_table = f"li_staging_{uuid.uuid4().hex}"
+        create_stmt = f"""CREATE TEMPORARY TABLE "{staging_table}"
+            (LIKE "{self._schema_name}"."{self._table_name}" INCLUDING DEFAULTS)
+            ON COMMIT DROP"""
+        # Without the vector codec, embeddings are staged as text and cast
+        # when they are merged.
+        text_embedding_stmt = f"""ALTER TABLE "{staging_table}" ALTER COLUMN "{self._embedding_column}" TYPE TEXT"""
+        truncate_stmt = f'TRUNCATE TABLE "{staging_table}"'
+
+        start = time.perf_counter()
+        rows = 0
         async with self._engine.connect() as conn:
-            await conn.execute(text(insert_stmt), node_values_list)
+            # COPY uses the binary protocol, which requires the vector codec.
+            binary = bool(conn.info.get(VECTOR_CODEC_KEY))
+            select_names = ", ".join(
+                (
+                    f'CAST("{col}" AS vector)'
+                    if col == self._embedding_column and not binary
+                    else f'"{col}"'
+                )
+                for col in columns
+            )
+            merge_stmt = f"""INSERT INTO "{self._schema_name}"."{self._table_name}" ({column_names})
+                SELECT {select_names} FROM "{staging_table}"
+                ON CONFLICT ("{self._id_column}") DO UPDATE SET {update_stmt}"""
+            await conn.execute(text(create_stmt))
+            if not binary:
+                await conn.execute(text(text_embedding_stmt))
+            raw_conn = await conn.get_raw_connection()
+            async for chunk in self.__achunk_nodes(nodes, chunk_size):
+                # An upsert cannot affect a row twice, so the last node of an id wins
+                records: dict[str, tuple] = {}
+                for node in chunk:
+                    node_values = self.__node_values(node)
+                    embedding = node_values["embedding"]
+                    records[node_values["node_id"]] = (
+                        node_values["node_id"],
+                        node_values["text"],
+                        embedding if binary else str(embedding),
+                        node_values["li_metadata"],
+                        node_values["ref_doc_id"],
+                        node_values["node_data"],
+                    ) + tuple(node_values[col] for col in self._metadata_columns)
+                await raw_conn.driver_connection.copy_records_to_table(
+                    staging_table, records=list(records.values()), columns=columns
+                )
+                await conn.execute(text(merge_stmt))
+                await conn.execute(text(truncate_stmt))
+                rows += len(records)
             await conn.commit()
-        return ids
+        return BulkAddResult(rows=rows, elapsed_seconds=time.perf_counter() - start)
 
     async def adelete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
         """Asynchronously delete nodes belonging to provided parent document from the table."""
@@ -305,17 +584,18 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         if filters:
             all_filters.append(filters)
         filters_stmt = ""
+        params: dict[str, Any] = {}
         if all_filters:
             all_metadata_filters = MetadataFilters(
                 filters=all_filters, condition=FilterCondition.AND
             )
             filters_stmt = self.__parse_metadata_filters_recursively(
-                all_metadata_filters
+                all_metadata_filters, params
             )
         filters_stmt = f"WHERE {filters_stmt}" if filters_stmt else ""
         query = f'DELETE FROM "{self._schema_name}"."{self._table_name}" {filters_stmt}'
         async with self._engine.connect() as conn:
-            await conn.execute(text(query))
+            await conn.execute(text(query), params)
             await conn.commit()
 
     async def aclear(self) -> None:
@@ -340,27 +620,159 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
     async def aquery(
         self, query: VectorStoreQuery, **kwargs: Any
     ) -> VectorStoreQueryResult:
-        """Asynchronously query vector store."""
-        results = await self.__query_columns(query)
-        nodes = []
-        ids = []
-        similarities = []
+        """Asynchronously query vector store.
 
+        Args:
+            query (VectorStoreQuery): Query to run.
+            return_embedding (Union[bool, str]): Whether to fetch the stored embeddings and set them on the returned nodes. With "numpy", they are returned as a 2D array in the result's `embeddings` instead. Defaults to False.
+            lazy_nodes (bool): Whether to build the returned nodes only when they are accessed. Defaults to False.
+
+        Returns:
+            VectorStoreQueryResult: Nodes, ids and similarities of the matching rows.
+        """
+        return_embedding = kwargs.get("return_embedding", False)
+        lazy_nodes = kwargs.get("lazy_nodes", False)
+        params: dict[str, Any] = {}
+        embedding_params: list[str] = []
+        query_stmt = self.__search_stmt(
+            query, params, embedding_params, return_embedding, lazy_nodes
+        )
+        results = await self.__execute_search(query_stmt, params, embedding_params)
+        return self.__query_result(results, return_embedding, lazy_nodes)
+
+    async def aquery_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> list[VectorStoreQueryResult]:
+        """Asynchronously run several queries against the vector store in one round trip.
+
+        The searches are combined into a single statement, so each query may
+        use its own embedding, filters and similarity_top_k.
+
+        Args:
+            queries (Sequence[VectorStoreQuery]): Queries to run.
+            return_embedding (Union[bool, str]): Whether to fetch the stored embeddings and set them on the returned nodes. With "numpy", they are returned as a 2D array in the result's `embeddings` instead. Defaults to False.
+            lazy_nodes (bool): Whether to build the returned nodes only when they are accessed. Defaults to False.
+
+        Returns:
+            list[VectorStoreQueryResult]: One result per query, in input order.
+        """
+        if not queries:
+            return []
+        return_embedding = kwargs.get("return_embedding", False)
+        lazy_nodes = kwargs.get("lazy_nodes", False)
+        params: dict[str, Any] = {}
+        embedding_params: list[str] = []
+        subqueries = []
+        for i, query in enumerate(queries):
+            stmt = self.__search_stmt(
+                query, params, embedding_params, return_embedding, lazy_nodes
+            )
+            # All branches of the UNION need the same columns.
+            distance_stmt = "" if query.query_embedding else ", NULL AS distance"
+            subqueries.append(
+                f"(SELECT q.*{distance_stmt}, {i} AS query_index FROM ({stmt}) AS q)"
+            )
+        batch_stmt = " UNION ALL ".join(subqueries)
+        results = await self.__execute_search(batch_stmt, params, embedding_params)
+
+        grouped: list[list[RowMapping]] = [[] for _ in queries]
         for row in results:
-            node = metadata_dict_to_node(
-                row[self._metadata_json_column], row[self._text_column]
+            grouped[row["query_index"]].append(row)
+        # UNION ALL does not guarantee the order of each branch, so restore it.
+        sign = -1 if self._distance_strategy == DistanceStrategy.INNER_PRODUCT else 1
+        for query, rows in zip(queries, grouped):
+            if query.query_embedding:
+                rows.sort(key=lambda row: sign * row["distance"])
+        # Filter-only branches select a NULL distance for the UNION, which
+        # their results leave out like `aquery` does.
+        return [
+            self.__query_result(
+                rows, return_embedding, lazy_nodes, bool(query.query_embedding)
             )
+            for query, rows in zip(queries, grouped)
+        ]
+
+    def __query_result(
+        self,
+        results: Sequence[RowMapping],
+        return_embedding: Union[bool, str] = False,
+        lazy_nodes: bool = False,
+        with_similarities: bool = True,
+    ) -> VectorStoreQueryResult:
+        """Convert search rows into a VectorStoreQueryResult."""
+        ids = [row[self._id_column] for row in results]
+        similarities = (
+            [row["distance"] for row in results if "distance" in row]
+            if with_similarities
+            else []
+        )
+
+        def build_node(row: RowMapping) -> BaseNode:
+            metadata = row[self._metadata_json_column]
+            if lazy_nodes and isinstance(metadata, str):
+                metadata = json.loads(metadata)
+            node = metadata_dict_to_node(metadata, row[self._text_column])
             if row[self._ref_doc_id_column]:
                 node_source = TextNode(id_=row[self._ref_doc_id_column])
                 node.relationships[NodeRelationship.SOURCE] = (
                     node_source.as_related_node_info()
                 )
-            nodes.append(node)
-            ids.append(row[self._id_column])
-            if "distance" in row:
-                similarities.append(row["distance"])
+            if return_embedding and return_embedding != "numpy":
+                node.embedding = self.__decode_embedding(row[self._embedding_column])
+            return node
+
+        nodes: Sequence[BaseNode] = (
+            LazyNodeList(results, build_node)
+            if lazy_nodes
+            else [build_node(row) for row in results]
+        )
+        if return_embedding == "numpy":
+            return AlloyDBVectorStoreQueryResult(
+                nodes=nodes,
+                similarities=similarities,
+                ids=ids,
+                embeddings=self.__embeddings_array(
+                    [row[self._embedding_column] for row in results]
+                ),
+            )
         return VectorStoreQueryResult(nodes=nodes, similarities=similarities, ids=ids)
 
+    @staticmethod
+    def __decode_embedding(value: Any) -> Optional[list[float]]:
+        """Decode an embedding read in either the text or the binary format."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return json.loads(value)
+        # The binary codec decodes vectors into pgvector Vectors, or into numpy
+        # arrays before pgvector 0.3
+        if hasattr(value, "to_list"):
+            return value.to_list()
+        return value.tolist()
+
+    @staticmethod
+    def __embeddings_array(values: Sequence[Any]) -> np.ndarray:
+        """Decode embeddings read in either the text or the binary format into a 2D NumPy array.
+
+        Missing embeddings are returned as rows of NaN.
+        """
+        arrays: list[Optional[np.ndarray]] = []
+        for value in values:
+            if value is None:
+                arrays.append(None)
+            elif isinstance(value, str):
+                arrays.append(np.array(json.loads(value), dtype=np.float32))
+            elif hasattr(value, "to_numpy"):
+                arrays.append(value.to_numpy())
+            else:
+                arrays.append(np.asarray(value, dtype=np.float32))
+        dimensions = next((len(array) for array in arrays if array is not None), 0)
+        embeddings = np.full((len(arrays), dimensions), np.nan, dtype=np.float32)
+        for i, array in enumerate(arrays):
+            if array is not None:
+                embeddings[i] = array
+        return embeddings
+
     def add(self, nodes: Sequence[BaseNode], **add_kwargs: Any) -> list[str]:
         raise NotImplementedError(
             "Sync methods are not implemented for AsyncAlloyDBVectorStore. Use AlloyDBVectorStore interface instead."
@@ -484,12 +896,62 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
             results = result_map.fetchall()
         return bool(len(results) == 1)
 
-    async def __query_columns(
+    def __node_values(self, node: BaseNode) -> dict[str, Any]:
+        """Convert a node into the column values of its table row."""
+        metadata = json.dumps(
+            node_to_metadata_dict(node, remove_text=self.stores_text, flat_metadata=False)
+        )
+        node_values = {
+            "node_id": node.node_id,
+            "text": node.get_content(metadata_mode=MetadataMode.NONE),
+            "embedding": node.get_embedding(),
+            "li_metadata": metadata,
+            "ref_doc_id": node.ref_doc_id,
+            "node_data": node.to_json(),
+        }
+        for metadata_column in self._metadata_columns:
+            if metadata_column in node.metadata:
+                node_values[metadata_column] = node.metadata.get(metadata_column)
+            else:
+                node_values[metadata_column] = None
+        return node_values
+
+    async def __achunk_nodes(
+        self,
+        nodes: Union[Iterable[BaseNode], AsyncIterable[BaseNode]],
+        chunk_size: int,
+    ) -> AsyncIterable[list[BaseNode]]:
+        """Group an iterable or async iterable of nodes into lists of chunk_size."""
+        chunk: list[BaseNode] = []
+        if isinstance(nodes, AsyncIterable):
+            async for node in nodes:
+                chunk.append(node)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        else:
+            for node in nodes:
+                chunk.append(node)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def __search_stmt(
         self,
         query: VectorStoreQuery,
-        **kwargs: Any,
-    ) -> Sequence[RowMapping]:
-        """Perform search query on database."""
+        params: dict[str, Any],
+        embedding_params: list[str],
+        return_embedding: Union[bool, str] = False,
+        lazy_nodes: bool = False,
+    ) -> str:
+        """Build the parameterized search statement for a query.
+
+        Bind values are added to `params`, and the names of the parameters
+        holding query embeddings are added to `embedding_params`. Only the
+        columns needed to build the result are selected.
+        """
         filters: list[MetadataFilter | MetadataFilters] = []
         if query.doc_ids:
             filters.append(
@@ -516,60 +978,73 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         # Vectors are already stored `self._embedding_column` so a custom embedding_field is ignored.
         query_filters = MetadataFilters(filters=filters, condition=FilterCondition.AND)
 
-        filters_stmt = self.__parse_metadata_filters_recursively(query_filters)
+        filters_stmt = self.__parse_metadata_filters_recursively(query_filters, params)
         filters_stmt = f"WHERE {filters_stmt}" if filters_stmt else ""
         operator = self._distance_strategy.operator
         search_function = self._distance_strategy.search_function
 
-        # query_embedding is used for scoring
-        scoring_stmt = (
-            f", {search_function}({self._embedding_column}, '{query.query_embedding}') as distance"
-            if query.query_embedding
-            else ""
-        )
-
-        # results are sorted on ORDER BY query_embedding
-        order_stmt = (
-            f" ORDER BY {self._embedding_column} {operator} '{query.query_embedding}' "
-            if query.query_embedding
-            else ""
-        )
+        scoring_stmt = ""
+        order_stmt = ""
+        if query.query_embedding:
+            embedding_param = _bind(params, query.query_embedding)
+            embedding_params.append(embedding_param[1:])
+            # query_embedding is used for scoring
+            scoring_stmt = f", {search_function}({self._embedding_column}, {embedding_param}) as distance"
+            # results are sorted on ORDER BY query_embedding
+            order_stmt = (
+                f" ORDER BY {self._embedding_column} {operator} {embedding_param} "
+            )
 
         # similarity_top_k is used for limiting number of retrieved nodes
         limit_stmt = (
-            f" LIMIT {query.similarity_top_k} " if query.similarity_top_k >= 1 else ""
+            f" LIMIT {_bind(params, query.similarity_top_k)} "
+            if query.similarity_top_k >= 1
+            else ""
         )
 
-        columns = self._metadata_columns + [
-            self._id_column,
-            self._text_column,
-            self._embedding_column,
-            self._ref_doc_id_column,
-            self._node_column,
-        ]
+        columns = [self._id_column, self._text_column, self._ref_doc_id_column]
+        if return_embedding:
+            columns.append(self._embedding_column)
+        column_stmts = [f'"{col}"' for col in columns]
         if self._metadata_json_column:
-            columns.append(self._metadata_json_column)
+            # Fetched as text for lazy nodes, so it is only parsed when read
+            column_stmts.append(
+                f'"{self._metadata_json_column}"::text AS "{self._metadata_json_column}"'
+                if lazy_nodes
+                else f'"{self._metadata_json_column}"'
+            )
 
-        column_names = ", ".join(f'"{col}"' for col in columns)
+        column_names = ", ".join(column_stmts)
 
-        query_stmt = f'SELECT {column_names} {scoring_stmt} FROM "{self._schema_name}"."{self._table_name}" {filters_stmt} {order_stmt} {limit_stmt}'
-        async with self._engine.connect() as conn:
+        return f'SELECT {column_names} {scoring_stmt} FROM "{self._schema_name}"."{self._table_name}" {filters_stmt} {order_stmt} {limit_stmt}'
+
+    async def __execute_search(
+        self,
+        query_stmt: str,
+        params: dict[str, Any],
+        embedding_params: list[str],
+    ) -> Sequence[RowMapping]:
+        """Execute a search statement with the index query options applied."""
+        async with self._read_engine.connect() as conn:
             if self._index_query_options:
                 # Set each query option individually
                 for query_option in self._index_query_options.to_parameter():
                     query_options_stmt = f"SET LOCAL {query_option};"
                     await conn.execute(text(query_options_stmt))
-            result = await conn.execute(text(query_stmt))
+            for name in embedding_params:
+                params[name] = _embedding_param(conn, params[name])
+            result = await conn.execute(text(query_stmt), params)
             result_map = result.mappings()
             results = result_map.fetchall()
         return results
 
     def __parse_metadata_filters_recursively(
-        self, metadata_filters: MetadataFilters
+        self, metadata_filters: MetadataFilters, params: dict[str, Any]
     ) -> str:
         """
         Parses a MetadataFilters object into a SQL WHERE clause.
         Supports a mixed list of MetadataFilter and nested MetadataFilters.
+        Filter values are added to `params` as bind parameters.
         """
         if not metadata_filters.filters:
             return ""
@@ -577,12 +1052,14 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         where_clauses = []
         for filter_item in metadata_filters.filters:
             if isinstance(filter_item, MetadataFilter):
-                clause = self.__parse_metadata_filter(filter_item)
+                clause = self.__parse_metadata_filter(filter_item, params)
                 if clause:
                     where_clauses.append(clause)
             elif isinstance(filter_item, MetadataFilters):
                 # Handle nested filters recursively
-                nested_clause = self.__parse_metadata_filters_recursively(filter_item)
+                nested_clause = self.__parse_metadata_filters_recursively(
+                    filter_item, params
+                )
                 if nested_clause:
                     where_clauses.append(f"({nested_clause})")
 
@@ -594,7 +1071,9 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
         )
         return f" {condition_value} ".join(where_clauses) if where_clauses else ""
 
-    def __parse_metadata_filter(self, filter: MetadataFilter) -> str:
+    def __parse_metadata_filter(
+        self, filter: MetadataFilter, params: dict[str, Any]
+    ) -> str:
         key = self.__to_postgres_key(filter.key)
         op = self.__to_postgres_operator(filter.operator)
         if filter.operator == FilterOperator.IS_EMPTY:
@@ -613,9 +1092,10 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
                     Value -> '{filter.value}'"""
                 )
                 return ""
-            return f"({key})::jsonb {op} '[\"{filter.value}\"]' "
+            value = json.dumps([str(filter.value)])
+            return f"({key})::jsonb {op} CAST({_bind(params, value)} AS jsonb) "
         if filter.operator == FilterOperator.TEXT_MATCH:
-            return f"{key} {op} '%{filter.value}%' "
+            return f"{key} {op} {self.__bind_value(filter.key, f'%{filter.value}%', params)} "
         if filter.operator in [
             FilterOperator.ANY,
             FilterOperator.ALL,
@@ -633,21 +1113,49 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
                     Value -> '{filter.value}'"""
                 )
                 return ""
-            filter_value = ", ".join(f"'{e}'" for e in filter.value)
+            values = [str(e) for e in filter.value]
             if filter.operator in [FilterOperator.ANY, FilterOperator.ALL]:
-                return f"({key})::jsonb {op} (ARRAY[{filter_value}])"
+                return f"({key})::jsonb {op} CAST({_bind(params, values)} AS text[])"
+            filter_values = self.__bind_value(filter.key, values, params)
+            if filter.operator == FilterOperator.IN:
+                return f"{key} = ANY({filter_values})"
             else:
-                return f"{key} {op} ({filter_value})"
+                return f"NOT ({key} = ANY({filter_values}))"
 
         # Check if value is a number. If so, cast the metadata value to a float
         # This is necessary because the metadata is stored as a string.
         if isinstance(filter.value, (int, float, str)):
             try:
-                return f"{key}::float {op} {float(filter.value)}"
+                return f"({key})::float {op} {_bind(params, float(filter.value))}"
             except ValueError:
                 # If not a number, then treat it as a string
                 pass
-        return f"{key} {op} '{filter.value}'"
+        return f"{key} {op} {self.__bind_value(filter.key, str(filter.value), params)}"
+
+    def __bind_value(
+        self, key: str, value: str | list[str], params: dict[str, Any]
+    ) -> str:
+        """Bind a string (or list of strings) compared against a filter key.
+
+        Values compared against a non-text table column are cast from text on
+        the server, the same way a quoted literal would be.
+        """
+        placeholder = _bind(params, value)
+        column_type = self._column_types.get(key, "text")
+        if key not in self.__column_keys() or column_type in TEXT_TYPES:
+            return placeholder
+        if isinstance(value, list):
+            return f'CAST(CAST({placeholder} AS text[]) AS "{column_type}"[])'
+        return f'CAST(CAST({placeholder} AS text) AS "{column_type}")'
+
+    def __column_keys(self) -> list[str]:
+        """Filter keys that refer to table columns instead of JSON metadata."""
+        return [
+            *self._metadata_columns,
+            self._id_column,
+            self._ref_doc_id_column,
+            self._text_column,
+        ]
 
     def __to_postgres_operator(self, operator: FilterOperator) -> str:
         if operator == FilterOperator.EQ:
@@ -681,11 +1189,6 @@ class AsyncAlloyDBVectorStore(BasePydanticVectorStore):
             return "="
 
     def __to_postgres_key(self, key: str) -> str:
-        if key in [
-            *self._metadata_columns,
-            self._id_column,
-            self._ref_doc_id_column,
-            self._text_column,
-        ]:
+        if key in self.__column_keys():
             return key
         return f"{self._metadata_json_column}->>'{key}'"
@@ -19,7 +19,11 @@ from typing import List, Optional
 from llama_index.core.llms import ChatMessage
 from llama_index.core.storage.chat_store.base import BaseChatStore
 
-from .async_chat_store import AsyncAlloyDBChatStore
+from .async_chat_store import (
+    DEFAULT_FLUSH_INTERVAL,
+    DEFAULT_FLUSH_MAX_MESSAGES,
+    AsyncAlloyDBChatStore,
+)
 from .engine import AlloyDBEngine
 
 
@@ -57,6 +61,9 @@ class AlloyDBChatStore(BaseChatStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_max_messages: int = DEFAULT_FLUSH_MAX_MESSAGES,
     ) -> AlloyDBChatStore:
         """Create a new AlloyDBChatStore instance.
 
@@ -64,14 +71,26 @@ class AlloyDBChatStore(BaseChatStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the chat store.
             schema_name (str): The schema name where the table is located. Defaults to "public"
+            write_behind (bool): Whether added messages are buffered in memory and written in batches. The buffer is flushed on `close` and when the engine is closed, and before messages are read. Reads then run on the engine's writer rather than its read replicas. Defaults to False.
+            flush_interval (float): Seconds after a buffered message is added before the buffer is flushed. Defaults to 1.0.
+            flush_max_messages (int): Number of buffered messages that triggers an immediate flush. Defaults to 100.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
+            ValueError: If `flush_interval` is not positive or `flush_max_messages` is less than 1.
+            ValueError: If `write_behind` is set and the engine runs several background loops.
 
         Returns:
             AlloyDBChatStore: A newly created instance of AlloyDBChatStore.
         """
-        coro = AsyncAlloyDBChatStore.create(engine, table_name, schema_name)
+        coro = AsyncAlloyDBChatStore.create(
+            engine,
+            table_name,
+            schema_name,
+            write_behind,
+            flush_interval,
+            flush_max_messages,
+        )
         chat_store = await engine._run_as_async(coro)
         return cls(cls.__create_key, engine, chat_store)
 
@@ -81,6 +100,9 @@ class AlloyDBChatStore(BaseChatStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
+        write_behind: bool = False,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_max_messages: int = DEFAULT_FLUSH_MAX_MESSAGES,
     ) -> AlloyDBChatStore:
         """Create a new AlloyDBChatStore sync instance.
 
@@ -88,14 +110,26 @@ class AlloyDBChatStore(BaseChatStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the chat store.
             schema_name (str): The schema name where the table is located. Defaults to "public"
+            write_behind (bool): Whether added messages are buffered in memory and written in batches. The buffer is flushed on `close` and when the engine is closed, and before messages are read. Reads then run on the engine's writer rather than its read replicas. Defaults to False.
+            flush_interval (float): Seconds after a buffered message is added before the buffer is flushed. Defaults to 1.0.
+            flush_max_messages (int): Number of buffered messages that triggers an immediate flush. Defaults to 100.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
+            ValueError: If `flush_interval` is not positive or `flush_max_messages` is less than 1.
+            ValueError: If `write_behind` is set and the engine runs several background loops.
 
         Returns:
             AlloyDBChatStore: A newly created instance of AlloyDBChatStore.
         """
-        coro = AsyncAlloyDBChatStore.create(engine, table_name, schema_name)
+        coro = AsyncAlloyDBChatStore.create(
+            engine,
+            table_name,
+            schema_name,
+            write_behind,
+            flush_interval,
+            flush_max_messages,
+        )
         chat_store = engine._run_as_sync(coro)
         return cls(cls.__create_key, engine, chat_store)
 
@@ -119,18 +153,67 @@ class AlloyDBChatStore(BaseChatStore):
             self.__chat_store.aset_messages(key=key, messages=messages)
         )
 
-    async def aget_messages(self, key: str) -> List[ChatMessage]:
+    async def aget_messages(
+        self,
+        key: str,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[ChatMessage]:
         """Asynchronously retrieves the chat messages associated with a specific key.
 
         Args:
             key (str): A unique identifier for which the messages are to be retrieved.
+            limit (Optional[int]): Maximum number of messages to retrieve. Defaults to None, for all messages.
+            before_id (Optional[int]): Only retrieve messages with an id lower than this one. With `limit`, the messages right before it are retrieved. Defaults to None.
+            after_id (Optional[int]): Only retrieve messages with an id greater than this one. Defaults to None.
 
         Returns:
             List[ChatMessage]: A list of `ChatMessage` objects associated with the provided key.
             If no messages are found, an empty list is returned.
         """
         return await self._engine._run_as_async(
-            self.__chat_store.aget_messages(key=key)
+            self.__chat_store.aget_messages(
+                key=key, limit=limit, before_id=before_id, after_id=after_id
+            )
+        )
+
+    async def aget_messages_with_ids(
+        self,
+        key: str,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[tuple[int, ChatMessage]]:
+        """Asynchronously retrieves the chat messages of a key along with their row ids.
+
+        Args:
+            key (str): A unique identifier for which the messages are to be retrieved.
+            limit (Optional[int]): Maximum number of messages to retrieve. Defaults to None, for all messages.
+            before_id (Optional[int]): Only retrieve messages with an id lower than this one. With `limit`, the messages right before it are retrieved. Defaults to None.
+            after_id (Optional[int]): Only retrieve messages with an id greater than this one. Defaults to None.
+
+        Returns:
+            List[tuple[int, ChatMessage]]: The (id, message) pairs in chronological order.
+        """
+        return await self._engine._run_as_async(
+            self.__chat_store.aget_messages_with_ids(
+                key=key, limit=limit, before_id=before_id, after_id=after_id
+            )
+        )
+
+    async def aget_last_messages(self, key: str, n: int) -> List[ChatMessage]:
+        """Asynchronously retrieves the last `n` chat messages of a specific key.
+
+        Args:
+            key (str): A unique identifier for which the messages are to be retrieved.
+            n (int): Number of messages to retrieve.
+
+        Returns:
+            List[ChatMessage]: The last `n` messages in chronological order.
+        """
+        return await self._engine._run_as_async(
+            self.__chat_store.aget_last_messages(key=key, n=n)
         )
 
     async def async_add_message(self, key: str, message: ChatMessage) -> None:
@@ -198,6 +281,14 @@ class AlloyDBChatStore(BaseChatStore):
         """
         return await self._engine._run_as_async(self.__chat_store.aget_keys())
 
+    async def aflush(self) -> None:
+        """Asynchronously writes the messages buffered in write-behind mode."""
+        await self._engine._run_as_async(self.__chat_store.aflush())
+
+    async def aclose(self) -> None:
+        """Asynchronously stops the write-behind timer and flushes the buffered messages."""
+        await self._engine._run_as_async(self.__chat_store.aclose())
+
     def set_messages(self, key: str, messages: List[ChatMessage]) -> None:
         """Synchronously sets the chat messages for a specific key.
 
@@ -213,17 +304,68 @@ class AlloyDBChatStore(BaseChatStore):
             self.__chat_store.aset_messages(key=key, messages=messages)
         )
 
-    def get_messages(self, key: str) -> List[ChatMessage]:
+    def get_messages(
+        self,
+        key: str,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[ChatMessage]:
         """Synchronously retrieves the chat messages associated with a specific key.
 
         Args:
             key (str): A unique identifier for which the messages are to be retrieved.
+            limit (Optional[int]): Maximum number of messages to retrieve. Defaults to None, for all messages.
+            before_id (Optional[int]): Only retrieve messages with an id lower than this one. With `limit`, the messages right before it are retrieved. Defaults to None.
+            after_id (Optional[int]): Only retrieve messages with an id greater than this one. Defaults to None.
 
         Returns:
             List[ChatMessage]: A list of `ChatMessage` objects associated with the provided key.
             If no messages are found, an empty list is returned.
         """
-        return self._engine._run_as_sync(self.__chat_store.aget_messages(key=key))
+        return self._engine._run_as_sync(
+            self.__chat_store.aget_messages(
+                key=key, limit=limit, before_id=before_id, after_id=after_id
+            )
+        )
+
+    def get_messages_with_ids(
+        self,
+        key: str,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[tuple[int, ChatMessage]]:
+        """Synchronously retrieves the chat messages of a key along with their row ids.
+
+        Args:
+            key (str): A unique identifier for which the messages are to be retrieved.
+            limit (Optional[int]): Maximum number of messages to retrieve. Defaults to None, for all messages.
+            before_id (Optional[int]): Only retrieve messages with an id lower than this one. With `limit`, the messages right before it are retrieved. Defaults to None.
+            after_id (Optional[int]): Only retrieve messages with an id greater than this one. Defaults to None.
+
+        Returns:
+            List[tuple[int, ChatMessage]]: The (id, message) pairs in chronological order.
+        """
+        return self._engine._run_as_sync(
+            self.__chat_store.aget_messages_with_ids(
+                key=key, limit=limit, before_id=before_id, after_id=after_id
+            )
+        )
+
+    def get_last_messages(self, key: str, n: int) -> List[ChatMessage]:
+        """Synchronously retrieves the last `n` chat messages of a specific key.
+
+        Args:
+            key (str): A unique identifier for which the messages are to be retrieved.
+            n (int): Number of messages to retrieve.
+
+        Returns:
+            List[ChatMessage]: The last `n` messages in chronological order.
+        """
+        return self._engine._run_as_sync(
+            self.__chat_store.aget_last_messages(key=key, n=n)
+        )
 
     def add_message(self, key: str, message: ChatMessage) -> None:
         """Synchronously adds a new chat message to the specified key.
@@ -287,3 +429,11 @@ class AlloyDBChatStore(BaseChatStore):
             Optional[str]: A list of strings representing the keys. If no keys are found, an empty list is returned.
         """
         return self._engine._run_as_sync(self.__chat_store.aget_keys())
+
+    def flush(self) -> None:
+        """Synchronously writes the messages buffered in write-behind mode."""
+        self._engine._run_as_sync(self.__chat_store.aflush())
+
+    def close(self) -> None:
+        """Synchronously stops the write-behind timer and flushes the buffered messages."""
+        self._engine._run_as_sync(self.__chat_store.aclose())
@@ -14,14 +14,19 @@
 
 from __future__ import annotations
 
-from typing import Optional, Sequence
+from typing import AsyncIterator, Iterator, Optional, Sequence
 
 from llama_index.core.schema import BaseNode
 from llama_index.core.storage.docstore import BaseDocumentStore
 from llama_index.core.storage.docstore.types import RefDocInfo
-from llama_index.core.storage.kvstore.types import DEFAULT_BATCH_SIZE
 
-from .async_document_store import AsyncAlloyDBDocumentStore
+from .async_document_store import (
+    DEFAULT_MAX_BATCH_BYTES,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PAGE_SIZE,
+    AsyncAlloyDBDocumentStore,
+    DocumentCacheStats,
+)
 from .engine import AlloyDBEngine
 
 
@@ -59,7 +64,11 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_max_entries: int = 0,
+        cache_max_bytes: Optional[int] = None,
     ) -> AlloyDBDocumentStore:
         """Create a new AlloyDBDocumentStore instance.
 
@@ -67,7 +76,11 @@ class AlloyDBDocumentStore(BaseDocumentStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the documents.
             schema_name (str): The schema name where the table is located. Defaults to "public"
-            batch_size (str): The default batch size for bulk inserts. Defaults to 1.
+            batch_size (Optional[int]): The default number of rows per bulk insert. Defaults to None, which sizes batches by `max_batch_bytes`.
+            max_batch_bytes (int): Approximate payload size of a bulk insert when `batch_size` is not set. Defaults to 4 MiB.
+            max_concurrency (int): Maximum number of batches written at the same time, each on its own connection. With 1, the batches of an add are written in one transaction, so it is all-or-nothing. With more, each batch is committed as soon as it is written, so a failed add can leave some of its documents written. Defaults to 1.
+            cache_max_entries (int): Maximum number of deserialized nodes kept in the in-process LRU cache used by `get_document` and `get_documents`. Defaults to 0, which disables the cache.
+            cache_max_bytes (Optional[int]): Maximum total size of the cached nodes' JSON data. Defaults to None, for no limit.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
@@ -76,7 +89,14 @@ class AlloyDBDocumentStore(BaseDocumentStore):
             AlloyDBDocumentStore: A newly created instance of AlloyDBDocumentStore.
         """
         coro = AsyncAlloyDBDocumentStore.create(
-            engine, table_name, schema_name, batch_size
+            engine,
+            table_name,
+            schema_name,
+            batch_size,
+            max_batch_bytes,
+            max_concurrency,
+            cache_max_entries,
+            cache_max_bytes,
         )
         document_store = await engine._run_as_async(coro)
         return cls(cls.__create_key, engine, document_store)
@@ -87,7 +107,11 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_max_entries: int = 0,
+        cache_max_bytes: Optional[int] = None,
     ) -> AlloyDBDocumentStore:
         """Create a new AlloyDBDocumentStore sync instance.
 
@@ -95,7 +119,11 @@ class AlloyDBDocumentStore(BaseDocumentStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the documents.
             schema_name (str): The schema name where the table is located. Defaults to "public"
-            batch_size (str): The default batch size for bulk inserts. Defaults to 1.
+            batch_size (Optional[int]): The default number of rows per bulk insert. Defaults to None, which sizes batches by `max_batch_bytes`.
+            max_batch_bytes (int): Approximate payload size of a bulk insert when `batch_size` is not set. Defaults to 4 MiB.
+            max_concurrency (int): Maximum number of batches written at the same time, each on its own connection. With 1, the batches of an add are written in one transaction, so it is all-or-nothing. With more, each batch is committed as soon as it is written, so a failed add can leave some of its documents written. Defaults to 1.
+            cache_max_entries (int): Maximum number of deserialized nodes kept in the in-process LRU cache used by `get_document` and `get_documents`. Defaults to 0, which disables the cache.
+            cache_max_bytes (Optional[int]): Maximum total size of the cached nodes' JSON data. Defaults to None, for no limit.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
@@ -104,11 +132,27 @@ class AlloyDBDocumentStore(BaseDocumentStore):
             AlloyDBDocumentStore: A newly created instance of AlloyDBDocumentStore.
         """
         coro = AsyncAlloyDBDocumentStore.create(
-            engine, table_name, schema_name, batch_size
+            engine,
+            table_name,
+            schema_name,
+            batch_size,
+            max_batch_bytes,
+            max_concurrency,
+            cache_max_entries,
+            cache_max_bytes,
         )
         document_store = engine._run_as_sync(coro)
         return cls(cls.__create_key, engine, document_store)
 
+    @property
+    def cache_stats(self) -> Optional[DocumentCacheStats]:
+        """Hit, miss and eviction counters of the node cache, or None if it is disabled."""
+        return self.__document_store.cache_stats
+
+    def clear_cache(self) -> None:
+        """Remove every node from the node cache."""
+        self.__document_store.clear_cache()
+
     @property
     def docs(self) -> dict[str, BaseNode]:
         """Get all documents.
@@ -119,11 +163,47 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         """
         return self._engine._run_as_sync(self.__document_store.adocs)
 
+    async def aiter_docs(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[str, BaseNode]]:
+        """Iterate over all documents without loading the whole table.
+
+        Args:
+            page_size (int): Number of documents fetched per query. Defaults to 1000.
+
+        Returns:
+            AsyncIterator[tuple[str, BaseNode]]: Document ids with their documents.
+        """
+        iterator = self.__document_store.aiter_docs(page_size).__aiter__()
+        while True:
+            try:
+                yield await self._engine._run_as_async(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+
+    def iter_docs(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[tuple[str, BaseNode]]:
+        """Iterate over all documents without loading the whole table.
+
+        Args:
+            page_size (int): Number of documents fetched per query. Defaults to 1000.
+
+        Returns:
+            Iterator[tuple[str, BaseNode]]: Document ids with their documents.
+        """
+        iterator = self.__document_store.aiter_docs(page_size).__aiter__()
+        while True:
+            try:
+                yield self._engine._run_as_sync(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+
     async def async_add_documents(
         self,
         docs: Sequence[BaseNode],
         allow_update: bool = True,
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
         store_text: bool = True,
     ) -> None:
         """Adds a document to the store.
@@ -131,7 +211,7 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         Args:
             docs (Sequence[BaseDocument]): documents
             allow_update (bool): allow update of docstore from document
-            batch_size (int): batch_size to insert the rows. Defaults to 1.
+            batch_size (Optional[int]): number of rows per insert. Defaults to the store's batch_size, or to batches of about `max_batch_bytes` if neither is set.
             store_text (bool): allow the text content of the node to stored. Defaults to "True".
 
         Returns:
@@ -147,7 +227,7 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         self,
         docs: Sequence[BaseNode],
         allow_update: bool = True,
-        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_size: Optional[int] = None,
         store_text: bool = True,
     ) -> None:
         """Adds a document to the store.
@@ -155,7 +235,7 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         Args:
             docs (Sequence[BaseDocument]): documents
             allow_update (bool): allow update of docstore from document
-            batch_size (int): batch_size to insert the rows. Defaults to 1.
+            batch_size (Optional[int]): number of rows per insert. Defaults to the store's batch_size, or to batches of about `max_batch_bytes` if neither is set.
             store_text (bool): allow the text content of the node to stored. Defaults to "True".
 
         Returns:
@@ -205,6 +285,44 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         )
         return result
 
+    async def aget_documents(
+        self, doc_ids: Sequence[str], raise_error: bool = True
+    ) -> list[Optional[BaseNode]]:
+        """Retrieves several documents from the table with one query.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents / nodes to be retrieved.
+            raise_error (bool): to raise error if any document is not found.
+
+        Raises:
+            ValueError: If a node doesn't exist and `raise_error` is set to True.
+
+        Returns:
+            list[Optional[BaseNode]]: The documents in the order of `doc_ids`, with None for documents that are not found.
+        """
+        return await self._engine._run_as_async(
+            self.__document_store.aget_documents(doc_ids, raise_error)
+        )
+
+    def get_documents(
+        self, doc_ids: Sequence[str], raise_error: bool = True
+    ) -> list[Optional[BaseNode]]:
+        """Retrieves several documents from the table with one query.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents / nodes to be retrieved.
+            raise_error (bool): to raise error if any document is not found.
+
+        Raises:
+            ValueError: If a node doesn't exist and `raise_error` is set to True.
+
+        Returns:
+            list[Optional[BaseNode]]: The documents in the order of `doc_ids`, with None for documents that are not found.
+        """
+        return self._engine._run_as_sync(
+            self.__document_store.aget_documents(doc_ids, raise_error)
+        )
+
     async def adelete_document(self, doc_id: str, raise_error: bool = True) -> None:
         """Delete a document from the store.
 
@@ -263,6 +381,32 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         """
         return self._engine._run_as_sync(self.__document_store.adocument_exists(doc_id))
 
+    async def adocuments_exist(self, doc_ids: Sequence[str]) -> dict[str, bool]:
+        """Check which of several documents exist, with one query.
+
+        Args:
+            doc_ids (Sequence[str]): The document / node ids which need to be found.
+
+        Returns:
+            dict[str, bool]: Whether each document id exists in the table.
+        """
+        return await self._engine._run_as_async(
+            self.__document_store.adocuments_exist(doc_ids)
+        )
+
+    def documents_exist(self, doc_ids: Sequence[str]) -> dict[str, bool]:
+        """Check which of several documents exist, with one query.
+
+        Args:
+            doc_ids (Sequence[str]): The document / node ids which need to be found.
+
+        Returns:
+            dict[str, bool]: Whether each document id exists in the table.
+        """
+        return self._engine._run_as_sync(
+            self.__document_store.adocuments_exist(doc_ids)
+        )
+
     async def aset_document_hash(self, doc_id: str, doc_hash: str) -> None:
         """Set the hash for a given doc_id.
 
@@ -343,6 +487,44 @@ class AlloyDBDocumentStore(BaseDocumentStore):
             self.__document_store.aget_document_hash(doc_id)
         )
 
+    async def aget_document_hashes(
+        self, doc_ids: Sequence[str], raise_error: bool = False
+    ) -> dict[str, str]:
+        """Get the stored hashes of several documents with one query.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents whose hashes are retrieved.
+            raise_error (bool): to raise error if any document has no stored hash.
+
+        Raises:
+            ValueError: If a hash is not found and `raise_error` is set to True.
+
+        Returns:
+            dict[str, str]: doc_id to doc_hash for the documents that were found.
+        """
+        return await self._engine._run_as_async(
+            self.__document_store.aget_document_hashes(doc_ids, raise_error)
+        )
+
+    def get_document_hashes(
+        self, doc_ids: Sequence[str], raise_error: bool = False
+    ) -> dict[str, str]:
+        """Get the stored hashes of several documents with one query.
+
+        Args:
+            doc_ids (Sequence[str]): Ids of the documents whose hashes are retrieved.
+            raise_error (bool): to raise error if any document has no stored hash.
+
+        Raises:
+            ValueError: If a hash is not found and `raise_error` is set to True.
+
+        Returns:
+            dict[str, str]: doc_id to doc_hash for the documents that were found.
+        """
+        return self._engine._run_as_sync(
+            self.__document_store.aget_document_hashes(doc_ids, raise_error)
+        )
+
     async def aget_all_document_hashes(self) -> dict[str, str]:
         """Get the stored hash for all documents.
 
@@ -361,6 +543,42 @@ class AlloyDBDocumentStore(BaseDocumentStore):
             self.__document_store.aget_all_document_hashes()
         )
 
+    async def aiter_document_hashes(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Iterate over the stored hashes of all documents without loading the whole table.
+
+        Args:
+            page_size (int): Number of hashes fetched per query. Defaults to 1000.
+
+        Returns:
+            AsyncIterator[tuple[str, str]]: (doc_hash, doc_id) pairs, in the orientation of `aget_all_document_hashes`.
+        """
+        iterator = self.__document_store.aiter_document_hashes(page_size).__aiter__()
+        while True:
+            try:
+                yield await self._engine._run_as_async(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+
+    def iter_document_hashes(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[tuple[str, str]]:
+        """Iterate over the stored hashes of all documents without loading the whole table.
+
+        Args:
+            page_size (int): Number of hashes fetched per query. Defaults to 1000.
+
+        Returns:
+            Iterator[tuple[str, str]]: (doc_hash, doc_id) pairs, in the orientation of `aget_all_document_hashes`.
+        """
+        iterator = self.__document_store.aiter_document_hashes(page_size).__aiter__()
+        while True:
+            try:
+                yield self._engine._run_as_sync(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+
     async def aget_all_ref_doc_info(self) -> Optional[dict[str, RefDocInfo]]:
         """Get a mapping of ref_doc_id -> RefDocInfo for all ingested documents.
 
@@ -377,6 +595,32 @@ class AlloyDBDocumentStore(BaseDocumentStore):
         """
         return self._engine._run_as_sync(self.__document_store.aget_all_ref_doc_info())
 
+    async def aiter_ref_doc_info(self) -> AsyncIterator[tuple[str, RefDocInfo]]:
+        """Iterate over (ref_doc_id, RefDocInfo) pairs for all ingested documents.
+
+        Returns:
+            AsyncIterator[tuple[str, RefDocInfo]]: Ref_doc_id with its RefDocInfo.
+        """
+        iterator = self.__document_store.aiter_ref_doc_info().__aiter__()
+        while True:
+            try:
+                yield await self._engine._run_as_async(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+
+    def iter_ref_doc_info(self) -> Iterator[tuple[str, RefDocInfo]]:
+        """Iterate over (ref_doc_id, RefDocInfo) pairs for all ingested documents.
+
+        Returns:
+            Iterator[tuple[str, RefDocInfo]]: Ref_doc_id with its RefDocInfo.
+        """
+        iterator = self.__document_store.aiter_ref_doc_info().__aiter__()
+        while True:
+            try:
+                yield self._engine._run_as_sync(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+
     async def aget_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
         """Get the RefDocInfo for a given ref_doc_id.
 
@@ -14,19 +14,35 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
+import re
+import threading
+import time
+import weakref
 from concurrent.futures import Future
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
 from threading import Thread
-from typing import TYPE_CHECKING, Any, Awaitable, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 import aiohttp
 import google.auth  # type: ignore
 import google.auth.transport.requests  # type: ignore
 from google.cloud.alloydb.connector import AsyncConnector, IPTypes, RefreshStrategy
-from sqlalchemy import MetaData, Table, text
+from pgvector.asyncpg import register_vector  # type: ignore
+from sqlalchemy import MetaData, Table, event, text
 from sqlalchemy.engine import URL
 from sqlalchemy.exc import InvalidRequestError
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from .version import __version__
 
@@ -96,12 +112,270 @@ class Column:
             raise ValueError("Column data_type must be type string")
 
 
+LOOP_ASSIGNMENTS = ("affinity", "round_robin")
+READER_ROUTINGS = ("round_robin", "least_loaded")
+# Leading keywords of statements that do not start the read-your-writes window,
+# unless they match WRITE_PATTERN
+READ_STATEMENTS = ("select", "show", "set", "explain", "values", "with")
+# Data-modifying CTEs, SELECT INTO, row locks and functions that write or lock
+WRITE_PATTERN = re.compile(
+    r"\b(insert|update|delete|merge|into)\b"
+    r"|\bfor\s+(key\s+)?share\b"
+    r"|\b(nextval|setval|pg_(try_)?advisory_\w*)\s*\(",
+    re.IGNORECASE,
+)
+# Key set in a pooled connection's info dictionary when its transaction wrote
+WROTE_KEY = "llama_index_alloydb_pg_wrote"
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+
+
+def _is_write(statement: str) -> bool:
+    """Whether a statement may write, or take locks, on the server it runs on."""
+    statement = statement.lstrip(" \t\n(")
+    return not statement.lower().startswith(READ_STATEMENTS) or bool(
+        WRITE_PATTERN.search(statement)
+    )
+
+
+def _validate_read_routing(reader_routing: str, read_your_writes: float) -> None:
+    """Check the read replica routing options.
+
+    Raises:
+        ValueError: If `reader_routing` is not supported or `read_your_writes` is negative.
+    """
+    if reader_routing not in READER_ROUTINGS:
+        raise ValueError(
+            f"reader_routing must be one of {READER_ROUTINGS}, got '{reader_routing}'."
+        )
+    if read_your_writes < 0:
+        raise ValueError("read_your_writes must not be negative.")
+
+
+# Key set in a pooled connection's info dictionary when the pgvector binary
+# codec is registered on the underlying asyncpg connection.
+VECTOR_CODEC_KEY = "llama_index_alloydb_pg_vector_codec"
+
+
+def _register_vector_codec(engine: AsyncEngine) -> AsyncEngine:
+    """Register the pgvector binary codec on each connection the pool opens.
+
+    The codec is registered once, when a connection is opened, so every
+    connection of the pool encodes and decodes vectors the same way. A
+    connection opened before the vector extension exists keeps the text format.
+    """
+
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        try:
+            dbapi_connection.run_async(register_vector)
+        except ValueError as e:
+            if not str(e).startswith("unknown type:"):
+                raise
+            return
+        connection_record.info[VECTOR_CODEC_KEY] = True
+
+    event.listen(engine.sync_engine, "connect", on_connect)
+    return engine
+
+
+class _LoopShardedEngine:
+    """AsyncEngine proxy that keeps one engine, and so one connection pool, per event loop.
+
+    asyncpg connections can only be used on the loop that opened them, so an
+    AlloyDBEngine running several background loops needs a pool per loop. The
+    shards are created on first use from the loop that uses them. The rest of
+    the AsyncEngine interface is delegated to the running loop's shard.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncEngine]) -> None:
+        self._factory = factory
+        self._engines: dict[Optional[asyncio.AbstractEventLoop], AsyncEngine] = {}
+        self._listeners: list[tuple[str, Callable[..., Any]]] = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._engine(), name)
+
+    def _engine(self) -> AsyncEngine:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside a loop only the configuration, such as the url or dialect,
+            # can be used, which all shards share.
+            loop = None
+        engine = self._engines.get(loop)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(loop)
+                if engine is None:
+                    engine = self._factory()
+                    for identifier, fn in self._listeners:
+                        event.listen(engine.sync_engine, identifier, fn)
+                    self._engines[loop] = engine
+        return engine
+
+    def listen(self, identifier: str, fn: Callable[..., Any]) -> None:
+        """Listen for an engine event on the current and future shards."""
+        with self._lock:
+            self._listeners.append((identifier, fn))
+            for engine in self._engines.values():
+                event.listen(engine.sync_engine, identifier, fn)
+
+    def connect(self) -> AsyncConnection:
+        """Return a connection from the running loop's pool."""
+        return self._engine().connect()
+
+    def begin(self) -> Any:
+        """Return a transaction context from the running loop's pool."""
+        return self._engine().begin()
+
+    async def dispose(self) -> None:
+        """Dispose of the pool of every loop, each on its own loop."""
+        with self._lock:
+            engines, self._engines = self._engines, {}
+        running_loop = asyncio.get_running_loop()
+        for loop, engine in engines.items():
+            if loop is None or loop is running_loop:
+                await engine.dispose()
+            elif not loop.is_closed():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(engine.dispose(), loop)
+                )
+
+
+class _ReadRouter:
+    """AsyncEngine proxy that hands out connections of reader pools, for read-only queries.
+
+    For `read_your_writes` seconds after a write statement ran on the writer
+    pool, reads go to the writer pool instead, so that callers see their own
+    writes despite replication lag.
+    """
+
+    def __init__(
+        self,
+        writer: Any,
+        readers: list[Any],
+        routing: str = "round_robin",
+        read_your_writes: float = 0.0,
+    ) -> None:
+        self._writer = writer
+        self._readers = readers
+        self._routing = routing
+        self._read_your_writes = read_your_writes
+        self._in_use = [0] * len(readers)
+        self._next_reader = itertools.count()
+        self._last_write = float("-inf")
+        self._lock = threading.Lock()
+        self.writer = _WriteTrackingEngine(writer, self)
+
+    def mark_write(self) -> None:
+        """Start the read-your-writes window."""
+        self._last_write = time.monotonic()
+
+    def __acquire_reader(self) -> int:
+        with self._lock:
+            if self._routing == "least_loaded":
+                index = min(range(len(self._readers)), key=self._in_use.__getitem__)
+            else:
+                index = next(self._next_reader) % len(self._readers)
+            self._in_use[index] += 1
+        return index
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator[AsyncConnection]:
+        """Return a connection of a reader pool, or of the writer pool after a recent write."""
+        if time.monotonic() - self._last_write < self._read_your_writes:
+            async with self._writer.connect() as conn:
+                yield conn
+            return
+        index = self.__acquire_reader()
+        try:
+            async with self._readers[index].connect() as conn:
+                yield conn
+        finally:
+            with self._lock:
+                self._in_use[index] -= 1
+
+    def pools(self) -> list[Any]:
+        """Return the writer pool followed by the reader pools."""
+        return [self._writer, *self._readers]
+
+    async def dispose(self) -> None:
+        """Dispose of the reader pools."""
+        for reader in self._readers:
+            await reader.dispose()
+
+
+class _WriteTrackingEngine:
+    """AsyncEngine proxy of the writer pool that starts the read-your-writes window on writes.
+
+    Only statements that may write start the window, so reads kept on the
+    writer, such as schema loads, do not hold the reads on the writer. The
+    window restarts when a transaction that wrote is committed. The rest of the
+    AsyncEngine interface is delegated to the writer pool.
+    """
+
+    def __init__(self, engine: Any, router: _ReadRouter) -> None:
+        self._engine = engine
+        self._router = router
+        # Registered once for the pool, rather than on each checked out connection
+        for identifier, fn in [
+            ("before_cursor_execute", self.__before_cursor_execute),
+            ("commit", self.__commit),
+            ("rollback", self.__rollback),
+        ]:
+            if isinstance(engine, _LoopShardedEngine):
+                engine.listen(identifier, fn)
+            else:
+                event.listen(engine.sync_engine, identifier, fn)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._engine, name)
+
+    def __before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if _is_write(statement):
+            conn.info[WROTE_KEY] = True
+            self._router.mark_write()
+
+    def __commit(self, conn) -> None:
+        if conn.info.pop(WROTE_KEY, False):
+            self._router.mark_write()
+
+    def __rollback(self, conn) -> None:
+        conn.info.pop(WROTE_KEY, None)
+
+    def connect(self) -> AsyncConnection:
+        """Return a connection of the writer pool."""
+        return self._engine.connect()
+
+    def begin(self) -> Any:
+        """Return a connection of the writer pool within a transaction.
+
+        An explicit transaction may lock or write, so it starts the window.
+        """
+        self._router.mark_write()
+        return self._engine.begin()
+
+    async def dispose(self) -> None:
+        """Dispose of the writer pool."""
+        await self._engine.dispose()
+
+
 class AlloyDBEngine:
     """A class for managing connections to a AlloyDB database."""
 
     _connector: Optional[AsyncConnector] = None
     _default_loop: Optional[asyncio.AbstractEventLoop] = None
     _default_thread: Optional[Thread] = None
+    # Background loops beyond the default one, shared by engines using several loops
+    _extra_loops: list[tuple[asyncio.AbstractEventLoop, Thread]] = []
+    _loops_lock = threading.Lock()
     __create_key = object()
 
     def __init__(
@@ -110,6 +384,11 @@ class AlloyDBEngine:
         pool: AsyncEngine,
         loop: Optional[asyncio.AbstractEventLoop],
         thread: Optional[Thread],
+        loops: Optional[list[asyncio.AbstractEventLoop]] = None,
+        loop_assignment: str = "affinity",
+        readers: Optional[list[AsyncEngine]] = None,
+        reader_routing: str = "round_robin",
+        read_your_writes: float = 0.0,
     ) -> None:
         """AlloyDBEngine constructor.
 
@@ -118,6 +397,11 @@ class AlloyDBEngine:
             engine (AsyncEngine): Async engine connection pool.
             loop (Optional[asyncio.AbstractEventLoop]): Async event loop used to create the engine.
             thread (Optional[Thread]): Thread used to create the engine async.
+            loops (Optional[list[asyncio.AbstractEventLoop]]): Background loops to run coroutines on, the first being `loop`. Defaults to None, for `loop` only.
+            loop_assignment (str): How calling threads are assigned to `loops` (OneOf: affinity, round_robin). Defaults to "affinity".
+            readers (Optional[list[AsyncEngine]]): Connection pools of read replicas for the stores' read-only methods. Defaults to None, for reading from `pool`.
+            reader_routing (str): How reads are spread over `readers` (OneOf: round_robin, least_loaded). Defaults to "round_robin".
+            read_your_writes (float): Seconds after a write during which reads go to `pool`. Defaults to 0.
 
         Raises:
             Exception: If the constructor is called directly by the user.
@@ -128,8 +412,21 @@ class AlloyDBEngine:
                 "Only create class through 'create' or 'create_sync' methods!"
             )
         self._pool = pool
+        self._read_pool = pool
+        if readers:
+            router = _ReadRouter(pool, readers, reader_routing, read_your_writes)
+            self._pool = router.writer
+            self._read_pool = router
         self._loop = loop
         self._thread = thread
+        self._loops = loops if loops else ([loop] if loop else [])
+        self._loop_assignment = loop_assignment
+        self._next_loop = itertools.count()
+        self._thread_loops = threading.local()
+        self._warm_up_seconds: Optional[float] = None
+        # Connectors for the extra loops, as a connector is bound to its loop
+        self._loop_connectors: dict[asyncio.AbstractEventLoop, AsyncConnector] = {}
+        self._shutdown_hooks: list[weakref.WeakMethod] = []
 
     @classmethod
     def __start_background_loop(
@@ -143,15 +440,11 @@ class AlloyDBEngine:
         password: Optional[str] = None,
         ip_type: Union[str, IPTypes] = IPTypes.PUBLIC,
         iam_account_email: Optional[str] = None,
+        loops: int = 1,
+        loop_assignment: str = "affinity",
+        **pool_options: Any,
     ) -> Future:
-        # Running a loop in a background thread allows us to support
-        # async methods from non-async environments
-        if cls._default_loop is None:
-            cls._default_loop = asyncio.new_event_loop()
-            cls._default_thread = Thread(
-                target=cls._default_loop.run_forever, daemon=True
-            )
-            cls._default_thread.start()
+        background_loops = cls._background_loops(loops)
         coro = cls._create(
             project_id,
             region,
@@ -164,9 +457,37 @@ class AlloyDBEngine:
             loop=cls._default_loop,
             thread=cls._default_thread,
             iam_account_email=iam_account_email,
+            loops=background_loops,
+            loop_assignment=loop_assignment,
+            **pool_options,
         )
         return asyncio.run_coroutine_threadsafe(coro, cls._default_loop)
 
+    @classmethod
+    def _background_loops(cls, count: int = 1) -> list[asyncio.AbstractEventLoop]:
+        """Start, if needed, and return `count` background loops, the default loop first.
+
+        Raises:
+            ValueError: If `count` is less than 1.
+        """
+        if count < 1:
+            raise ValueError("loops must be at least 1.")
+        with cls._loops_lock:
+            # Running a loop in a background thread allows us to support
+            # async methods from non-async environments
+            if cls._default_loop is None:
+                cls._default_loop = asyncio.new_event_loop()
+                cls._default_thread = Thread(
+                    target=cls._default_loop.run_forever, daemon=True
+                )
+                cls._default_thread.start()
+            while len(cls._extra_loops) < count - 1:
+                loop = asyncio.new_event_loop()
+                thread = Thread(target=loop.run_forever, daemon=True)
+                thread.start()
+                cls._extra_loops.append((loop, thread))
+        return [cls._default_loop] + [loop for loop, _ in cls._extra_loops[: count - 1]]
+
     @classmethod
     def from_instance(
         cls: type[AlloyDBEngine],
@@ -179,6 +500,17 @@ class AlloyDBEngine:
         password: Optional[str] = None,
         ip_type: Union[str, IPTypes] = IPTypes.PUBLIC,
         iam_account_email: Optional[str] = None,
+        loops: int = 1,
+        loop_assignment: str = "affinity",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        warm_connections: int = 0,
+        read_instances: Optional[list[str]] = None,
+        reader_routing: str = "round_robin",
+        read_your_writes: float = 0.0,
+        binary_vector_encoding: bool = False,
     ) -> AlloyDBEngine:
         """Create an AlloyDBEngine from an AlloyDB instance.
 
@@ -192,6 +524,22 @@ class AlloyDBEngine:
             password (Optional[str]): Cloud AlloyDB user password. Defaults to None.
             ip_type (Union[str, IPTypes], optional): IP address type. Defaults to IPTypes.PUBLIC.
             iam_account_email (Optional[str], optional): IAM service account email. Defaults to None.
+            loops (int): Number of background event loops that run the engine's coroutines, each with its own connection pool. More loops let sync calls from many threads run in parallel. Defaults to 1.
+            loop_assignment (str): How calling threads are assigned to loops: "affinity" maps each thread to a loop by its thread id, "round_robin" assigns threads to loops in turn on their first call. A thread always uses the same loop (OneOf: affinity, round_robin). Defaults to "affinity".
+            pool_size (int): Number of connections kept open in the pool, per loop. Defaults to 5.
+            max_overflow (int): Number of connections opened beyond `pool_size` under load, per loop. Defaults to 10.
+            pool_recycle (int): Seconds after which a pooled connection is replaced, or -1 to keep connections. Defaults to -1.
+            pool_pre_ping (bool): Whether to test pooled connections before handing them out. Defaults to False.
+            warm_connections (int): Number of connections to open concurrently before returning, per loop, so that the first requests do not pay for connection handshakes. The time it took is available as `warm_up_seconds`. Defaults to 0.
+            read_instances (Optional[list[str]]): Names of read pool instances of the cluster. The stores' read-only methods, such as queries and gets, run on them while writes run on `instance`. Defaults to None.
+            reader_routing (str): How reads are spread over the read instances: "round_robin" takes them in turn, "least_loaded" takes the one with the fewest connections in use (OneOf: round_robin, least_loaded). Defaults to "round_robin".
+            read_your_writes (float): Seconds after a write during which reads run on `instance`, so that they see the write despite replication lag. Defaults to 0.
+            binary_vector_encoding (bool): Whether connections send and receive embeddings in the pgvector binary format instead of text. The codec is registered when each connection is opened, which requires the vector extension to exist. Defaults to False.
+
+        Raises:
+            ValueError: If `loops` is less than 1 or `loop_assignment` is not supported.
+            ValueError: If `warm_connections` is negative or greater than `pool_size`.
+            ValueError: If `reader_routing` is not supported or `read_your_writes` is negative.
 
         Returns:
             AlloyDBEngine: A newly created AlloyDBEngine instance.
@@ -206,6 +554,17 @@ class AlloyDBEngine:
             password,
             ip_type,
             iam_account_email=iam_account_email,
+            loops=loops,
+            loop_assignment=loop_assignment,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            warm_connections=warm_connections,
+            read_instances=read_instances,
+            reader_routing=reader_routing,
+            read_your_writes=read_your_writes,
+            binary_vector_encoding=binary_vector_encoding,
         )
         return future.result()
 
@@ -223,6 +582,17 @@ class AlloyDBEngine:
         loop: Optional[asyncio.AbstractEventLoop] = None,
         thread: Optional[Thread] = None,
         iam_account_email: Optional[str] = None,
+        loops: Optional[list[asyncio.AbstractEventLoop]] = None,
+        loop_assignment: str = "affinity",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        warm_connections: int = 0,
+        read_instances: Optional[list[str]] = None,
+        reader_routing: str = "round_robin",
+        read_your_writes: float = 0.0,
+        binary_vector_encoding: bool = False,
     ) -> AlloyDBEngine:
         """Create an AlloyDBEngine from an AlloyDB instance.
 
@@ -238,9 +608,23 @@ class AlloyDBEngine:
             loop (Optional[asyncio.AbstractEventLoop]): Async event loop used to create the engine.
             thread (Optional[Thread]): Thread used to create the engine async.
             iam_account_email (Optional[str]): IAM service account email.
+            loops (Optional[list[asyncio.AbstractEventLoop]]): Background loops to run coroutines on. Defaults to None, for `loop` only.
+            loop_assignment (str): How calling threads are assigned to `loops`. Defaults to "affinity".
+            pool_size (int): Number of connections kept open in the pool, per loop. Defaults to 5.
+            max_overflow (int): Number of connections opened beyond `pool_size` under load, per loop. Defaults to 10.
+            pool_recycle (int): Seconds after which a pooled connection is replaced, or -1 to keep connections. Defaults to -1.
+            pool_pre_ping (bool): Whether to test pooled connections before handing them out. Defaults to False.
+            warm_connections (int): Number of connections to open concurrently before returning, per loop. Defaults to 0.
+            read_instances (Optional[list[str]]): Names of read pool instances for the stores' read-only methods. Defaults to None.
+            reader_routing (str): How reads are spread over the read instances. Defaults to "round_robin".
+            read_your_writes (float): Seconds after a write during which reads run on `instance`. Defaults to 0.
+            binary_vector_encoding (bool): Whether connections send and receive embeddings in the pgvector binary format. Defaults to False.
 
         Raises:
             ValueError: Raises error if only one of 'user' or 'password' is specified.
+            ValueError: If `loop_assignment` is not supported.
+            ValueError: If `warm_connections` is negative or greater than `pool_size`.
+            ValueError: If `reader_routing` is not supported or `read_your_writes` is negative.
 
         Returns:
             AlloyDBEngine: A newly created AlloyDBEngine instance.
@@ -253,10 +637,23 @@ class AlloyDBEngine:
                 "authentication or neither for IAM DB authentication."
             )
 
+        if loop_assignment not in LOOP_ASSIGNMENTS:
+            raise ValueError(
+                f"loop_assignment must be one of {LOOP_ASSIGNMENTS}, got '{loop_assignment}'."
+            )
+        _validate_read_routing(reader_routing, read_your_writes)
+        # Connections beyond pool_size are closed when returned, so they cannot be warmed
+        if warm_connections < 0 or warm_connections > pool_size:
+            raise ValueError(
+                f"warm_connections must be between 0 and pool_size ({pool_size})."
+            )
+
         if cls._connector is None:
             cls._connector = AsyncConnector(
                 user_agent=USER_AGENT, refresh_strategy=RefreshStrategy.LAZY
             )
+        connector_loop = asyncio.get_running_loop()
+        loop_connectors: dict[asyncio.AbstractEventLoop, AsyncConnector] = {}
 
         # if user and password are given, use basic auth
         if user and password:
@@ -274,24 +671,61 @@ class AlloyDBEngine:
                 )
                 db_user = await _get_iam_principal_email(credentials)
 
-        # anonymous function to be used for SQLAlchemy 'creator' argument
-        async def getconn() -> asyncpg.Connection:
-            conn = await cls._connector.connect(  # type: ignore
-                f"projects/{project_id}/locations/{region}/clusters/{cluster}/instances/{instance}",
-                "asyncpg",
-                user=db_user,
-                password=password,
-                db=database,
-                enable_iam_auth=enable_iam_auth,
-                ip_type=ip_type,
-            )
-            return conn
-
-        engine = create_async_engine(
-            "postgresql+asyncpg://",
-            async_creator=getconn,
+        def create_pool(instance: str) -> Any:
+            # anonymous function to be used for SQLAlchemy 'creator' argument
+            async def getconn() -> asyncpg.Connection:
+                connector = cls._connector
+                loop = asyncio.get_running_loop()
+                if loop is not connector_loop:
+                    connector = loop_connectors.get(loop)
+                    if connector is None:
+                        connector = loop_connectors[loop] = AsyncConnector(
+                            user_agent=USER_AGENT,
+                            refresh_strategy=RefreshStrategy.LAZY,
+                        )
+                conn = await connector.connect(  # type: ignore
+                    f"projects/{project_id}/locations/{region}/clusters/{cluster}/instances/{instance}",
+                    "asyncpg",
+                    user=db_user,
+                    password=password,
+                    db=database,
+                    enable_iam_auth=enable_iam_auth,
+                    ip_type=ip_type,
+                )
+                return conn
+
+            def create_engine() -> AsyncEngine:
+                engine = create_async_engine(
+                    "postgresql+asyncpg://",
+                    async_creator=getconn,
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    pool_recycle=pool_recycle,
+                    pool_pre_ping=pool_pre_ping,
+                )
+                if binary_vector_encoding:
+                    _register_vector_codec(engine)
+                return engine
+
+            if loops and len(loops) > 1:
+                return _LoopShardedEngine(create_engine)
+            return create_engine()
+
+        alloydb_engine = cls(
+            cls.__create_key,
+            create_pool(instance),
+            loop,
+            thread,
+            loops,
+            loop_assignment,
+            [create_pool(read_instance) for read_instance in read_instances or []],
+            reader_routing,
+            read_your_writes,
         )
-        return cls(cls.__create_key, engine, loop, thread)
+        alloydb_engine._loop_connectors = loop_connectors
+        if warm_connections:
+            await alloydb_engine.awarm_up(warm_connections)
+        return alloydb_engine
 
     @classmethod
     async def afrom_instance(
@@ -305,6 +739,17 @@ class AlloyDBEngine:
         password: Optional[str] = None,
         ip_type: Union[str, IPTypes] = IPTypes.PUBLIC,
         iam_account_email: Optional[str] = None,
+        loops: int = 1,
+        loop_assignment: str = "affinity",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        warm_connections: int = 0,
+        read_instances: Optional[list[str]] = None,
+        reader_routing: str = "round_robin",
+        read_your_writes: float = 0.0,
+        binary_vector_encoding: bool = False,
     ) -> AlloyDBEngine:
         """Create an AlloyDBEngine from an AlloyDB instance.
 
@@ -318,6 +763,22 @@ class AlloyDBEngine:
             password (Optional[str], optional): Cloud AlloyDB user password. Defaults to None.
             ip_type (Union[str, IPTypes], optional): IP address type. Defaults to IPTypes.PUBLIC.
             iam_account_email (Optional[str], optional): IAM service account email. Defaults to None.
+            loops (int): Number of background event loops that run the engine's coroutines, each with its own connection pool. More loops let sync calls from many threads run in parallel. Defaults to 1.
+            loop_assignment (str): How calling threads are assigned to loops: "affinity" maps each thread to a loop by its thread id, "round_robin" assigns threads to loops in turn on their first call. A thread always uses the same loop (OneOf: affinity, round_robin). Defaults to "affinity".
+            pool_size (int): Number of connections kept open in the pool, per loop. Defaults to 5.
+            max_overflow (int): Number of connections opened beyond `pool_size` under load, per loop. Defaults to 10.
+            pool_recycle (int): Seconds after which a pooled connection is replaced, or -1 to keep connections. Defaults to -1.
+            pool_pre_ping (bool): Whether to test pooled connections before handing them out. Defaults to False.
+            warm_connections (int): Number of connections to open concurrently before returning, per loop, so that the first requests do not pay for connection handshakes. The time it took is available as `warm_up_seconds`. Defaults to 0.
+            read_instances (Optional[list[str]]): Names of read pool instances of the cluster. The stores' read-only methods, such as queries and gets, run on them while writes run on `instance`. Defaults to None.
+            reader_routing (str): How reads are spread over the read instances: "round_robin" takes them in turn, "least_loaded" takes the one with the fewest connections in use (OneOf: round_robin, least_loaded). Defaults to "round_robin".
+            read_your_writes (float): Seconds after a write during which reads run on `instance`, so that they see the write despite replication lag. Defaults to 0.
+            binary_vector_encoding (bool): Whether connections send and receive embeddings in the pgvector binary format instead of text. The codec is registered when each connection is opened, which requires the vector extension to exist. Defaults to False.
+
+        Raises:
+            ValueError: If `loops` is less than 1 or `loop_assignment` is not supported.
+            ValueError: If `warm_connections` is negative or greater than `pool_size`.
+            ValueError: If `reader_routing` is not supported or `read_your_writes` is negative.
 
         Returns:
             AlloyDBEngine: A newly created AlloyDBEngine instance.
@@ -332,6 +793,17 @@ class AlloyDBEngine:
             password,
             ip_type,
             iam_account_email=iam_account_email,
+            loops=loops,
+            loop_assignment=loop_assignment,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            warm_connections=warm_connections,
+            read_instances=read_instances,
+            reader_routing=reader_routing,
+            read_your_writes=read_your_writes,
+            binary_vector_encoding=binary_vector_encoding,
         )
         return await asyncio.wrap_future(future)
 
@@ -340,53 +812,111 @@ class AlloyDBEngine:
         cls: type[AlloyDBEngine],
         engine: AsyncEngine,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        binary_vector_encoding: bool = False,
     ) -> AlloyDBEngine:
-        """Create an AlloyDBEngine instance from an AsyncEngine."""
+        """Create an AlloyDBEngine instance from an AsyncEngine.
+
+        With `binary_vector_encoding`, the pgvector binary codec is registered
+        on the connections `engine` opens from now on, so it is best set on a
+        new engine.
+        """
+        if binary_vector_encoding:
+            _register_vector_codec(engine)
         return cls(cls.__create_key, engine, loop, None)
 
     @classmethod
     def from_connection_string(
         cls,
         url: Union[str | URL],
+        loops: int = 1,
+        loop_assignment: str = "affinity",
+        reader_urls: Optional[list[Union[str, URL]]] = None,
+        reader_routing: str = "round_robin",
+        read_your_writes: float = 0.0,
+        binary_vector_encoding: bool = False,
         **kwargs: Any,
     ) -> AlloyDBEngine:
         """Create an AlloyDBEngine instance from arguments
 
         Args:
             url (Optional[str]): the URL used to connect to a database. Use url or set other arguments.
+            loops (int): Number of background event loops that run the engine's coroutines, each with its own connection pool. Defaults to 1.
+            loop_assignment (str): How calling threads are assigned to loops (OneOf: affinity, round_robin). Defaults to "affinity".
+            reader_urls (Optional[list[Union[str, URL]]]): URLs of read replicas for the stores' read-only methods, connected to with the same `kwargs`. Defaults to None.
+            reader_routing (str): How reads are spread over the replicas (OneOf: round_robin, least_loaded). Defaults to "round_robin".
+            read_your_writes (float): Seconds after a write during which reads go to `url`. Defaults to 0.
+            binary_vector_encoding (bool): Whether connections send and receive embeddings in the pgvector binary format instead of text. Requires the vector extension to exist. Defaults to False.
 
         Raises:
             ValueError: If not all database url arguments are specified
+            ValueError: If `loops` is less than 1 or `loop_assignment` is not supported.
+            ValueError: If `reader_routing` is not supported or `read_your_writes` is negative.
 
         Returns:
             AlloyDBEngine
         """
-        # Running a loop in a background thread allows us to support
-        # async methods from non-async environments
-        if cls._default_loop is None:
-            cls._default_loop = asyncio.new_event_loop()
-            cls._default_thread = Thread(
-                target=cls._default_loop.run_forever, daemon=True
+        if loop_assignment not in LOOP_ASSIGNMENTS:
+            raise ValueError(
+                f"loop_assignment must be one of {LOOP_ASSIGNMENTS}, got '{loop_assignment}'."
             )
-            cls._default_thread.start()
+        _validate_read_routing(reader_routing, read_your_writes)
+        background_loops = cls._background_loops(loops)
 
         driver = "postgresql+asyncpg"
-        if (isinstance(url, str) and not url.startswith(driver)) or (
-            isinstance(url, URL) and url.drivername != driver
-        ):
-            raise ValueError("Driver must be type 'postgresql+asyncpg'")
+        for pool_url in [url, *(reader_urls or [])]:
+            if (isinstance(pool_url, str) and not pool_url.startswith(driver)) or (
+                isinstance(pool_url, URL) and pool_url.drivername != driver
+            ):
+                raise ValueError("Driver must be type 'postgresql+asyncpg'")
+
+        def create_pool(pool_url: Union[str, URL]) -> Any:
+            def create_engine() -> AsyncEngine:
+                engine = create_async_engine(pool_url, **kwargs)
+                if binary_vector_encoding:
+                    _register_vector_codec(engine)
+                return engine
+
+            if loops > 1:
+                return _LoopShardedEngine(create_engine)
+            return create_engine()
+
+        return cls(
+            cls.__create_key,
+            create_pool(url),
+            cls._default_loop,
+            cls._default_thread,
+            background_loops,
+            loop_assignment,
+            [create_pool(reader_url) for reader_url in reader_urls or []],
+            reader_routing,
+            read_your_writes,
+        )
 
-        engine = create_async_engine(url, **kwargs)
-        return cls(cls.__create_key, engine, cls._default_loop, cls._default_thread)
+    def __thread_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background loop assigned to the calling thread."""
+        if len(self._loops) == 1:
+            return self._loop  # type: ignore
+        # A thread keeps its loop, so that async iterators and connections
+        # opened by earlier calls stay on the loop they are bound to.
+        if self._loop_assignment == "affinity":
+            return self._loops[threading.get_native_id() % len(self._loops)]
+        loop = getattr(self._thread_loops, "loop", None)
+        if loop is None:
+            loop = self._loops[next(self._next_loop) % len(self._loops)]
+            self._thread_loops.loop = loop
+        return loop
 
     async def _run_as_async(self, coro: Awaitable[T]) -> T:
         """Run an async coroutine asynchronously"""
         # If a loop has not been provided, attempt to run in current thread
         if not self._loop:
             return await coro
+        # Coroutines already running on a background loop continue on it
+        if len(self._loops) > 1 and asyncio.get_running_loop() in self._loops:
+            return await coro
         # Otherwise, run in the background thread
         return await asyncio.wrap_future(
-            asyncio.run_coroutine_threadsafe(coro, self._loop)  # type: ignore
+            asyncio.run_coroutine_threadsafe(coro, self.__thread_loop())  # type: ignore
         )
 
     def _run_as_sync(self, coro: Awaitable[T]) -> T:
@@ -395,11 +925,103 @@ class AlloyDBEngine:
             raise Exception(
                 "Engine was initialized without a background loop and cannot call sync methods."
             )
-        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()  # type: ignore
+        return asyncio.run_coroutine_threadsafe(coro, self.__thread_loop()).result()  # type: ignore
+
+    @property
+    def warm_up_seconds(self) -> Optional[float]:
+        """Seconds the last warm-up took, or None if the pool was never warmed."""
+        return self._warm_up_seconds
+
+    async def __aopen_connections(self, connections: int) -> None:
+        """Open `connections` connections of the running loop's pools at once and return them to them."""
+        pools = (
+            self._read_pool.pools()
+            if isinstance(self._read_pool, _ReadRouter)
+            else [self._pool]
+        )
+        async with AsyncExitStack() as stack:
+            await asyncio.gather(
+                *(
+                    stack.enter_async_context(pool.connect())
+                    for pool in pools
+                    for _ in range(connections)
+                )
+            )
+
+    async def awarm_up(self, connections: int) -> float:
+        """Open connections concurrently so that they are pooled before the first requests.
+
+        With several background loops, the pool of every loop is warmed, and
+        with read replicas, the reader pools are warmed as well.
+
+        Args:
+            connections (int): Number of connections to open, per loop. Should
+                not exceed the pool size, as overflow connections are closed
+                when returned to the pool.
+
+        Raises:
+            ValueError: If `connections` is less than 1.
+
+        Returns:
+            float: The number of seconds the warm-up took.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1.")
+        start = time.monotonic()
+        if len(self._loops) > 1:
+            await asyncio.gather(
+                *(
+                    asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(
+                            self.__aopen_connections(connections), loop
+                        )
+                    )
+                    for loop in self._loops
+                )
+            )
+        else:
+            await self._run_as_async(self.__aopen_connections(connections))
+        self._warm_up_seconds = time.monotonic() - start
+        return self._warm_up_seconds
+
+    def warm_up(self, connections: int) -> float:
+        """Open connections concurrently so that they are pooled before the first requests.
+
+        Args:
+            connections (int): Number of connections to open, per loop.
+
+        Raises:
+            ValueError: If `connections` is less than 1.
+
+        Returns:
+            float: The number of seconds the warm-up took.
+        """
+        return self._run_as_sync(self.awarm_up(connections))
+
+    def _register_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Register a bound coroutine method to await when the engine is closed.
+
+        The hook is held weakly, so registering it does not keep its owner alive.
+        """
+        self._shutdown_hooks.append(weakref.WeakMethod(hook))
 
     async def close(self) -> None:
-        """Dispose of connection pool"""
+        """Run the shutdown hooks, dispose of connection pool and close the extra loops' connectors"""
+        hooks, self._shutdown_hooks = self._shutdown_hooks, []
+        for ref in hooks:
+            hook = ref()
+            if hook is not None:
+                await self._run_as_async(hook())
         await self._run_as_async(self._pool.dispose())
+        if self._read_pool is not self._pool:
+            await self._run_as_async(self._read_pool.dispose())
+        connectors = list(self._loop_connectors.items())
+        self._loop_connectors.clear()
+        for loop, connector in connectors:
+            if not loop.is_closed():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(connector.close(), loop)
+                )
 
     async def _ainit_doc_store_table(
         self,
@@ -673,6 +1295,7 @@ class AlloyDBEngine:
         table_name: str,
         schema_name: str = "public",
         overwrite_existing: bool = False,
+        incremental: bool = False,
     ) -> None:
         """
         Create an AlloyDB table to save Index metadata.
@@ -683,12 +1306,18 @@ class AlloyDBEngine:
                 Default: "public".
             overwrite_existing (bool): Whether to drop existing table.
                 Default: False.
+            incremental (bool): Whether to also create the "{table_name}_nodes"
+                table that stores the node mappings of IndexDict structs for
+                AlloyDBIndexStore's incremental mode. Default: False.
 
         Returns:
             None
         """
         if overwrite_existing:
             async with self._pool.connect() as conn:
+                await conn.execute(
+                    text(f'DROP TABLE IF EXISTS "{schema_name}"."{table_name}_nodes"')
+                )
                 await conn.execute(
                     text(f'DROP TABLE IF EXISTS "{schema_name}"."{table_name}"')
                 )
@@ -697,10 +1326,19 @@ class AlloyDBEngine:
         create_table_query = f"""CREATE TABLE "{schema_name}"."{table_name}"(
             index_id VARCHAR PRIMARY KEY,
             type VARCHAR NOT NULL,
-            index_data JSONB NOT NULL
+            index_data JSONB NOT NULL,
+            version BIGINT NOT NULL DEFAULT 1
+        );"""
+        create_nodes_table_query = f"""CREATE TABLE "{schema_name}"."{table_name}_nodes"(
+            index_id VARCHAR NOT NULL REFERENCES "{schema_name}"."{table_name}" (index_id) ON DELETE CASCADE,
+            vector_id VARCHAR NOT NULL,
+            node_id VARCHAR NOT NULL,
+            PRIMARY KEY (index_id, vector_id)
         );"""
         async with self._pool.connect() as conn:
             await conn.execute(text(create_table_query))
+            if incremental:
+                await conn.execute(text(create_nodes_table_query))
             await conn.commit()
 
     async def ainit_index_store_table(
@@ -708,6 +1346,7 @@ class AlloyDBEngine:
         table_name: str,
         schema_name: str = "public",
         overwrite_existing: bool = False,
+        incremental: bool = False,
     ) -> None:
         """
         Create an AlloyDB table to save Index metadata.
@@ -718,6 +1357,9 @@ class AlloyDBEngine:
                 Default: "public".
             overwrite_existing (bool): Whether to drop existing table.
                 Default: False.
+            incremental (bool): Whether to also create the "{table_name}_nodes"
+                table that stores the node mappings of IndexDict structs for
+                AlloyDBIndexStore's incremental mode. Default: False.
 
         Returns:
             None
@@ -727,6 +1369,7 @@ class AlloyDBEngine:
                 table_name,
                 schema_name,
                 overwrite_existing,
+                incremental,
             )
         )
 
@@ -735,6 +1378,7 @@ class AlloyDBEngine:
         table_name: str,
         schema_name: str = "public",
         overwrite_existing: bool = False,
+        incremental: bool = False,
     ) -> None:
         """
         Create an AlloyDB table to save Index metadata.
@@ -745,6 +1389,9 @@ class AlloyDBEngine:
                 Default: "public".
             overwrite_existing (bool): Whether to drop existing table.
                 Default: False.
+            incremental (bool): Whether to also create the "{table_name}_nodes"
+                table that stores the node mappings of IndexDict structs for
+                AlloyDBIndexStore's incremental mode. Default: False.
 
         Returns:
             None
@@ -754,6 +1401,7 @@ class AlloyDBEngine:
                 table_name,
                 schema_name,
                 overwrite_existing,
+                incremental,
             )
         )
 
@@ -762,6 +1410,7 @@ class AlloyDBEngine:
         table_name: str,
         schema_name: str = "public",
         overwrite_existing: bool = False,
+        composite_index: bool = False,
     ) -> None:
         """
         Create an AlloyDB table to save chat store.
@@ -772,6 +1421,10 @@ class AlloyDBEngine:
                 Default: "public".
             overwrite_existing (bool): Whether to drop existing table.
                 Default: False.
+            composite_index (bool): Whether to index the table on (key, id)
+                instead of (key), so reads of a key's messages in id order and
+                keyset pagination are served by the index alone.
+                Default: False.
 
         Returns:
             None
@@ -788,7 +1441,10 @@ class AlloyDBEngine:
             key VARCHAR NOT NULL,
             message JSON NOT NULL
         );"""
-        create_index_query = f"""CREATE INDEX "{table_name}_idx_key" ON "{schema_name}"."{table_name}" (key);"""
+        if composite_index:
+            create_index_query = f"""CREATE INDEX "{table_name}_idx_key_id" ON "{schema_name}"."{table_name}" (key, id);"""
+        else:
+            create_index_query = f"""CREATE INDEX "{table_name}_idx_key" ON "{schema_name}"."{table_name}" (key);"""
         async with self._pool.connect() as conn:
             await conn.execute(text(create_table_query))
             await conn.execute(text(create_index_query))
@@ -799,6 +1455,7 @@ class AlloyDBEngine:
         table_name: str,
         schema_name: str = "public",
         overwrite_existing: bool = False,
+        composite_index: bool = False,
     ) -> None:
         """
         Create an AlloyDB table to save chat store.
@@ -809,6 +1466,8 @@ class AlloyDBEngine:
                 Default: "public".
             overwrite_existing (bool): Whether to drop existing table.
                 Default: False.
+            composite_index (bool): Whether to index the table on (key, id)
+                instead of (key). Default: False.
 
         Returns:
             None
@@ -818,6 +1477,7 @@ class AlloyDBEngine:
                 table_name,
                 schema_name,
                 overwrite_existing,
+                composite_index,
             )
         )
 
@@ -826,6 +1486,7 @@ class AlloyDBEngine:
         table_name: str,
         schema_name: str = "public",
         overwrite_existing: bool = False,
+        composite_index: bool = False,
     ) -> None:
         """
         Create an AlloyDB table to save chat store.
@@ -836,6 +1497,8 @@ class AlloyDBEngine:
                 Default: "public".
             overwrite_existing (bool): Whether to drop existing table.
                 Default: False.
+            composite_index (bool): Whether to index the table on (key, id)
+                instead of (key). Default: False.
 
         Returns:
             None
@@ -845,6 +1508,7 @@ class AlloyDBEngine:
                 table_name,
                 schema_name,
                 overwrite_existing,
+                composite_index,
             )
         )
 
@@ -54,6 +54,8 @@ class AlloyDBIndexStore(BaseIndexStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
+        cache_index_structs: bool = False,
+        incremental: bool = False,
     ) -> AlloyDBIndexStore:
         """Create a new AlloyDBIndexStore instance.
 
@@ -61,14 +63,20 @@ class AlloyDBIndexStore(BaseIndexStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the index metadata.
             schema_name (str): The schema name where the table is located. Defaults to "public"
+            cache_index_structs (bool): Whether to keep the index structs in memory, revalidated against the table's `version` column on every read. Defaults to False.
+            incremental (bool): Whether to store the node mappings of IndexDict structs in the "{table_name}_nodes" table and write only the changed mappings. Defaults to False.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
+            ValueError: If `cache_index_structs` or `incremental` is set and the table has no `version` column.
+            ValueError: If `incremental` is set and the nodes table does not exist.
 
         Returns:
             AlloyDBIndexStore: A newly created instance of AlloyDBIndexStore.
         """
-        coro = AsyncAlloyDBIndexStore.create(engine, table_name, schema_name)
+        coro = AsyncAlloyDBIndexStore.create(
+            engine, table_name, schema_name, cache_index_structs, incremental
+        )
         index_store = await engine._run_as_async(coro)
         return cls(cls.__create_key, engine, index_store)
 
@@ -78,6 +86,8 @@ class AlloyDBIndexStore(BaseIndexStore):
         engine: AlloyDBEngine,
         table_name: str,
         schema_name: str = "public",
+        cache_index_structs: bool = False,
+        incremental: bool = False,
     ) -> AlloyDBIndexStore:
         """Create a new AlloyDBIndexStore sync instance.
 
@@ -85,14 +95,20 @@ class AlloyDBIndexStore(BaseIndexStore):
             engine (AlloyDBEngine): AlloyDB engine to use.
             table_name (str): Table name that stores the index metadata.
             schema_name (str): The schema name where the table is located. Defaults to "public"
+            cache_index_structs (bool): Whether to keep the index structs in memory, revalidated against the table's `version` column on every read. Defaults to False.
+            incremental (bool): Whether to store the node mappings of IndexDict structs in the "{table_name}_nodes" table and write only the changed mappings. Defaults to False.
 
         Raises:
             ValueError: If the table provided does not contain required schema.
+            ValueError: If `cache_index_structs` or `incremental` is set and the table has no `version` column.
+            ValueError: If `incremental` is set and the nodes table does not exist.
 
         Returns:
             AlloyDBIndexStore: A newly created instance of AlloyDBIndexStore.
         """
-        coro = AsyncAlloyDBIndexStore.create(engine, table_name, schema_name)
+        coro = AsyncAlloyDBIndexStore.create(
+            engine, table_name, schema_name, cache_index_structs, incremental
+        )
         index_store = engine._run_as_sync(coro)
         return cls(cls.__create_key, engine, index_store)
 
@@ -199,3 +215,7 @@ class AlloyDBIndexStore(BaseIndexStore):
         return self._engine._run_as_sync(
             self.__index_store.aget_index_struct(struct_id)
         )
+
+    def clear_cache(self) -> None:
+        """Drops the cached index structs."""
+        self.__index_store.clear_cache()
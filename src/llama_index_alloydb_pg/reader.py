@@ -14,13 +14,13 @@
 
 from __future__ import annotations
 
-from typing import AsyncIterable, Callable, Iterable, List, Optional
+from typing import Any, AsyncIterable, Callable, Iterable, List, Optional
 
 from llama_index.core.bridge.pydantic import ConfigDict
 from llama_index.core.readers.base import BasePydanticReader
 from llama_index.core.schema import Document
 
-from .async_reader import AsyncAlloyDBReader
+from .async_reader import DEFAULT_FETCH_SIZE, AsyncAlloyDBReader
 from .engine import AlloyDBEngine
 
 DEFAULT_METADATA_COL = "li_metadata"
@@ -71,6 +71,12 @@ class AlloyDBReader(BasePydanticReader):
         format: Optional[str] = None,
         formatter: Optional[Callable] = None,
         is_remote: bool = True,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        batch_formatter: Optional[Callable] = None,
+        json_encoder: Optional[Callable[[Any], str]] = None,
+        partitions: int = 1,
+        partition_column: Optional[str] = None,
+        ordered: bool = True,
     ) -> AlloyDBReader:
         """Asynchronously create an AlloyDBReader instance.
 
@@ -85,6 +91,12 @@ class AlloyDBReader(BasePydanticReader):
             format (Optional[str], optional): Format of page content (OneOf: text, csv, YAML, JSON). Defaults to 'text'.
             formatter (Optional[Callable], optional): A function to format page content (OneOf: format, formatter). Defaults to None.
             is_remote (Optional[bool]): Whether the data is loaded from a remote API or a local file.
+            fetch_size (int): Number of rows fetched from the server-side cursor at a time. Defaults to 1000.
+            batch_formatter (Optional[Callable], optional): A function to format the page content of a whole batch at once (OneOf: format, formatter, batch_formatter). It receives a dict of column name to the batch's values and the content columns, and returns one string per row. Defaults to None.
+            json_encoder (Optional[Callable[[Any], str]], optional): Function used to encode page content with the JSON format, such as a faster third-party encoder. Defaults to `json.dumps`.
+            partitions (int): Number of slices to read concurrently, each on its own pooled connection. Defaults to 1.
+            partition_column (Optional[str]): Numeric column (such as the primary key) to split the rows on by value range. Required to partition a `query`. Defaults to None, which splits `table_name` by ctid blocks.
+            ordered (bool): Whether partitioned reads yield the slices one after another in order, instead of as soon as any batch arrives. Defaults to True.
 
 
         Returns:
@@ -101,6 +113,12 @@ class AlloyDBReader(BasePydanticReader):
             format=format,
             formatter=formatter,
             is_remote=is_remote,
+            fetch_size=fetch_size,
+            batch_formatter=batch_formatter,
+            json_encoder=json_encoder,
+            partitions=partitions,
+            partition_column=partition_column,
+            ordered=ordered,
         )
         reader = await engine._run_as_async(coro)
         return cls(cls.__create_key, engine, reader, is_remote)
@@ -118,6 +136,12 @@ class AlloyDBReader(BasePydanticReader):
         format: Optional[str] = None,
         formatter: Optional[Callable] = None,
         is_remote: bool = True,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        batch_formatter: Optional[Callable] = None,
+        json_encoder: Optional[Callable[[Any], str]] = None,
+        partitions: int = 1,
+        partition_column: Optional[str] = None,
+        ordered: bool = True,
     ) -> AlloyDBReader:
         """Synchronously create an AlloyDBReader instance.
 
@@ -132,6 +156,12 @@ class AlloyDBReader(BasePydanticReader):
             format (Optional[str], optional): Format of page content (OneOf: text, csv, YAML, JSON). Defaults to 'text'.
             formatter (Optional[Callable], optional): A function to format page content (OneOf: format, formatter). Defaults to None.
             is_remote (Optional[bool]): Whether the data is loaded from a remote API or a local file.
+            fetch_size (int): Number of rows fetched from the server-side cursor at a time. Defaults to 1000.
+            batch_formatter (Optional[Callable], optional): A function to format the page content of a whole batch at once (OneOf: format, formatter, batch_formatter). It receives a dict of column name to the batch's values and the content columns, and returns one string per row. Defaults to None.
+            json_encoder (Optional[Callable[[Any], str]], optional): Function used to encode page content with the JSON format, such as a faster third-party encoder. Defaults to `json.dumps`.
+            partitions (int): Number of slices to read concurrently, each on its own pooled connection. Defaults to 1.
+            partition_column (Optional[str]): Numeric column (such as the primary key) to split the rows on by value range. Required to partition a `query`. Defaults to None, which splits `table_name` by ctid blocks.
+            ordered (bool): Whether partitioned reads yield the slices one after another in order, instead of as soon as any batch arrives. Defaults to True.
 
 
         Returns:
@@ -148,6 +178,12 @@ class AlloyDBReader(BasePydanticReader):
             format=format,
             formatter=formatter,
             is_remote=is_remote,
+            fetch_size=fetch_size,
+            batch_formatter=batch_formatter,
+            json_encoder=json_encoder,
+            partitions=partitions,
+            partition_column=partition_column,
+            ordered=ordered,
         )
         reader = engine._run_as_sync(coro)
         return cls(cls.__create_key, engine, reader, is_remote)
@@ -185,3 +221,23 @@ class AlloyDBReader(BasePydanticReader):
                 yield result
             except StopAsyncIteration:
                 break
+
+    async def alazy_load_batches(self) -> AsyncIterable[list[Document]]:
+        """Asynchronously load AlloyDB data in batches of up to `fetch_size` Documents."""
+        iterator = self.__reader.alazy_load_batches().__aiter__()
+        while True:
+            try:
+                result = await self._engine._run_as_async(iterator.__anext__())
+                yield result
+            except StopAsyncIteration:
+                break
+
+    def lazy_load_batches(self) -> Iterable[list[Document]]:
+        """Synchronously load AlloyDB data in batches of up to `fetch_size` Documents."""
+        iterator = self.__reader.alazy_load_batches().__aiter__()
+        while True:
+            try:
+                result = self._engine._run_as_sync(iterator.__anext__())
+                yield result
+            except StopAsyncIteration:
+                break
@@ -14,7 +14,16 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, Sequence
+import asyncio
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from llama_index.core.schema import BaseNode
 from llama_index.core.vector_stores.types import (
@@ -24,7 +33,11 @@ from llama_index.core.vector_stores.types import (
     VectorStoreQueryResult,
 )
 
-from .async_vector_store import AsyncAlloyDBVectorStore
+from .async_vector_store import (
+    DEFAULT_BULK_CHUNK_SIZE,
+    AsyncAlloyDBVectorStore,
+    BulkAddResult,
+)
 from .engine import AlloyDBEngine
 from .indexes import (
     DEFAULT_DISTANCE_STRATEGY,
@@ -220,6 +233,58 @@ class AlloyDBVectorStore(BasePydanticVectorStore):
         """Synchronously add nodes to the table."""
         return self._engine._run_as_sync(self.__vs.async_add(nodes, **add_kwargs))
 
+    async def async_add_bulk(
+        self,
+        nodes: Union[Iterable[BaseNode], AsyncIterable[BaseNode]],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> BulkAddResult:
+        """Asynchronously upsert a large stream of nodes using COPY.
+
+        An async iterable is consumed on the caller's event loop, so sources
+        bound to that loop can be used. Its nodes are handed to the engine's
+        loop one chunk at a time.
+        """
+        if not isinstance(nodes, AsyncIterable):
+            return await self._engine._run_as_async(
+                self.__vs.async_add_bulk(nodes, chunk_size)
+            )
+        caller_loop = asyncio.get_running_loop()
+        chunks = _achunks(nodes, chunk_size)
+
+        async def next_chunk() -> Optional[list[BaseNode]]:
+            return await anext(chunks, None)
+
+        async def handed_over() -> AsyncIterator[BaseNode]:
+            while True:
+                chunk = await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(next_chunk(), caller_loop)
+                )
+                if chunk is None:
+                    return
+                for node in chunk:
+                    yield node
+
+        try:
+            return await self._engine._run_as_async(
+                self.__vs.async_add_bulk(handed_over(), chunk_size)
+            )
+        finally:
+            await chunks.aclose()
+
+    def add_bulk(
+        self,
+        nodes: Iterable[BaseNode],
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+    ) -> BulkAddResult:
+        """Synchronously upsert a large stream of nodes using COPY.
+
+        Only a (sync) iterable is accepted, which is consumed on the engine's
+        background loop. Use `async_add_bulk` for async iterables.
+        """
+        if isinstance(nodes, AsyncIterable):
+            raise ValueError("add_bulk requires an Iterable, use async_add_bulk.")
+        return self._engine._run_as_sync(self.__vs.async_add_bulk(nodes, chunk_size))
+
     async def adelete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
         """Asynchronously delete nodes belonging to provided parent document from the table."""
         await self._engine._run_as_async(self.__vs.adelete(ref_doc_id, **delete_kwargs))
@@ -284,6 +349,20 @@ class AlloyDBVectorStore(BasePydanticVectorStore):
         """Synchronously query vector store."""
         return self._engine._run_as_sync(self.__vs.aquery(query, **kwargs))
 
+    async def aquery_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> list[VectorStoreQueryResult]:
+        """Asynchronously run several queries against the vector store in one round trip."""
+        return await self._engine._run_as_async(
+            self.__vs.aquery_batch(queries, **kwargs)
+        )
+
+    def query_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> list[VectorStoreQueryResult]:
+        """Synchronously run several queries against the vector store in one round trip."""
+        return self._engine._run_as_sync(self.__vs.aquery_batch(queries, **kwargs))
+
     async def aset_maintenance_work_mem(
         self, num_leaves: int, vector_size: int
     ) -> None:
@@ -357,3 +436,17 @@ class AlloyDBVectorStore(BasePydanticVectorStore):
     ) -> bool:
         """Check if index exists in the table."""
         return self._engine._run_as_sync(self.__vs.is_valid_index(index_name))
+
+
+async def _achunks(
+    nodes: AsyncIterable[BaseNode], chunk_size: int
+) -> AsyncIterator[list[BaseNode]]:
+    """Group an async iterable of nodes into lists of chunk_size."""
+    chunk: list[BaseNode] = []
+    async for node in nodes:
+        chunk.append(node)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,100 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of updating document hashes one by one and in one statement.
+
+Updates the hashes of `--hashes` documents in a scratch document store table,
+once with one `aset_document_hash` call per document and once with a single
+`aset_document_hashes` call, and prints the time each took. It runs against
+the AlloyDB instance of the tests, configured with the same environment
+variables (PROJECT_ID, REGION, CLUSTER_ID, INSTANCE_ID, DATABASE_ID and,
+optionally, DB_USER and DB_PASSWORD):
+
+    python tests/benchmark_document_hashes.py --hashes 10000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+from sqlalchemy import text
+
+from llama_index_alloydb_pg import AlloyDBEngine
+from llama_index_alloydb_pg.async_document_store import AsyncAlloyDBDocumentStore
+
+
+def get_env_var(key: str, desc: str) -> str:
+    v = os.environ.get(key)
+    if v is None:
+        raise ValueError(f"Must set env var {key} to: {desc}")
+    return v
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hashes", type=int, default=10000)
+    args = parser.parse_args()
+
+    engine = await AlloyDBEngine.afrom_instance(
+        project_id=get_env_var("PROJECT_ID", "project id for google cloud"),
+        region=get_env_var("REGION", "region for AlloyDB instance"),
+        cluster=get_env_var("CLUSTER_ID", "cluster for AlloyDB"),
+        instance=get_env_var("INSTANCE_ID", "instance for AlloyDB"),
+        database=get_env_var("DATABASE_ID", "database name on AlloyDB instance"),
+        user=os.environ.get("DB_USER"),
+        password=os.environ.get("DB_PASSWORD"),
+    )
+    table_name = "document_store_" + str(uuid.uuid4())
+    await engine._ainit_doc_store_table(table_name=table_name)
+    try:
+        doc_store = await AsyncAlloyDBDocumentStore.create(
+            engine=engine, table_name=table_name
+        )
+        ids = [f"doc_{i}" for i in range(args.hashes)]
+        # Both runs update existing rows, as when re-ingesting changed documents
+        await doc_store.aset_document_hashes({id: "initial" for id in ids})
+
+        start = time.perf_counter()
+        for id in ids:
+            await doc_store.aset_document_hash(id, "one_by_one")
+        one_by_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await doc_store.aset_document_hashes({id: "bulk" for id in ids})
+        bulk = time.perf_counter() - start
+
+        async with engine._pool.connect() as conn:
+            result = await conn.execute(
+                text(
+                    f"""SELECT count(*) FROM "public"."{table_name}" WHERE doc_hash = 'bulk';"""
+                )
+            )
+            assert result.scalar() == args.hashes
+    finally:
+        async with engine._pool.connect() as conn:
+            await conn.execute(text(f'DROP TABLE IF EXISTS "public"."{table_name}"'))
+            await conn.commit()
+        await engine.close()
+
+    print(f"{args.hashes} hash updates")
+    print(f"{'method':<12}{'seconds':>10}{'updates/s':>14}")
+    for name, seconds in [("one by one", one_by_one), ("bulk", bulk)]:
+        print(f"{name:<12}{seconds:>10.3f}{args.hashes / seconds:>14,.0f}")
+    print(f"speedup {one_by_one / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the reader's column discovery on a large table.
+
+Fills a scratch table with `--rows` rows, then times reading its column names
+by executing the query, as `AsyncAlloyDBReader.create` used to, and creating
+a reader, which only describes the query. It runs against the AlloyDB
+instance of the tests, configured with the same environment variables
+(PROJECT_ID, REGION, CLUSTER_ID, INSTANCE_ID, DATABASE_ID and, optionally,
+DB_USER and DB_PASSWORD):
+
+    python tests/benchmark_reader_create.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import text
+
+from llama_index_alloydb_pg import AlloyDBEngine
+from llama_index_alloydb_pg.async_reader import AsyncAlloyDBReader
+
+
+def get_env_var(key: str, desc: str) -> str:
+    v = os.environ.get(key)
+    if v is None:
+        raise ValueError(f"Must set env var {key} to: {desc}")
+    return v
+
+
+async def best_seconds(run: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Best wall time of `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = await AlloyDBEngine.afrom_instance(
+        project_id=get_env_var("PROJECT_ID", "project id for google cloud"),
+        region=get_env_var("REGION", "region for AlloyDB instance"),
+        cluster=get_env_var("CLUSTER_ID", "cluster for AlloyDB"),
+        instance=get_env_var("INSTANCE_ID", "instance for AlloyDB"),
+        database=get_env_var("DATABASE_ID", "database name on AlloyDB instance"),
+        user=os.environ.get("DB_USER"),
+        password=os.environ.get("DB_PASSWORD"),
+    )
+    table_name = "reader_" + str(uuid.uuid4())
+    query = f'SELECT * FROM "public"."{table_name}"'
+    try:
+        async with engine._pool.connect() as conn:
+            await conn.execute(
+                text(
+                    f"""CREATE TABLE "public"."{table_name}" AS
+                    SELECT i AS id, md5(i::text) AS content, i % 100 AS category
+                    FROM generate_series(1, :rows) AS i;"""
+                ),
+                {"rows": args.rows},
+            )
+            await conn.commit()
+
+        async def execute_query() -> None:
+            async with engine._pool.connect() as conn:
+                result = await conn.execute(text(query))
+                result.keys()
+
+        async def create_reader() -> None:
+            await AsyncAlloyDBReader.create(engine, table_name=table_name)
+
+        executed = await best_seconds(execute_query, args.repeat)
+        described = await best_seconds(create_reader, args.repeat)
+    finally:
+        async with engine._pool.connect() as conn:
+            await conn.execute(text(f'DROP TABLE IF EXISTS "public"."{table_name}"'))
+            await conn.commit()
+        await engine.close()
+
+    print(f"{args.rows} rows")
+    print(f"{'columns from':<18}{'seconds':>10}")
+    print(f"{'executed query':<18}{executed:>10.3f}")
+    print(f"{'reader create':<18}{described:>10.3f}")
+    print(f"speedup {executed / described:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,173 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark of the reader's per-row and batch document formatting.
+
+Formats an in-memory chunk of rows with each built-in format, once per row
+with the formatting the reader used before batching and once per batch, and
+prints the throughput in rows per second. No database is needed:
+
+    python tests/benchmark_reader_formatters.py --rows 20000 --columns 20
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Optional
+
+from llama_index.core.schema import Document
+
+from llama_index_alloydb_pg.async_reader import (
+    _parse_docs_from_columns,
+    csv_batch_formatter,
+    json_batch_formatter,
+    text_batch_formatter,
+    yaml_batch_formatter,
+)
+
+METADATA_JSON_COLUMN = "li_metadata"
+
+
+def text_formatter(row: dict, content_columns: list[str]) -> str:
+    return " ".join(str(row[column]) for column in content_columns if column in row)
+
+
+def csv_formatter(row: dict, content_columns: list[str]) -> str:
+    return ", ".join(str(row[column]) for column in content_columns if column in row)
+
+
+def yaml_formatter(row: dict, content_columns: list[str]) -> str:
+    return "\n".join(
+        f"{column}: {str(row[column])}" for column in content_columns if column in row
+    )
+
+
+def json_formatter(row: dict, content_columns: list[str]) -> str:
+    dictionary = {}
+    for column in content_columns:
+        if column in row:
+            dictionary[column] = row[column]
+    return json.dumps(dictionary)
+
+
+def parse_doc_from_row(
+    content_columns: list[str],
+    metadata_columns: list[str],
+    row: dict,
+    formatter: Callable,
+    metadata_json_column: Optional[str],
+) -> Document:
+    """Per-row baseline: parse a single row into a document."""
+    text = formatter(row, content_columns)
+    metadata: dict[str, Any] = {}
+    if metadata_json_column and row.get(metadata_json_column):
+        for k, v in row[metadata_json_column].items():
+            metadata[k] = v
+    for column in metadata_columns:
+        if column in row and column != metadata_json_column:
+            metadata[column] = row[column]
+    return Document(text=text, extra_info=metadata)
+
+
+FORMATTERS = [
+    ("text", text_formatter, text_batch_formatter),
+    ("csv", csv_formatter, csv_batch_formatter),
+    ("yaml", yaml_formatter, yaml_batch_formatter),
+    ("json", json_formatter, json_batch_formatter),
+]
+
+
+def rows_per_second(rows: int, run: Callable[[], Any], repeat: int) -> float:
+    """Best throughput of `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--content-columns", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    column_names = [f"col_{i}" for i in range(args.columns)]
+    content_columns = column_names[: args.content_columns]
+    metadata_columns = column_names[args.content_columns :]
+    rows = [
+        {
+            name: (i * j if j % 2 else f"value_{i}_{j}")
+            for j, name in enumerate(column_names)
+        }
+        | {METADATA_JSON_COLUMN: {"row": i}}
+        for i in range(args.rows)
+    ]
+    columns = {name: [row[name] for row in rows] for name in rows[0]}
+
+    print(f"{args.rows} rows, {args.columns} columns ({args.content_columns} content)")
+    print(f"{'format':<8}{'step':<12}{'per row/s':>14}{'batch/s':>14}{'speedup':>10}")
+    for name, row_formatter, batch_formatter in FORMATTERS:
+        results = {
+            "content": (
+                rows_per_second(
+                    args.rows,
+                    lambda: [row_formatter(row, content_columns) for row in rows],
+                    args.repeat,
+                ),
+                rows_per_second(
+                    args.rows,
+                    lambda: batch_formatter(columns, content_columns),
+                    args.repeat,
+                ),
+            ),
+            "documents": (
+                rows_per_second(
+                    args.rows,
+                    lambda: [
+                        parse_doc_from_row(
+                            content_columns,
+                            metadata_columns,
+                            row,
+                            row_formatter,
+                            METADATA_JSON_COLUMN,
+                        )
+                        for row in rows
+                    ],
+                    args.repeat,
+                ),
+                rows_per_second(
+                    args.rows,
+                    lambda: _parse_docs_from_columns(
+                        content_columns,
+                        metadata_columns,
+                        columns,
+                        batch_formatter,
+                        METADATA_JSON_COLUMN,
+                    ),
+                    args.repeat,
+                ),
+            ),
+        }
+        for step, (per_row, batch) in results.items():
+            print(
+                f"{name:<8}{step:<12}{per_row:>14,.0f}{batch:>14,.0f}{batch / per_row:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark of encoding embeddings as pgvector text literals and binary Vectors.
+
+Encodes in-memory embeddings the way a connection without the vector codec
+sends them (a UTF-8 text literal) and the way a connection of an engine with
+`binary_vector_encoding` sends them (pgvector's binary format), and prints the
+wire size and the encoding throughput. No database is needed:
+
+    python tests/benchmark_vector_encoding.py --vectors 10000 --dimensions 768
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from pgvector import Vector  # type: ignore
+
+
+def encode_text(embedding: list[float]) -> bytes:
+    """Text literal, as sent without the vector codec."""
+    return str(embedding).encode()
+
+
+def encode_binary(embedding: list[float]) -> bytes:
+    """Binary format, as sent by the pgvector codec."""
+    return Vector(embedding).to_binary()
+
+
+ENCODINGS: list[tuple[str, Callable[[list[float]], bytes]]] = [
+    ("text", encode_text),
+    ("binary", encode_binary),
+]
+
+
+def vectors_per_second(vectors: int, run: Callable[[], Any], repeat: int) -> float:
+    """Best throughput of `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return vectors / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=10000)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    embeddings = [
+        [rng.uniform(-1.0, 1.0) for _ in range(args.dimensions)]
+        for _ in range(args.vectors)
+    ]
+
+    print(f"{args.vectors} vectors, {args.dimensions} dimensions")
+    print(f"{'format':<8}{'bytes/vector':>14}{'vectors/s':>14}{'MB/s':>10}")
+    for name, encode in ENCODINGS:
+        size = sum(len(encode(embedding)) for embedding in embeddings) / args.vectors
+        rate = vectors_per_second(
+            args.vectors,
+            lambda: [encode(embedding) for embedding in embeddings],
+            args.repeat,
+        )
+        print(f"{name:<8}{size:>14,.0f}{rate:>14,.0f}{rate * size / 1e6:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -142,6 +142,158 @@ class TestAsyncAlloyDBChatStore:
         assert results[0].content == message_1.content
         assert results[1].content == message_2.content
 
+    async def test_aget_messages_paginated(self, chat_store):
+        messages = [
+            ChatMessage(content=f"Message {i}", role="user") for i in range(5)
+        ]
+        key = "test_paginated_key"
+        await chat_store.aset_messages(key, messages)
+
+        first_page = await chat_store.aget_messages_with_ids(key, limit=2)
+        assert [m.content for _, m in first_page] == ["Message 0", "Message 1"]
+
+        next_page = await chat_store.aget_messages(
+            key, limit=2, after_id=first_page[-1][0]
+        )
+        assert [m.content for m in next_page] == ["Message 2", "Message 3"]
+
+        rows = await chat_store.aget_messages_with_ids(key)
+        previous_page = await chat_store.aget_messages(
+            key, limit=2, before_id=rows[3][0]
+        )
+        assert [m.content for m in previous_page] == ["Message 1", "Message 2"]
+
+        between = await chat_store.aget_messages(
+            key, before_id=rows[4][0], after_id=rows[0][0]
+        )
+        assert [m.content for m in between] == [
+            "Message 1",
+            "Message 2",
+            "Message 3",
+        ]
+
+        with pytest.raises(ValueError):
+            await chat_store.aget_messages(key, limit=-1)
+
+    async def test_aget_last_messages(self, chat_store):
+        messages = [
+            ChatMessage(content=f"Message {i}", role="user") for i in range(4)
+        ]
+        key = "test_last_messages_key"
+        await chat_store.aset_messages(key, messages)
+
+        results = await chat_store.aget_last_messages(key, 2)
+        assert [m.content for m in results] == ["Message 2", "Message 3"]
+
+        results = await chat_store.aget_last_messages(key, 10)
+        assert len(results) == 4
+        assert await chat_store.aget_last_messages(key, 0) == []
+
+    async def test_aset_messages_appends_suffix(self, async_engine, chat_store):
+        message_1 = ChatMessage(content="First message", role="user")
+        message_2 = ChatMessage(content="Second message", role="assistant")
+        message_3 = ChatMessage(content="Third message", role="user")
+        key = "test_set_append_key"
+        query = f"""select * from "public"."{default_table_name_async}" where key = '{key}' ORDER BY id;"""
+
+        await chat_store.aset_messages(key, [message_1, message_2])
+        before = await afetch(async_engine, query)
+        await chat_store.aset_messages(key, [message_1, message_2, message_3])
+        after = await afetch(async_engine, query)
+
+        # The existing rows are kept and only the new message is inserted
+        assert [r["id"] for r in after[:2]] == [r["id"] for r in before]
+        assert after[2]["message"] == message_3.model_dump()
+
+        # Rewriting the history replaces it
+        await chat_store.aset_messages(key, [message_1, message_3])
+        rewritten = await afetch(async_engine, query)
+        assert [r["message"] for r in rewritten] == [
+            message_1.model_dump(),
+            message_3.model_dump(),
+        ]
+        assert rewritten[0]["id"] > after[2]["id"]
+
+        await chat_store.aset_messages(key, [])
+        assert await afetch(async_engine, query) == []
+
+    async def test_write_behind(self, async_engine, chat_store):
+        store = await AsyncAlloyDBChatStore.create(
+            engine=async_engine,
+            table_name=default_table_name_async,
+            write_behind=True,
+            flush_interval=60,
+            flush_max_messages=3,
+        )
+        key = "test_write_behind_key"
+        query = f"""select * from "public"."{default_table_name_async}" where key = '{key}' ORDER BY id;"""
+        message_1 = ChatMessage(content="Message 1", role="user")
+        message_2 = ChatMessage(content="Message 2", role="assistant")
+
+        await store.async_add_message(key, message_1)
+        await store.async_add_message(key, message_2)
+        assert await afetch(async_engine, query) == []
+        assert key in await store.aget_keys()
+        # Reads flush the buffered messages first
+        results = await store.aget_messages(key)
+        assert [m.content for m in results] == ["Message 1", "Message 2"]
+
+        results = await afetch(async_engine, query)
+        assert [r["message"] for r in results] == [
+            message_1.model_dump(),
+            message_2.model_dump(),
+        ]
+
+        # Reaching flush_max_messages flushes right away
+        for i in range(3):
+            await store.async_add_message(key, ChatMessage(content=f"Batch {i}"))
+        assert len(await afetch(async_engine, query)) == 5
+
+        await store.async_add_message(key, ChatMessage(content="Last"))
+        await store.aclose()
+        results = await afetch(async_engine, query)
+        assert results[-1]["message"]["content"] == "Last"
+
+    async def test_write_behind_flush_error(self, async_engine):
+        table_name = "chat_store_" + str(uuid.uuid4())
+        await async_engine._ainit_chat_store_table(table_name=table_name)
+        store = await AsyncAlloyDBChatStore.create(
+            engine=async_engine,
+            table_name=table_name,
+            write_behind=True,
+            flush_interval=60,
+        )
+        key = "test_write_behind_flush_error_key"
+        await aexecute(async_engine, f'DROP TABLE "public"."{table_name}"')
+        await store.async_add_message(key, ChatMessage(content="Kept"))
+
+        # A failed flush raises and keeps the messages buffered
+        with pytest.raises(Exception):
+            await store.aflush()
+        await async_engine._ainit_chat_store_table(table_name=table_name)
+        await store.aclose()
+
+        query = f"""select * from "public"."{table_name}" where key = '{key}';"""
+        results = await afetch(async_engine, query)
+        assert [r["message"]["content"] for r in results] == ["Kept"]
+        await aexecute(async_engine, f'DROP TABLE IF EXISTS "public"."{table_name}"')
+
+    async def test_write_behind_invalid_options(self, async_engine, chat_store):
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBChatStore.create(
+                engine=async_engine,
+                table_name=default_table_name_async,
+                write_behind=True,
+                flush_interval=0,
+            )
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBChatStore.create(
+                engine=async_engine,
+                table_name=default_table_name_async,
+                write_behind=True,
+                flush_max_messages=0,
+            )
+
     async def test_adelete_messages(self, async_engine, chat_store):
         messages = [ChatMessage(content="Message to delete", role="user")]
         key = "test_delete_key"
@@ -167,6 +319,25 @@ class TestAsyncAlloyDBChatStore:
         assert len(results) == 1
         assert results[0]["message"] == message_1.model_dump()
 
+    async def test_adelete_message_out_of_range(self, async_engine, chat_store):
+        message_1 = ChatMessage(content="Message 1", role="user")
+        message_2 = ChatMessage(content="Message 2", role="user")
+        message_3 = ChatMessage(content="Message 3", role="user")
+        key = "test_delete_message_range_key"
+        await chat_store.aset_messages(key, [message_1, message_2, message_3])
+
+        assert await chat_store.adelete_message(key, 3) is None
+        deleted = await chat_store.adelete_message(key, -2)
+        assert deleted.content == message_2.content
+
+        query = f"""select * from "public"."{default_table_name_async}" where key = '{key}' ORDER BY id;"""
+        results = await afetch(async_engine, query)
+        assert [r["message"] for r in results] == [
+            message_1.model_dump(),
+            message_3.model_dump(),
+        ]
+        assert await chat_store.adelete_last_message("missing_key") is None
+
     async def test_adelete_last_message(self, async_engine, chat_store):
         message_1 = ChatMessage(content="Message 1", role="user")
         message_2 = ChatMessage(content="Message 2", role="user")
@@ -178,6 +178,48 @@ class TestAsyncAlloyDBDocumentStore:
         result = results[0]
         assert result["node_data"][DATA_KEY]["text"] == document_text
 
+    async def test_async_add_documents_bulk(self, async_engine, doc_store):
+        bulk_doc_store = await AsyncAlloyDBDocumentStore.create(
+            engine=async_engine,
+            table_name=default_table_name_async,
+            max_batch_bytes=2000,
+            max_concurrency=3,
+        )
+        docs = [Document(text=f"bulk doc {i}", id_=f"bulk_doc_{i}") for i in range(50)]
+        # A node given twice is written once, with its last value.
+        docs.append(Document(text="bulk doc updated", id_="bulk_doc_0"))
+
+        await bulk_doc_store.async_add_documents(docs)
+
+        query = f"""select id, node_data from "public"."{default_table_name_async}" where id like 'bulk_doc_%';"""
+        results = await afetch(async_engine, query)
+        texts = {row["id"]: row["node_data"][DATA_KEY]["text"] for row in results}
+        assert len(texts) == 50
+        assert texts["bulk_doc_0"] == "bulk doc updated"
+
+        with pytest.raises(ValueError):
+            await bulk_doc_store.async_add_documents(docs[:2], allow_update=False)
+
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBDocumentStore.create(
+                engine=async_engine,
+                table_name=default_table_name_async,
+                max_concurrency=0,
+            )
+
+    async def test_async_add_documents_atomic(self, async_engine, doc_store):
+        docs = [
+            Document(text="atomic doc", id_="atomic_doc_0"),
+            # JSONB rejects NUL characters, so the second batch fails
+            Document(text="atomic \x00 doc", id_="atomic_doc_1"),
+        ]
+
+        with pytest.raises(Exception):
+            await doc_store.async_add_documents(docs, batch_size=1)
+
+        query = f"""select id from "public"."{default_table_name_async}" where id like 'atomic_doc_%';"""
+        assert await afetch(async_engine, query) == []
+
     async def test_add_hash_before_data(self, async_engine, doc_store):
         # Create a document
         document_text = "add document test"
@@ -236,6 +278,31 @@ class TestAsyncAlloyDBDocumentStore:
         assert ref_doc.doc_id in results
         assert doc.doc_id in results
 
+    async def test_aget_all_ref_doc_info_merges_nodes(self, doc_store):
+        ref_doc = Document(text="parent", id_="merge_parent_doc")
+        first = TextNode(text="first", id_="merge_first", metadata={"a": 1, "b": 1})
+        second = TextNode(text="second", id_="merge_second", metadata={"b": 2})
+        for node in [first, second]:
+            node.relationships[NodeRelationship.SOURCE] = (
+                ref_doc.as_related_node_info()
+            )
+        await doc_store.async_add_documents([first, second])
+
+        results = await doc_store.aget_all_ref_doc_info()
+        ref_doc_info = results[ref_doc.doc_id]
+        assert sorted(ref_doc_info.node_ids) == ["merge_first", "merge_second"]
+        assert ref_doc_info.metadata["a"] == 1
+        assert ref_doc_info.metadata == (
+            await doc_store.aget_ref_doc_info(ref_doc.doc_id)
+        ).metadata
+
+        streamed = {
+            ref_doc_id: info async for ref_doc_id, info in doc_store.aiter_ref_doc_info()
+        }
+        assert streamed == results
+
+        await doc_store.adelete_ref_doc(ref_doc.doc_id)
+
     async def test_adelete_ref_doc(self, doc_store):
         # Create a ref_doc & doc and add them to the store.
         ref_doc = Document(
@@ -283,6 +350,30 @@ class TestAsyncAlloyDBDocumentStore:
         assert results["document one hash"] == expected_dict["document one hash"]
         assert results["document two hash"] == expected_dict["document two hash"]
 
+    async def test_set_many_document_hashes(self, doc_store):
+        doc_hashes = {f"hash_doc_{i}": f"hash_{i}" for i in range(1000)}
+        await doc_store.aset_document_hashes(doc_hashes)
+        doc_hashes.update({f"hash_doc_{i}": f"new_hash_{i}" for i in range(500)})
+        await doc_store.aset_document_hashes(doc_hashes)
+
+        assert await doc_store.aget_document_hashes(list(doc_hashes)) == doc_hashes
+
+    async def test_aiter_docs_and_hashes(self, doc_store):
+        docs = [Document(text=f"page doc {i}", id_=f"page_doc_{i}") for i in range(7)]
+        await doc_store.async_add_documents(docs)
+
+        paged_docs = {
+            doc_id: doc async for doc_id, doc in doc_store.aiter_docs(page_size=3)
+        }
+        assert {doc.doc_id for doc in docs} <= paged_docs.keys()
+        assert paged_docs["page_doc_4"].text == "page doc 4"
+
+        paged_hashes = {
+            doc_hash: doc_id
+            async for doc_hash, doc_id in doc_store.aiter_document_hashes(page_size=2)
+        }
+        assert paged_hashes == await doc_store.aget_all_document_hashes()
+
     async def test_doc_store_basic(self, doc_store):
         # Create a doc and a node and add them to the store.
         doc = Document(text="document_1", id_="doc_id_1", metadata={"doc": "info"})
@@ -301,6 +392,91 @@ class TestAsyncAlloyDBDocumentStore:
         retrieved_node = await doc_store.aget_document(doc_id=node.node_id)
         assert retrieved_node == node
 
+    async def test_batch_lookups(self, doc_store):
+        docs = [
+            Document(text=f"lookup doc {i}", id_=f"lookup_doc_{i}") for i in range(3)
+        ]
+        await doc_store.async_add_documents(docs)
+        doc_ids = ["lookup_doc_2", "lookup_missing", "lookup_doc_0"]
+
+        results = await doc_store.aget_documents(doc_ids, raise_error=False)
+        assert [doc.doc_id if doc else None for doc in results] == [
+            "lookup_doc_2",
+            None,
+            "lookup_doc_0",
+        ]
+        with pytest.raises(ValueError, match="lookup_missing"):
+            await doc_store.aget_documents(doc_ids)
+
+        # Ids with only a stored hash have no document
+        await doc_store.aset_document_hash("lookup_hash_only", "hash")
+        results = await doc_store.aget_documents(
+            ["lookup_hash_only", "lookup_doc_0"], raise_error=False
+        )
+        assert [doc.doc_id if doc else None for doc in results] == [
+            None,
+            "lookup_doc_0",
+        ]
+        with pytest.raises(ValueError, match="lookup_hash_only"):
+            await doc_store.aget_documents(["lookup_hash_only"])
+        assert (
+            await doc_store.aget_document("lookup_hash_only", raise_error=False) is None
+        )
+
+        assert await doc_store.adocuments_exist(doc_ids) == {
+            "lookup_doc_2": True,
+            "lookup_missing": False,
+            "lookup_doc_0": True,
+        }
+
+        hashes = await doc_store.aget_document_hashes(doc_ids)
+        assert hashes == {"lookup_doc_2": docs[2].hash, "lookup_doc_0": docs[0].hash}
+        with pytest.raises(ValueError):
+            await doc_store.aget_document_hashes(doc_ids, raise_error=True)
+
+    async def test_node_cache(self, async_engine, doc_store):
+        cached_doc_store = await AsyncAlloyDBDocumentStore.create(
+            engine=async_engine,
+            table_name=default_table_name_async,
+            cache_max_entries=2,
+        )
+        assert doc_store.cache_stats is None
+        docs = [Document(text=f"cache doc {i}", id_=f"cache_doc_{i}") for i in range(3)]
+        await cached_doc_store.async_add_documents(docs)
+
+        await cached_doc_store.aget_document("cache_doc_0")
+        await cached_doc_store.aget_document("cache_doc_0")
+        stats = cached_doc_store.cache_stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+        # Changes to returned nodes do not reach the cached ones
+        result = await cached_doc_store.aget_document("cache_doc_0")
+        result.metadata["changed"] = True
+        result = await cached_doc_store.aget_document("cache_doc_0")
+        assert "changed" not in result.metadata
+
+        await cached_doc_store.aset_document_hash("cache_hash_only", "hash")
+        assert (
+            await cached_doc_store.aget_document("cache_hash_only", raise_error=False)
+            is None
+        )
+
+        await cached_doc_store.aget_documents(["cache_doc_1", "cache_doc_2"])
+        stats = cached_doc_store.cache_stats
+        assert (stats.entries, stats.evictions) == (2, 1)
+
+        # Writes and deletes invalidate the cached nodes.
+        updated = Document(text="cache doc updated", id_="cache_doc_2")
+        await cached_doc_store.async_add_documents([updated])
+        result = await cached_doc_store.aget_document("cache_doc_2")
+        assert result.text == "cache doc updated"
+
+        await cached_doc_store.adelete_document("cache_doc_2")
+        assert (
+            await cached_doc_store.aget_document("cache_doc_2", raise_error=False)
+            is None
+        )
+
     async def test_adelete_document(self, async_engine, doc_store):
         # Create a doc and add it to the store.
         doc = Document(text="document_2", id_="doc_id_2", metadata={"doc": "info"})
@@ -25,6 +25,8 @@ from llama_index.core.data_structs.data_structs import (
     IndexList,
     IndexStruct,
 )
+from llama_index.core.schema import TextNode
+from llama_index.core.storage.index_store.utils import json_to_index_struct
 from sqlalchemy import RowMapping, text
 
 from llama_index_alloydb_pg import AlloyDBEngine
@@ -183,6 +185,105 @@ class TestAsyncAlloyDBIndexStore:
                 w[-1].message
             )
 
+    async def test_cached_index_structs(self, async_engine, index_store):
+        cached_store = await AsyncAlloyDBIndexStore.create(
+            engine=async_engine,
+            table_name=default_table_name_async,
+            cache_index_structs=True,
+        )
+        index_struct = IndexDict()
+        index_struct.add_node(TextNode(text="first"))
+        await cached_store.aadd_index_struct(index_struct)
+
+        query = f"""select version from "public"."{default_table_name_async}" where index_id = '{index_struct.index_id}';"""
+        assert (await afetch(async_engine, query))[0]["version"] == 1
+
+        # Unchanged structs are served from the cache, as copies
+        cached = await cached_store.aget_index_struct(index_struct.index_id)
+        assert cached == index_struct
+        assert cached is not index_struct
+        assert index_struct in await cached_store.aindex_structs()
+        index_struct.add_node(TextNode(text="not written"))
+        cached.add_node(TextNode(text="not written either"))
+        result = await cached_store.aget_index_struct(index_struct.index_id)
+        assert len(result.nodes_dict) == 1
+
+        # Writes from another store bump the version and invalidate the cache
+        updated = IndexDict(index_id=index_struct.index_id)
+        updated.add_node(TextNode(text="second"))
+        await index_store.aadd_index_struct(updated)
+        assert (await afetch(async_engine, query))[0]["version"] == 2
+        result = await cached_store.aget_index_struct(index_struct.index_id)
+        assert result == updated
+
+        await index_store.adelete_index_struct(index_struct.index_id)
+        assert await cached_store.aget_index_struct(index_struct.index_id) is None
+        assert updated not in await cached_store.aindex_structs()
+
+    async def test_incremental_index_dict(self, async_engine, index_store):
+        table_name = default_table_name_async + "_incremental"
+        await async_engine._ainit_index_store_table(
+            table_name=table_name, incremental=True
+        )
+        try:
+            store = await AsyncAlloyDBIndexStore.create(
+                engine=async_engine, table_name=table_name, incremental=True
+            )
+            index_struct = IndexDict()
+            nodes = [TextNode(text=f"node {i}") for i in range(3)]
+            for node in nodes:
+                index_struct.add_node(node)
+            await store.aadd_index_struct(index_struct)
+
+            query = f"""select * from "public"."{table_name}" where index_id = '{index_struct.index_id}';"""
+            nodes_query = f"""select vector_id from "public"."{table_name}_nodes" where index_id = '{index_struct.index_id}' ORDER BY vector_id;"""
+            row = (await afetch(async_engine, query))[0]
+            # The node mappings live in the nodes table only
+            assert json_to_index_struct(row["index_data"]).nodes_dict == {}
+            assert len(await afetch(async_engine, nodes_query)) == 3
+
+            index_struct.delete(nodes[0].node_id)
+            new_node = TextNode(text="node 3")
+            index_struct.add_node(new_node)
+            await store.aadd_index_struct(index_struct)
+            results = await afetch(async_engine, nodes_query)
+            assert [r["vector_id"] for r in results] == sorted(
+                [nodes[1].node_id, nodes[2].node_id, new_node.node_id]
+            )
+            assert (await afetch(async_engine, query))[0]["version"] == 2
+
+            other_store = await AsyncAlloyDBIndexStore.create(
+                engine=async_engine, table_name=table_name, incremental=True
+            )
+            assert await other_store.aget_index_struct(
+                index_struct.index_id
+            ) == index_struct
+            assert index_struct in await other_store.aindex_structs()
+
+            # A write from another store is detected and the struct is rewritten
+            loaded = await other_store.aget_index_struct(index_struct.index_id)
+            loaded.delete(nodes[1].node_id)
+            await other_store.aadd_index_struct(loaded)
+            index_struct.add_node(TextNode(text="node 4"))
+            await store.aadd_index_struct(index_struct)
+            assert await other_store.aget_index_struct(
+                index_struct.index_id
+            ) == index_struct
+
+            await store.adelete_index_struct(index_struct.index_id)
+            assert await afetch(async_engine, nodes_query) == []
+        finally:
+            await aexecute(async_engine, f'DROP TABLE IF EXISTS "{table_name}_nodes"')
+            await aexecute(async_engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
+    async def test_incremental_without_nodes_table(self, async_engine, index_store):
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBIndexStore.create(
+                engine=async_engine,
+                table_name=default_table_name_async,
+                incremental=True,
+            )
+
     async def test_index_structs(self, index_store):
         with pytest.raises(Exception, match=sync_method_exception_str):
             index_store.index_structs()
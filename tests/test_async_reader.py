@@ -15,6 +15,7 @@
 import json
 import os
 import uuid
+import warnings
 from typing import Sequence
 
 import pytest
@@ -23,7 +24,18 @@ from llama_index.core.schema import Document
 from sqlalchemy import RowMapping, text
 
 from llama_index_alloydb_pg import AlloyDBEngine
-from llama_index_alloydb_pg.async_reader import AsyncAlloyDBReader
+from llama_index_alloydb_pg.async_reader import (
+    AsyncAlloyDBReader,
+    _parse_docs_from_columns,
+    csv_batch_formatter,
+    csv_formatter,
+    json_batch_formatter,
+    json_formatter,
+    text_batch_formatter,
+    text_formatter,
+    yaml_batch_formatter,
+    yaml_formatter,
+)
 
 default_table_name_async = "reader_test_" + str(uuid.uuid4())
 sync_method_exception_str = "Sync methods are not implemented for AsyncAlloyDBReader. Use AlloyDBReader interface instead."
@@ -50,6 +62,61 @@ def get_env_var(key: str, desc: str) -> str:
     return v
 
 
+@pytest.mark.parametrize(
+    "batch_formatter, expected_text",
+    [
+        (text_batch_formatter, "fruit_{i} {i}"),
+        (csv_batch_formatter, "fruit_{i}, {i}"),
+        (yaml_batch_formatter, "name: fruit_{i}\ncount: {i}"),
+        (json_batch_formatter, '{{"name": "fruit_{i}", "count": {i}}}'),
+    ],
+)
+def test_parse_docs_from_columns(batch_formatter, expected_text):
+    rows = [
+        {"name": f"fruit_{i}", "count": i, "tag": None, "li_metadata": {"i": i}}
+        for i in range(5)
+    ]
+    rows[0]["li_metadata"] = None
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+    documents = _parse_docs_from_columns(
+        ["name", "count", "missing"],
+        ["tag", "li_metadata"],
+        columns,
+        batch_formatter,
+        "li_metadata",
+    )
+
+    assert [doc.text for doc in documents] == [
+        expected_text.format(i=i) for i in range(5)
+    ]
+    assert [doc.metadata for doc in documents] == [{"tag": None}] + [
+        {"i": i, "tag": None} for i in range(1, 5)
+    ]
+
+
+@pytest.mark.parametrize(
+    "formatter, batch_formatter",
+    [
+        (text_formatter, text_batch_formatter),
+        (csv_formatter, csv_batch_formatter),
+        (yaml_formatter, yaml_batch_formatter),
+        (json_formatter, json_batch_formatter),
+    ],
+)
+def test_row_formatters_deprecated(formatter, batch_formatter):
+    row = {"name": "fruit", "count": 1, "tag": None}
+    columns = {key: [value] for key, value in row.items()}
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        content = formatter(row, ["name", "count", "missing"])
+        assert len(w) == 1
+        assert issubclass(w[-1].category, DeprecationWarning)
+        assert f"use {batch_formatter.__name__} instead" in str(w[-1].message)
+    assert content == batch_formatter(columns, ["name", "count", "missing"])[0]
+
+
 @pytest.mark.asyncio(loop_scope="class")
 class TestAsyncAlloyDBReader:
     @pytest.fixture(scope="module")
@@ -144,6 +211,12 @@ class TestAsyncAlloyDBReader:
                 table_name=default_table_name_async,
                 format="fake_format",
             )
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBReader.create(
+                engine=async_engine,
+                table_name=default_table_name_async,
+                fetch_size=0,
+            )
 
     async def test_lazy_load_data(self, async_engine):
         with pytest.raises(Exception, match=sync_method_exception_str):
@@ -207,6 +280,122 @@ class TestAsyncAlloyDBReader:
 
         await aexecute(async_engine, f'DROP TABLE IF EXISTS "{table_name}"')
 
+    async def test_alazy_load_batches(self, async_engine):
+        table_name = "test-table" + str(uuid.uuid4())
+        await aexecute(
+            async_engine,
+            f'CREATE TABLE "{table_name}" (fruit_id SERIAL PRIMARY KEY, fruit_name VARCHAR(100))',
+        )
+        await aexecute(
+            async_engine,
+            f"""INSERT INTO "{table_name}" (fruit_name)
+            SELECT 'fruit_' || i FROM generate_series(1, 5) AS i""",
+        )
+
+        reader = await AsyncAlloyDBReader.create(
+            engine=async_engine,
+            query=f'SELECT * FROM "{table_name}" ORDER BY fruit_id',
+            content_columns=["fruit_name"],
+            fetch_size=2,
+        )
+        batches = await self._collect_async_items(reader.alazy_load_batches())
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [doc.text for batch in batches for doc in batch] == [
+            f"fruit_{i}" for i in range(1, 6)
+        ]
+        assert batches[0][0].metadata == {"fruit_id": 1}
+
+        await aexecute(async_engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
+    async def test_alazy_load_data_partitioned(self, async_engine):
+        table_name = "test-table" + str(uuid.uuid4())
+        await aexecute(
+            async_engine,
+            f'CREATE TABLE "{table_name}" (fruit_id SERIAL PRIMARY KEY, fruit_name VARCHAR(100))',
+        )
+        await aexecute(
+            async_engine,
+            f"""INSERT INTO "{table_name}" (fruit_name)
+            SELECT 'fruit_' || i FROM generate_series(1, 50) AS i""",
+        )
+        expected = [f"fruit_{i}" for i in range(1, 51)]
+
+        reader = await AsyncAlloyDBReader.create(
+            engine=async_engine,
+            query=f'SELECT * FROM "{table_name}" ORDER BY fruit_id',
+            content_columns=["fruit_name"],
+            fetch_size=4,
+            partitions=3,
+            partition_column="fruit_id",
+        )
+        documents = await reader.aload_data()
+        assert [doc.text for doc in documents] == expected
+
+        reader = await AsyncAlloyDBReader.create(
+            engine=async_engine,
+            table_name=table_name,
+            content_columns=["fruit_name"],
+            fetch_size=4,
+            partitions=4,
+            ordered=False,
+        )
+        documents = await reader.aload_data()
+        assert sorted(doc.text for doc in documents) == sorted(expected)
+
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBReader.create(
+                engine=async_engine,
+                query=f'SELECT * FROM "{table_name}"',
+                partitions=2,
+            )
+
+        await aexecute(async_engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
+    async def test_load_with_batch_formatter(self, async_engine):
+        table_name = "test-table" + str(uuid.uuid4())
+        await aexecute(
+            async_engine,
+            f'CREATE TABLE "{table_name}" (fruit_id SERIAL PRIMARY KEY, fruit_name VARCHAR(100))',
+        )
+        await aexecute(
+            async_engine,
+            f"""INSERT INTO "{table_name}" (fruit_name)
+            SELECT 'fruit_' || i FROM generate_series(1, 3) AS i""",
+        )
+
+        def upper_batch_formatter(columns, content_columns):
+            return [str(value).upper() for value in columns[content_columns[0]]]
+
+        reader = await AsyncAlloyDBReader.create(
+            engine=async_engine,
+            query=f'SELECT * FROM "{table_name}" ORDER BY fruit_id',
+            content_columns=["fruit_name"],
+            batch_formatter=upper_batch_formatter,
+        )
+        documents = await reader.aload_data()
+        assert [doc.text for doc in documents] == ["FRUIT_1", "FRUIT_2", "FRUIT_3"]
+
+        reader = await AsyncAlloyDBReader.create(
+            engine=async_engine,
+            query=f'SELECT * FROM "{table_name}" ORDER BY fruit_id',
+            content_columns=["fruit_name"],
+            format="JSON",
+            json_encoder=lambda value: json.dumps(value, separators=(",", ":")),
+        )
+        documents = await reader.aload_data()
+        assert documents[0].text == '{"fruit_name":"fruit_1"}'
+
+        with pytest.raises(ValueError):
+            await AsyncAlloyDBReader.create(
+                engine=async_engine,
+                table_name=table_name,
+                format="text",
+                batch_formatter=upper_batch_formatter,
+            )
+
+        await aexecute(async_engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
     async def test_load_from_query_customized_content_customized_metadata(
         self, async_engine
     ):
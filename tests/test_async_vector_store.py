@@ -32,6 +32,7 @@ from sqlalchemy.engine.row import RowMapping
 
 from llama_index_alloydb_pg import AlloyDBEngine, Column
 from llama_index_alloydb_pg.async_vector_store import AsyncAlloyDBVectorStore
+from llama_index_alloydb_pg.engine import VECTOR_CODEC_KEY
 from llama_index_alloydb_pg.indexes import HNSWQueryOptions, ScaNNQueryOptions
 
 DEFAULT_TABLE = "test_table" + str(uuid.uuid4())
@@ -176,6 +177,29 @@ class TestVectorStore:
         )
         yield vs
 
+    @pytest_asyncio.fixture(scope="class")
+    async def binary_engine(
+        self, db_project, db_region, db_cluster, db_instance, db_name
+    ):
+        engine = await AlloyDBEngine.afrom_instance(
+            project_id=db_project,
+            instance=db_instance,
+            cluster=db_cluster,
+            region=db_region,
+            database=db_name,
+            binary_vector_encoding=True,
+        )
+
+        yield engine
+        await engine.close()
+
+    @pytest_asyncio.fixture(scope="class")
+    async def binary_vs(self, binary_engine, vs):
+        vs = await AsyncAlloyDBVectorStore.create(
+            binary_engine, table_name=DEFAULT_TABLE
+        )
+        yield vs
+
     async def test_init_with_constructor(self, engine):
         key = object()
         with pytest.raises(Exception):
@@ -263,6 +287,120 @@ class TestVectorStore:
         assert results[0]["nullable_int_field"] == None
         assert results[0]["nullable_str_field"] == None
 
+    async def test_async_add_binary_vector_encoding(self, engine, binary_vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await binary_vs.async_add(nodes)
+
+        results = await afetch(
+            engine,
+            f'SELECT node_id, embedding::text AS embedding FROM "{DEFAULT_TABLE}" ORDER BY text',
+        )
+        assert len(results) == 4
+        # "bar" is the second node, stored with a constant embedding of 0.5
+        assert results[0]["embedding"] == str([0.5] * VECTOR_SIZE).replace(" ", "")
+
+    async def test_binary_vector_encoding_on_connect(self, binary_engine, binary_vs):
+        async with binary_engine._pool.connect() as conn:
+            assert conn.info.get(VECTOR_CODEC_KEY)
+
+    async def test_aquery_binary_vector_encoding(self, engine, vs, binary_vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await vs.async_add(nodes)
+        query = VectorStoreQuery(
+            query_embedding=[1.0] * VECTOR_SIZE, similarity_top_k=3
+        )
+        text_results = await vs.aquery(query)
+        binary_results = await binary_vs.aquery(query)
+
+        assert binary_results.ids == text_results.ids
+        assert binary_results.similarities == pytest.approx(
+            text_results.similarities
+        )
+
+    async def test_async_add_concurrent(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        progress = []
+        ids = await vs.async_add(
+            nodes,
+            max_concurrency=2,
+            batch_size=1,
+            atomic=False,
+            progress_callback=lambda written, total: progress.append(
+                (written, total)
+            ),
+        )
+
+        assert ids == [node.node_id for node in nodes]
+        assert len(progress) == 4
+        assert progress[-1] == (4, 4)
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 4
+
+    async def test_async_add_concurrent_atomic_rollback(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await vs.async_add(nodes[:1])
+        # The first node already exists, so its batch fails and the whole add is rolled back
+        with pytest.raises(Exception):
+            await vs.async_add(nodes[::-1], batch_size=1)
+        with pytest.raises(Exception):
+            await vs.async_add(nodes[::-1], batch_size=1, max_retries=1)
+
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 1
+
+    async def test_async_add_atomic_max_concurrency(self, vs):
+        with pytest.raises(ValueError, match="max_concurrency must be 1"):
+            await vs.async_add(nodes, max_concurrency=2)
+
+    async def test_async_add_concurrent_per_batch_commit(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await vs.async_add(nodes[-1:])
+        # Batches are committed independently, so only the failing batch is lost
+        with pytest.raises(Exception):
+            await vs.async_add(nodes, batch_size=1, max_retries=1, atomic=False)
+
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 4
+
+    async def test_async_add_bulk(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+
+        async def node_stream():
+            for node in nodes:
+                yield node
+
+        result = await vs.async_add_bulk(node_stream(), chunk_size=3)
+        assert result.rows == 4
+        assert result.rows_per_second > 0
+
+        # re-ingesting the same nodes upserts them
+        result = await vs.async_add_bulk(nodes)
+        assert result.rows == 4
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 4
+
+        # the last node of an id repeated within a chunk wins
+        updated = nodes[0].model_copy(update={"text": "updated"})
+        result = await vs.async_add_bulk([nodes[0], nodes[1], updated])
+        assert result.rows == 2
+        results = await afetch(
+            engine,
+            f"""SELECT text FROM "{DEFAULT_TABLE}" WHERE node_id = '{nodes[0].node_id}'""",
+        )
+        assert results[0]["text"] == "updated"
+
+    async def test_async_add_bulk_binary(self, engine, binary_vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        result = await binary_vs.async_add_bulk(nodes)
+        assert result.rows == 4
+        query = VectorStoreQuery(node_ids=[nodes[1].node_id], similarity_top_k=-1)
+        results = await binary_vs.aquery(query, return_embedding=True)
+        assert results.nodes[0].embedding == pytest.approx(nodes[1].embedding)
+
+    async def test_async_add_bulk_invalid_chunk_size(self, vs):
+        with pytest.raises(ValueError, match="chunk_size must be greater than 0."):
+            await vs.async_add_bulk(nodes, chunk_size=0)
+
     async def test_adelete(self, engine, vs):
         # Note: To be migrated to a pytest dependency on test_async_add
         # Blocked due to unexpected fixtures reloads while running integration test suite
@@ -338,6 +476,73 @@ class TestVectorStore:
         assert len(results.nodes) == 3
         assert results.nodes[0].get_content(metadata_mode=MetadataMode.NONE) == "foo"
 
+    async def test_aquery_return_embedding(self, engine, vs, binary_vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await vs.async_add(nodes)
+        query = VectorStoreQuery(node_ids=[nodes[1].node_id], similarity_top_k=-1)
+
+        results = await vs.aquery(query)
+        assert results.nodes[0].embedding is None
+
+        for store in [vs, binary_vs]:
+            results = await store.aquery(query, return_embedding=True)
+            assert results.nodes[0].embedding == pytest.approx(nodes[1].embedding)
+
+            results = await store.aquery(query, return_embedding="numpy")
+            assert results.embeddings.shape == (1, VECTOR_SIZE)
+            assert results.embeddings[0].tolist() == pytest.approx(nodes[1].embedding)
+            assert results.nodes[0].embedding is None
+
+    async def test_aquery_lazy_nodes(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await vs.async_add(nodes)
+        query = VectorStoreQuery(
+            query_embedding=[1.0] * VECTOR_SIZE, similarity_top_k=3
+        )
+        eager = await vs.aquery(query)
+        results = await vs.aquery(query, lazy_nodes=True)
+
+        assert results.ids == eager.ids
+        assert len(results.nodes) == 3
+        assert results.nodes[0] is results.nodes[0]
+        assert [node.metadata for node in results.nodes] == [
+            node.metadata for node in eager.nodes
+        ]
+
+    async def test_aquery_batch(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        await vs.async_add(nodes)
+        queries = [
+            VectorStoreQuery(query_embedding=[1.0] * VECTOR_SIZE, similarity_top_k=3),
+            VectorStoreQuery(
+                query_embedding=[1.0] * VECTOR_SIZE,
+                node_ids=[nodes[1].node_id],
+                similarity_top_k=3,
+            ),
+            VectorStoreQuery(node_ids=[nodes[2].node_id], similarity_top_k=-1),
+        ]
+        results = await vs.aquery_batch(queries)
+
+        assert len(results) == 3
+        assert len(results[0].nodes) == 3
+        assert len(results[0].similarities) == 3
+        assert results[1].ids == [nodes[1].node_id]
+        assert results[2].ids == [nodes[2].node_id]
+        assert await vs.aquery_batch([]) == []
+
+        # Filter-only queries give the same results as aquery
+        query = VectorStoreQuery(
+            filters=MetadataFilters(
+                filters=[
+                    MetadataFilter(key="text", value="bar", operator=FilterOperator.EQ)
+                ]
+            ),
+            similarity_top_k=-1,
+        )
+        single = await vs.aquery(query)
+        assert single.similarities == []
+        assert await vs.aquery_batch([query, query]) == [single, single]
+
     async def test_aquery_scann(self, engine, custom_vs_scann):
         # Note: To be migrated to a pytest dependency on test_async_add
         # Blocked due to unexpected fixtures reloads while running integration test suite
@@ -421,6 +626,35 @@ class TestVectorStore:
         assert results.similarities is not None
         assert len(results.nodes) == 3
 
+    async def test_aquery_filters_parameterized(self, engine, custom_vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE_CUSTOM_VS}"')
+        for node in nodes:
+            node.metadata["len"] = len(node.text)
+        await custom_vs.async_add(nodes)
+
+        for text_value in ["foo", "bar'; DROP TABLE x; --"]:
+            filters = MetadataFilters(
+                filters=[
+                    MetadataFilter(
+                        key="text",
+                        value=[text_value, "foobar"],
+                        operator=FilterOperator.IN,
+                    ),
+                    MetadataFilter(key="len", value=10, operator=FilterOperator.LT),
+                ],
+            )
+            query = VectorStoreQuery(
+                query_embedding=[1.0] * VECTOR_SIZE,
+                filters=filters,
+                similarity_top_k=5,
+            )
+            results = await custom_vs.aquery(query)
+            assert results.nodes is not None
+            assert "foobar" in [
+                node.get_content(metadata_mode=MetadataMode.NONE)
+                for node in results.nodes
+            ]
+
     async def test_aclear(self, engine, vs):
         # Note: To be migrated to a pytest dependency on test_adelete
         # Blocked due to unexpected fixtures reloads while running integration test suite
@@ -314,6 +314,42 @@ class TestAlloyDBChatStoreSync:
         assert results[0].content == message_1.content
         assert results[1].content == message_2.content
 
+    async def test_get_messages_paginated(self, sync_chat_store):
+        messages = [
+            ChatMessage(content=f"Message {i}", role="user") for i in range(5)
+        ]
+        key = "test_paginated_key"
+        sync_chat_store.set_messages(key, messages)
+
+        first_page = sync_chat_store.get_messages_with_ids(key, limit=2)
+        assert [m.content for _, m in first_page] == ["Message 0", "Message 1"]
+
+        next_page = sync_chat_store.get_messages(
+            key, limit=2, after_id=first_page[-1][0]
+        )
+        assert [m.content for m in next_page] == ["Message 2", "Message 3"]
+
+        last = sync_chat_store.get_last_messages(key, 2)
+        assert [m.content for m in last] == ["Message 3", "Message 4"]
+
+    async def test_write_behind(self, sync_engine, sync_chat_store):
+        store = AlloyDBChatStore.create_sync(
+            engine=sync_engine,
+            table_name=default_table_name_sync,
+            write_behind=True,
+            flush_interval=60,
+        )
+        key = "test_write_behind_key"
+        query = f"""select * from "public"."{default_table_name_sync}" where key = '{key}' ORDER BY id;"""
+
+        store.add_message(key, ChatMessage(content="Buffered", role="user"))
+        assert await afetch(sync_engine, query) == []
+        assert [m.content for m in store.get_messages(key)] == ["Buffered"]
+
+        store.close()
+        results = await afetch(sync_engine, query)
+        assert results[0]["message"]["content"] == "Buffered"
+
     async def test_adelete_messages(self, sync_engine, sync_chat_store):
         messages = [ChatMessage(content="Message to delete", role="user")]
         key = "test_delete_key"
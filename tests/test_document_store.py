@@ -505,6 +505,46 @@ class TestAlloyDBDocumentStoreSync:
         assert ref_doc.doc_id in results
         assert doc.doc_id in results
 
+    async def test_iter_ref_doc_info(self, sync_doc_store):
+        ref_doc = Document(text="parent", id_="iter_parent_doc")
+        doc = Document(text="child", id_="iter_child_doc", metadata={"doc": "info"})
+        doc.relationships[NodeRelationship.SOURCE] = ref_doc.as_related_node_info()
+        sync_doc_store.add_documents([doc])
+
+        results = dict(sync_doc_store.iter_ref_doc_info())
+        assert results[ref_doc.doc_id].node_ids == [doc.doc_id]
+        assert results[ref_doc.doc_id].metadata == {"doc": "info"}
+
+        sync_doc_store.delete_ref_doc(ref_doc.doc_id)
+
+    async def test_batch_lookups(self, sync_doc_store):
+        docs = [
+            Document(text=f"lookup doc {i}", id_=f"lookup_doc_{i}") for i in range(2)
+        ]
+        sync_doc_store.add_documents(docs)
+        doc_ids = ["lookup_doc_1", "lookup_missing"]
+
+        results = sync_doc_store.get_documents(doc_ids, raise_error=False)
+        assert results[0].doc_id == "lookup_doc_1"
+        assert results[1] is None
+        assert sync_doc_store.documents_exist(doc_ids) == {
+            "lookup_doc_1": True,
+            "lookup_missing": False,
+        }
+        assert sync_doc_store.get_document_hashes(doc_ids) == {
+            "lookup_doc_1": docs[1].hash
+        }
+
+    async def test_iter_docs_and_hashes(self, sync_doc_store):
+        docs = [Document(text=f"page doc {i}", id_=f"page_doc_{i}") for i in range(5)]
+        sync_doc_store.add_documents(docs)
+
+        paged_docs = dict(sync_doc_store.iter_docs(page_size=2))
+        assert {doc.doc_id for doc in docs} <= paged_docs.keys()
+        assert dict(
+            sync_doc_store.iter_document_hashes(page_size=2)
+        ) == sync_doc_store.get_all_document_hashes()
+
     async def test_delete_ref_doc(self, sync_doc_store):
         # Create a ref_doc & doc and add them to the store.
         ref_doc = Document(
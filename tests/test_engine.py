@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import uuid
+from threading import Thread
 from typing import Sequence
 
 import asyncpg  # type: ignore
@@ -27,6 +29,7 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import NullPool
 
 from llama_index_alloydb_pg import AlloyDBEngine, Column
+from llama_index_alloydb_pg.engine import _is_write
 
 DEFAULT_DS_TABLE = "document_store_" + str(uuid.uuid4())
 DEFAULT_DS_TABLE_SYNC = "document_store_" + str(uuid.uuid4())
@@ -107,6 +110,11 @@ class TestEngineAsync:
     def host(self) -> str:
         return get_env_var("IP_ADDRESS", "IP Address for the connection string")
 
+    @pytest.fixture(scope="module")
+    def reader_host(self, host) -> str:
+        # A second Postgres instance can stand in for a read replica
+        return os.environ.get("READER_IP_ADDRESS", host)
+
     @pytest_asyncio.fixture(scope="class")
     async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
         engine = await AlloyDBEngine.afrom_instance(
@@ -179,6 +187,50 @@ class TestEngineAsync:
         AlloyDBEngine._connector = None
         await engine.close()
 
+    async def test_pool_options_and_warm_up(
+        self,
+        db_project,
+        db_region,
+        db_cluster,
+        db_instance,
+        db_name,
+        user,
+        password,
+    ):
+        engine = await AlloyDBEngine.afrom_instance(
+            project_id=db_project,
+            instance=db_instance,
+            region=db_region,
+            cluster=db_cluster,
+            database=db_name,
+            user=user,
+            password=password,
+            pool_size=3,
+            max_overflow=1,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            warm_connections=3,
+        )
+        assert engine.warm_up_seconds is not None
+        assert engine._pool.pool.size() == 3
+        assert engine._pool.pool.checkedin() == 3
+        assert await engine.awarm_up(2) >= 0
+        await aexecute(engine, "SELECT 1")
+        await engine.close()
+
+        with pytest.raises(ValueError):
+            await AlloyDBEngine.afrom_instance(
+                project_id=db_project,
+                instance=db_instance,
+                region=db_region,
+                cluster=db_cluster,
+                database=db_name,
+                user=user,
+                password=password,
+                pool_size=2,
+                warm_connections=3,
+            )
+
     async def test_missing_user_or_password(
         self,
         db_project,
@@ -258,6 +310,105 @@ class TestEngineAsync:
         await aexecute(engine, "SELECT 1")
         await engine.close()
 
+    async def test_from_connection_string_loops(self, db_name, user, password, host):
+        port = "5432"
+        url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+
+        for loop_assignment in ["affinity", "round_robin"]:
+            engine = AlloyDBEngine.from_connection_string(
+                url, loops=3, loop_assignment=loop_assignment
+            )
+
+            async def backend_pid() -> tuple[int, int]:
+                async with engine._pool.connect() as conn:
+                    result = await conn.execute(text("SELECT pg_backend_pid()"))
+                    return id(asyncio.get_running_loop()), result.scalar_one()
+
+            def run(results: list, i: int) -> None:
+                results[i] = [engine._run_as_sync(backend_pid()) for _ in range(3)]
+
+            results: list = [None] * 6
+            threads = [Thread(target=run, args=(results, i)) for i in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            # Each thread stays on one loop
+            for calls in results:
+                assert len({loop for loop, _ in calls}) == 1
+            if loop_assignment == "round_robin":
+                assert len({calls[0][0] for calls in results}) == 3
+            # The rest of the AsyncEngine interface is delegated to the shards
+            assert engine._pool.url.database == db_name
+            assert engine._pool.dialect.name == "postgresql"
+
+            await aexecute(engine, "SELECT 1")
+            await engine.close()
+
+        with pytest.raises(ValueError):
+            AlloyDBEngine.from_connection_string(url, loops=0)
+        with pytest.raises(ValueError):
+            AlloyDBEngine.from_connection_string(url, loops=2, loop_assignment="random")
+
+    async def test_from_connection_string_readers(
+        self, db_name, user, password, host, reader_host
+    ):
+        port = "5432"
+        url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+        reader_url = (
+            f"postgresql+asyncpg://{user}:{password}@{reader_host}:{port}/{db_name}"
+        )
+
+        async def backend_pid(pool) -> int:
+            async with pool.connect() as conn:
+                result = await conn.execute(text("SELECT pg_backend_pid()"))
+                return result.scalar_one()
+
+        for reader_routing in ["round_robin", "least_loaded"]:
+            engine = AlloyDBEngine.from_connection_string(
+                url, reader_urls=[reader_url, reader_url], reader_routing=reader_routing
+            )
+            await engine._run_as_async(
+                asyncio.gather(
+                    backend_pid(engine._read_pool), backend_pid(engine._read_pool)
+                )
+            )
+            # Each reader pool served one of the concurrent reads
+            readers = engine._read_pool.pools()[1:]
+            assert [reader.pool.checkedin() for reader in readers] == [1, 1]
+            await engine.close()
+
+        # Reads go to the writer for read_your_writes seconds after a write
+        engine = AlloyDBEngine.from_connection_string(
+            url, reader_urls=[reader_url], read_your_writes=1
+        )
+        reader_pid = await engine._run_as_async(backend_pid(engine._read_pool))
+        writer_pid = await engine._run_as_async(backend_pid(engine._pool))
+        assert writer_pid != reader_pid
+        # Reads on the writer do not start the window
+        assert await engine._run_as_async(backend_pid(engine._read_pool)) == reader_pid
+        await aexecute(engine, "DO $$ BEGIN END $$")
+        assert await engine._run_as_async(backend_pid(engine._read_pool)) == writer_pid
+        await asyncio.sleep(1.1)
+        assert await engine._run_as_async(backend_pid(engine._read_pool)) == reader_pid
+        # Reads that lock or call writing functions are writes
+        await aexecute(engine, "SELECT pg_advisory_xact_lock(1)")
+        assert await engine._run_as_async(backend_pid(engine._read_pool)) == writer_pid
+        await engine.close()
+
+        with pytest.raises(ValueError):
+            AlloyDBEngine.from_connection_string(
+                url, reader_urls=[reader_url], reader_routing="random"
+            )
+        with pytest.raises(ValueError):
+            AlloyDBEngine.from_connection_string(
+                url, reader_urls=[reader_url], read_your_writes=-1
+            )
+        with pytest.raises(ValueError):
+            AlloyDBEngine.from_connection_string(
+                url, reader_urls=[reader_url.replace("+asyncpg", "+pg8000")]
+            )
+
     async def test_from_connection_string_url_error(
         self,
         db_name,
@@ -376,6 +527,7 @@ class TestEngineAsync:
             {"column_name": "index_id", "data_type": "character varying"},
             {"column_name": "type", "data_type": "character varying"},
             {"column_name": "index_data", "data_type": "jsonb"},
+            {"column_name": "version", "data_type": "bigint"},
         ]
         for row in results:
             assert row in expected
@@ -396,6 +548,19 @@ class TestEngineAsync:
         for row in results:
             assert row in expected
 
+    async def test_init_chat_store_composite_index(self, engine):
+        await engine.ainit_chat_store_table(
+            table_name=DEFAULT_CS_TABLE,
+            schema_name="public",
+            overwrite_existing=True,
+            composite_index=True,
+        )
+        stmt = f"SELECT indexname, indexdef FROM pg_indexes WHERE tablename = '{DEFAULT_CS_TABLE}';"
+        results = await afetch(engine, stmt)
+        indexes = {row["indexname"]: row["indexdef"] for row in results}
+        assert f"{DEFAULT_CS_TABLE}_idx_key" not in indexes
+        assert "(key, id)" in indexes[f"{DEFAULT_CS_TABLE}_idx_key_id"]
+
 
 @pytest.mark.asyncio
 class TestEngineSync:
@@ -576,6 +741,7 @@ class TestEngineSync:
             {"column_name": "index_id", "data_type": "character varying"},
             {"column_name": "type", "data_type": "character varying"},
             {"column_name": "index_data", "data_type": "jsonb"},
+            {"column_name": "version", "data_type": "bigint"},
         ]
         for row in results:
             assert row in expected
@@ -595,3 +761,26 @@ class TestEngineSync:
         ]
         for row in results:
             assert row in expected
+
+
+@pytest.mark.parametrize(
+    "statement, is_write",
+    [
+        ("SELECT 1", False),
+        ("(SELECT 1)", False),
+        ("SET LOCAL hnsw.ef_search = 40;", False),
+        ("WITH x AS (SELECT 1) SELECT * FROM x", False),
+        ("INSERT INTO t VALUES (1)", True),
+        ("SELECT * FROM t FOR UPDATE", True),
+        ("SELECT * FROM t FOR NO KEY UPDATE", True),
+        ("SELECT * FROM t FOR KEY SHARE", True),
+        ("SELECT * INTO t2 FROM t", True),
+        ("SELECT nextval('s')", True),
+        ("SELECT setval('s', 1)", True),
+        ("SELECT pg_advisory_lock(1)", True),
+        ("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d", True),
+        ("BEGIN", True),
+    ],
+)
+def test_is_write(statement, is_write):
+    assert _is_write(statement) == is_write
@@ -617,6 +617,56 @@ class TestAlloyDBReaderSync:
 
         await aexecute(sync_engine, f'DROP TABLE IF EXISTS "{table_name}"')
 
+    async def test_load_data_partitioned(self, sync_engine):
+        table_name = "test-table" + str(uuid.uuid4())
+        await aexecute(
+            sync_engine,
+            f'CREATE TABLE "{table_name}" (fruit_id SERIAL PRIMARY KEY, fruit_name VARCHAR(100))',
+        )
+        await aexecute(
+            sync_engine,
+            f"""INSERT INTO "{table_name}" (fruit_name)
+            SELECT 'fruit_' || i FROM generate_series(1, 20) AS i""",
+        )
+
+        reader = AlloyDBReader.create_sync(
+            engine=sync_engine,
+            table_name=table_name,
+            content_columns=["fruit_name"],
+            partitions=2,
+            partition_column="fruit_id",
+        )
+        documents = reader.load_data()
+
+        assert [doc.text for doc in documents] == [f"fruit_{i}" for i in range(1, 21)]
+
+        await aexecute(sync_engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
+    async def test_lazy_load_batches(self, sync_engine):
+        table_name = "test-table" + str(uuid.uuid4())
+        await aexecute(
+            sync_engine,
+            f'CREATE TABLE "{table_name}" (fruit_id SERIAL PRIMARY KEY, fruit_name VARCHAR(100))',
+        )
+        await aexecute(
+            sync_engine,
+            f"""INSERT INTO "{table_name}" (fruit_name)
+            SELECT 'fruit_' || i FROM generate_series(1, 5) AS i""",
+        )
+
+        reader = AlloyDBReader.create_sync(
+            engine=sync_engine,
+            query=f'SELECT * FROM "{table_name}" ORDER BY fruit_id',
+            content_columns=["fruit_name"],
+            fetch_size=3,
+        )
+        batches = list(reader.lazy_load_batches())
+
+        assert [len(batch) for batch in batches] == [3, 2]
+        assert batches[1][1].text == "fruit_5"
+
+        await aexecute(sync_engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
     async def test_load_from_query_customized_content_customized_metadata(
         self, sync_engine
     ):
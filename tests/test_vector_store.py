@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import uuid
 from typing import Sequence
@@ -216,6 +217,37 @@ class TestVectorStoreAsync:
         results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
         assert len(results) == 5
 
+    async def test_add_bulk(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        result = vs.add_bulk(nodes, chunk_size=2)
+
+        assert result.rows == 5
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 5
+
+    async def test_async_add_bulk_async_iterable(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        # Bound to the caller's loop, so it must not be consumed elsewhere.
+        lock = asyncio.Lock()
+
+        async def stream():
+            for node in nodes:
+                async with lock:
+                    yield node
+
+        result = await vs.async_add_bulk(stream(), chunk_size=2)
+
+        assert result.rows == 5
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 5
+
+    async def test_add_bulk_async_iterable(self, vs):
+        async def stream():
+            yield nodes[0]
+
+        with pytest.raises(ValueError):
+            vs.add_bulk(stream())
+
     async def test_delete(self, engine, vs):
         # Note: To be migrated to a pytest dependency on test_async_add
         # Blocked due to unexpected fixtures reloads while running integration test suite
@@ -596,6 +628,14 @@ class TestVectorStoreSync:
         results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
         assert len(results) == 5
 
+    async def test_add_bulk(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        result = vs.add_bulk(nodes, chunk_size=2)
+
+        assert result.rows == 5
+        results = await afetch(engine, f'SELECT * FROM "{DEFAULT_TABLE}"')
+        assert len(results) == 5
+
     async def test_delete(self, engine, vs):
         # Note: To be migrated to a pytest dependency on test_async_add
         # Blocked due to unexpected fixtures reloads while running integration test suite
@@ -820,6 +860,23 @@ class TestVectorStoreSync:
         assert len(results.nodes) == 3
         assert results.nodes[0].get_content(metadata_mode=MetadataMode.NONE) == "foo"
 
+    async def test_query_batch(self, engine, vs):
+        await aexecute(engine, f'TRUNCATE TABLE "{DEFAULT_TABLE}"')
+        vs.add(nodes)
+        queries = [
+            VectorStoreQuery(query_embedding=[1.0] * VECTOR_SIZE, similarity_top_k=2),
+            VectorStoreQuery(
+                query_embedding=[1.0] * VECTOR_SIZE,
+                node_ids=[nodes[3].node_id],
+                similarity_top_k=2,
+            ),
+        ]
+        results = vs.query_batch(queries)
+
+        assert len(results) == 2
+        assert len(results[0].nodes) == 2
+        assert results[1].ids == [nodes[3].node_id]
+
     async def test_aclear(self, engine, vs):
         # Note: To be migrated to a pytest dependency on test_adelete
         # Blocked due to unexpected fixtures reloads while running integration test suite